@@ -1,11 +1,22 @@
 import control as ctrl
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.montecarlo import monte_carlo, rlc_coefs, sample_parameters
 
 R = 50.0
 L = 10e-3
 C = 10e-6
 
+# modo Monte Carlo: R, L e C sorteados dentro das tolerâncias dos componentes
+MONTE_CARLO = False
+MC_REALIZACOES = 100_000
+MC_TOLERANCIAS = (0.05, 0.10, 0.10)  # R, L, C (relativas)
+MC_DISTRIBUICAO = "uniform"          # "uniform" (±tol) ou "normal" (tol = 3σ)
+
 num = [1.0]
 den = [L * C, R * C, 1.0]
 
@@ -40,4 +51,40 @@ plt.title('Resposta ao Degrau Unitário — $V_C(s)/V_{in}(s)$')
 plt.grid(True)
 plt.legend(loc='best')
 
-plt.show()
\ No newline at end of file
+plt.show()
+
+if MONTE_CARLO:
+    amostras = sample_parameters([R, L, C], MC_TOLERANCIAS, MC_REALIZACOES, dist=MC_DISTRIBUICAO)
+    mc = monte_carlo(*rlc_coefs(*amostras.T), t)
+    niveis = (5, 50, 95)
+
+    print(f"\nMonte Carlo: {MC_REALIZACOES} realizações, tolerâncias R/L/C = "
+          + "/".join(f"{100 * tol:.0f}%" for tol in MC_TOLERANCIAS))
+    print(f"{'grandeza':>12s}" + "".join(f"{f'P{p}':>12s}" for p in niveis))
+    for nome, valores in (("ω0 [rad/s]", mc.wn), ("ζ", mc.zeta),
+                          ("Ts [ms]", 1e3 * mc.metrics["Ts"]), ("Mp [%]", mc.metrics["Mp"])):
+        print(f"{nome:>12s}" + "".join(f"{v:12.4f}" for v in mc.percentiles(valores, niveis)))
+    print(f"Realizações sem acomodar no horizonte: {np.isnan(mc.metrics['Ts']).sum()}")
+
+    nivel = dict(zip(mc.levels, mc.envelope))
+    plt.figure(figsize=(9, 5))
+    plt.fill_between(t, nivel[5.0], nivel[95.0], alpha=0.25, label='P5–P95')
+    plt.fill_between(t, nivel[25.0], nivel[75.0], alpha=0.4, label='P25–P75')
+    plt.plot(t, nivel[50.0], linewidth=1.4, label='mediana')
+    plt.plot(t_out, vC, 'k--', linewidth=1.0, label='nominal')
+    plt.xlabel('Tempo [s]')
+    plt.ylabel('Tensão $v_C(t)$ [V]')
+    plt.title('Envelope Monte Carlo de $v_C(t)$ — tolerâncias de R, L e C')
+    plt.grid(True)
+    plt.legend(loc='best')
+
+    fig, (ax_ts, ax_mp) = plt.subplots(1, 2, figsize=(10, 4))
+    ax_ts.hist(1e3 * mc.metrics["Ts"][np.isfinite(mc.metrics["Ts"])], bins=60)
+    ax_ts.set_xlabel('Tempo de acomodação (2%) [ms]')
+    ax_mp.hist(mc.metrics["Mp"], bins=60)
+    ax_mp.set_xlabel('Sobressinal [%]')
+    for ax in (ax_ts, ax_mp):
+        ax.set_ylabel('Realizações')
+        ax.grid(True)
+    fig.tight_layout()
+    plt.show()
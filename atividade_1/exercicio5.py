@@ -1,6 +1,10 @@
-import control as ctrl
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.second_order import rlc_params, second_order_step
 
 L = 10e-3
 C = 10e-6
@@ -22,17 +26,16 @@ T0 = 2 * np.pi / omega0
 t_end = max(5 * T0, 0.02)
 t = np.linspace(0.0, t_end, 2000)
 
+# G(s) = 1/(LC s^2 + RC s + 1): segunda ordem padrão com ω0 e ζ de cada R;
+# as três respostas saem de uma única avaliação analítica
+omegas, zetas = rlc_params(np.array(Rs), L, C)
+ys = second_order_step(omegas, zetas, t)
+
 plt.figure(figsize=(8,4.5))
 
-for R, lab, st in zip(Rs, labels, styles):
-    num = [1.0]
-    den = [L * C, R * C, 1.0]
-    G = ctrl.TransferFunction(num, den)
-    t_out, y = ctrl.step_response(G, T=t)
-    # calcular zeta para informação
-    zeta = (R / 2.0) * np.sqrt(C / L)
+for R, zeta, y, lab, st in zip(Rs, zetas, ys, labels, styles):
     print(f"R = {R:.6f} Ω  |  ζ = {zeta:.6f}")
-    plt.plot(t_out, y, st, label=lab, linewidth=1.6)
+    plt.plot(t, y, st, label=lab, linewidth=1.6)
 
 plt.xlabel('Tempo [s]')
 plt.ylabel('v_C(t) [V] (entrada degrau unitário)')
@@ -1,16 +1,24 @@
 import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.polezero import analyze, family
+from ltc.stages import pipeline
+
+# estágios reaproveitados entre execuções enquanto a_list e t não mudam
+stages = pipeline(__file__)
 
 a_list = [0.01, 0.02, 0.05, 0.1, 0.5, 1.0, 2.0]
 
+# polos de s^2 + a s + 0 para todos os valores de a de uma vez
+analise = stages.run("polos", analyze, family(1.0, a_list, 0.0))
+
 # --- figura 1: polos ---
 plt.figure(figsize=(6.5,5))
-for a in a_list:
-    num = [1.0]
-    den = [1.0, a, 0.0] # s^2 + a s + 0
-    G = ctrl.TransferFunction(num, den)
-    poles = ctrl.poles(G)
+for a, poles in zip(a_list, analise.poles):
     plt.plot(poles.real, poles.imag, 'o', label=f'a={a}')
     print(f"a = {a:>4}  -> polos: {', '.join([f'{p:.6g}' for p in poles])}")
 plt.axhline(0, color='k', linewidth=0.6)
@@ -29,12 +37,17 @@ plt.figure(figsize=(8,5))
 t_end = 2.0
 t = np.linspace(0.0, t_end, 2000)
 
-for a in a_list:
-    num = [1.0]
-    den = [1.0, a, 0.0]
-    G = ctrl.TransferFunction(num, den)
-    t_out, y = ctrl.step_response(G, T=t)
+def step_family(a_list, t):
+    out = []
+    for a in a_list:
+        num = [1.0]
+        den = [1.0, a, 0.0]
+        G = ctrl.TransferFunction(num, den)
+        t_out, y = ctrl.step_response(G, T=t)
+        out.append((np.asarray(t_out), np.asarray(y)))  # arrays simples (pickle)
+    return out
 
+for a, (t_out, y) in zip(a_list, stages.run("respostas", step_family, a_list, t)):
     idx1, idx0 = -1, -11
     slope_est = (y[idx1] - y[idx0]) / (t_out[idx1] - t_out[idx0])
 
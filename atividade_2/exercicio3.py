@@ -1,27 +1,31 @@
-import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.polezero import CRITICAL, OVER, UNDER, analyze, family
+from ltc.second_order import second_order_step
+from ltc.stages import pipeline
+
+# estágios reaproveitados entre execuções enquanto a_list e t não mudam
+stages = pipeline(__file__)
 
 a_list = [0.01, 0.02, 0.05, 0.1, 0.5, 1.0, 2.0]
 
+# malha fechada T(s) = 1 / (s^2 + a s + 1): polos, ζ e regime de todos os a
+analise = stages.run("polos", analyze, family(1.0, a_list, 1.0))
+descricao = {
+    UNDER: "subamortecido (polos complexos)",
+    CRITICAL: "critic. amortecido (polos reais iguais)",
+    OVER: "superamortecido (polos reais distintos)",
+}
+
 # ---- FIGURA 1: polos da malha fechada ----
 plt.figure(figsize=(7,6))
-for a in a_list:
-    # malha fechada T(s) = 1 / (s^2 + a s + 1)
-    num = [1.0]
-    den = [1.0, a, 1.0]
-    T = ctrl.TransferFunction(num, den)
-
-    poles = ctrl.poles(T)
-    zeta = a / 2.0
-
-    disc = a*a - 4.0
-    if disc < 0:
-        cls = "subamortecido (polos complexos)"
-    elif np.isclose(disc, 0.0):
-        cls = "critic. amortecido (polos reais iguais)"
-    else:
-        cls = "superamortecido (polos reais distintos)"
+for a, poles, zetas, regime in zip(a_list, analise.poles, analise.zeta, analise.regime):
+    zeta = zetas[0]  # ζ = a/2 (os dois polos têm o mesmo ζ)
+    cls = descricao[regime]
 
     print(f"a = {a:>4} | zeta = {zeta:.6g} | {cls} | polos: {', '.join([f'{p:.6g}' for p in poles])}")
 
@@ -43,13 +47,11 @@ plt.figure(figsize=(8,5))
 t_end = 50.0
 t = np.linspace(0.0, t_end, 3000)
 
-for a in a_list:
-    num = [1.0]
-    den = [1.0, a, 1.0]
-    T = ctrl.TransferFunction(num, den)
-    t_out, y = ctrl.step_response(T, T=t)
+# T(s) = 1/(s^2 + a s + 1): ω_n = 1 e ζ = a/2, todas as respostas de uma vez
+ys = stages.run("respostas", second_order_step, 1.0, np.array(a_list) / 2.0, t)
 
-    plt.plot(t_out, y, label=f'a={a}')
+for a, y in zip(a_list, ys):
+    plt.plot(t, y, label=f'a={a}')
 
 plt.xlabel('Tempo [s]')
 plt.ylabel('Resposta ao degrau y(t)')
@@ -1,5 +1,10 @@
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import first_persistent_time
 
 R = 560e3
 C = 10e-6
@@ -20,18 +25,6 @@ vc = V0 * (1 - np.exp(-t / tau))
 p95 = 0.95 * V0
 p982 = 0.982 * V0  # 98.2%
 
-# função para encontrar o primeiro tempo em que o sinal permanece dentro de uma faixa
-def first_persistent_time(signal, time, low, high):
-    # índices onde sinal está dentro da faixa
-    idxs = np.where((signal >= low) & (signal <= high))[0]
-    if idxs.size == 0:
-        return None
-    # testar cada candidato
-    for idx in idxs:
-        if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-            return time[idx]
-    return None
-
 # encontrar tempos "práticos" usando np.where + persistência
 t95_sim = first_persistent_time(vc, t, p95, V0 * 1.05)   # faixa 95%
 t982_sim = first_persistent_time(vc, t, p982, V0 * 1.02)  # faixa 98.2%
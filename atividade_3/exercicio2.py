@@ -1,6 +1,11 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import first_persistent_time
 
 # definição dos sistemas
 sistemas = [
@@ -18,17 +23,6 @@ t = np.linspace(0, t_final, n_points)
 def resposta(K, tau, t):
     return K * (1 - np.exp(-t / tau))
 
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, final_value, tol=0.02):
-    low, high = final_value * (1 - tol), final_value * (1 + tol)
-    idxs = np.where((signal >= low) & (signal <= high))[0]
-    if idxs.size == 0:
-        return None
-    for idx in idxs:
-        if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-            return time[idx]
-    return None
-
 resultados = []
 
 # loop nos sistemas
@@ -44,7 +38,7 @@ for sistema in sistemas:
     ts_teo = 4 * tau
 
     # tempo visual (faixa de 2%)
-    ts_vis = first_persistent_time(y, t, y_final, tol=0.018)
+    ts_vis = first_persistent_time(y, t, y_final * (1 - 0.018), y_final * (1 + 0.018))
 
     resultados.append([nome, K, tau, ts_teo, ts_vis])
 
@@ -1,6 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import settling_index, step_metrics
+from ltc.second_order import second_order_step
+from ltc.timegrid import auto_grid, refine
 
 sistemas = [
     {"nome": "G1(s)", "wn": 5.0,  "zeta": 0.4},
@@ -9,70 +16,52 @@ sistemas = [
     {"nome": "G4(s)", "wn":10.0,  "zeta": 0.05},
 ]
 
-# simulação
-n_points = 20001
-
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, low, high):
-    idxs = np.where((signal >= low) & (signal <= high))[0]
-    if idxs.size == 0:
-        return None
-    for idx in idxs:
-        if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-            return time[idx]
-    return None
+# simulação: passo em torno da acomodação (o mais fino das antigas grades
+# de 20001 pontos)
+resolucao = 5e-4   # s
 
 # limite visual: inferior 98,2% e teto 102%
 visual_low_pct = 0.982
 visual_high_pct = 1.02
+low = visual_low_pct * 1.0
+high = visual_high_pct * 1.0
+
+wn = np.array([float(s["wn"]) for s in sistemas])
+zeta = np.array([float(s["zeta"]) for s in sistemas])
+
+# tempo teórico
+with np.errstate(divide="ignore"):
+    ts_teos = np.where(zeta == 0, np.nan, 4.0 / (zeta * wn))
+
+# grade por sistema a partir dos polos de s² + 2ζωn s + ωn²: horizonte pelo
+# polo dominante, passo pelo decaimento e pela oscilação; uma segunda
+# passada reamostra a última saída da faixa
+def grade(wn, zeta):
+    t = auto_grid([1.0, 2.0 * zeta * wn, wn**2])
+    i_ts = int(settling_index(second_order_step(wn, zeta, t)[0], low, high))
+    return refine(t, [(t[i_ts - 1], t[i_ts])] if i_ts > 0 else [], resolucao)
+
+# grades de tamanhos diferentes completadas com o último instante (amostras
+# repetidas na cauda acomodada não mudam as métricas)
+grades = [grade(w, z) for w, z in zip(wn, zeta)]
+n_max = max(g.size for g in grades)
+tempos = np.array([np.pad(g, (0, n_max - g.size), mode="edge") for g in grades])
+
+# respostas ao degrau unitário (regime escolhido por sistema)
+respostas = second_order_step(wn, zeta, tempos)
+
+# tempo visual de todos os sistemas numa única chamada; se não acomodar,
+# primeiro instante que excede o limite inferior
+metricas = step_metrics(respostas, tempos,
+                        band=(visual_low_pct, visual_high_pct), target=1.0, fallback=True)
 
 resultados = []
 
-# loop nos sistemas
-for s in sistemas:
+for s, t, y, ts_teo, m in zip(sistemas, tempos, respostas, ts_teos, metricas):
     nome = s["nome"]
-    wn = float(s["wn"])
-    zeta = float(s["zeta"])
+    ts_vis = float(m["Ts"]) if np.isfinite(m["Ts"]) else None
 
-    # tempo teórico
-    if zeta == 0:
-        ts_teo = np.nan
-    else:
-        ts_teo = 4.0 / (zeta * wn)
-
-    # escolher janela de tempo baseada em ts_teo e wn
-    if np.isfinite(ts_teo):
-        t_final = max(6.0 * ts_teo, 8.0 / wn, 10.0)
-    else:
-        t_final = max(8.0 / wn, 10.0)
-    t = np.linspace(0, t_final, n_points)
-
-    # resposta ao degrau unitário
-    if zeta < 1.0 - 1e-8:  # subamortecido
-        wd = wn * np.sqrt(1.0 - zeta**2)
-        phi = np.arccos(zeta)
-        y = 1.0 - (1.0 / np.sqrt(1.0 - zeta**2)) * np.exp(-zeta * wn * t) * np.sin(wd * t + phi)
-    elif abs(zeta - 1.0) <= 1e-8:  # criticamente amortecido
-        y = 1.0 - np.exp(-wn * t) * (1.0 + wn * t)
-    else:  # sobreamortecido
-        s1 = -wn * (zeta - np.sqrt(zeta**2 - 1.0))
-        s2 = -wn * (zeta + np.sqrt(zeta**2 - 1.0))
-        A = s2 / (s2 - s1)
-        B = -s1 / (s2 - s1)
-        y = 1.0 - (A * np.exp(s1 * t) + B * np.exp(s2 * t))
-
-    # limites visuais
-    low = visual_low_pct * 1.0
-    high = visual_high_pct * 1.0
-
-    # tempo visual
-    ts_vis = first_persistent_time(y, t, low, high)
-    # primeiro instante que excede o limite inferior
-    if ts_vis is None:
-        idx = np.where(y >= low)[0]
-        ts_vis = float(t[idx[0]]) if idx.size else None
-
-    resultados.append([nome, wn, zeta, ts_teo, ts_vis])
+    resultados.append([nome, float(s["wn"]), float(s["zeta"]), float(ts_teo), ts_vis])
 
     plt.figure(figsize=(9,5))
     plt.plot(t, y, label=f"{nome} (resposta)", linewidth=2)
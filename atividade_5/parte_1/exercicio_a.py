@@ -1,20 +1,25 @@
 import numpy as np
 import matplotlib.pyplot as plt
-import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.tracking import REFERENCES, error_constants, tracking
 
 # G(s) = 1/(3 s)
-G = ctrl.tf([1], [3, 0])
+num, den = [1], [3, 0]
 
 t = np.linspace(0, 30, 1000)
 
-# resposta ao degrau unitário
-t_out, y_num = ctrl.step_response(G, T=t)
+# resposta ao degrau unitário (malha aberta)
+t_out = t
+y_num = tracking(num, den, t, ["step"], feedback=False).y[0, 0]
 
 # y(t) = t/3
 y_analytic = t_out / 3.0
 
 plt.figure(figsize=(9, 5))
-plt.plot(t_out, y_num, label='Resposta (control.step_response)')
+plt.plot(t_out, y_num, label='Resposta numérica')
 plt.plot(t_out, y_analytic, '--', label=r'Resposta analítica $y(t)=t/3$')
 plt.xlabel('Tempo (s)')
 plt.ylabel('Saída $y(t)$')
@@ -36,3 +41,26 @@ print("\nObservação:")
 print("- A saída cresce linearmente (rampa) com inclinação 1/3: y(t)=t/3.")
 print("- Em malha aberta, para entrada degrau unitário, y(t) -> infinito quando t -> infinito;")
 print("  portanto o 'erro em regime estacionário' no sentido usual (lim t->inf e(t)) não é finito/definido.")
+
+# Erro em regime com realimentação unitária: degrau, rampa e parábola de uma vez
+ec = error_constants(num, den)
+malha = tracking(num, den, t, REFERENCES)
+nomes = {"step": "degrau", "ramp": "rampa", "parabola": "parábola"}
+
+print(f"\nMalha fechada unitária T(s) = G/(1+G): sistema tipo {ec.type[0]}")
+print(f"Kp = {ec.Kp[0]:.4g}, Kv = {ec.Kv[0]:.4g}, Ka = {ec.Ka[0]:.4g}")
+print(f"{'referência':>10s} {'e_ss (teórico)':>15s} {'e(t_final) (numérico)':>22s}")
+for ref, e_teo, e_num in zip(REFERENCES, ec.ess[0], malha.final[0]):
+    print(f"{nomes[ref]:>10s} {e_teo:15.6f} {e_num:22.6f}")
+
+plt.figure(figsize=(9, 5))
+for ref, e in zip(REFERENCES, malha.e[0]):
+    plt.plot(t, e, label=f'Erro — {nomes[ref]}')
+plt.xlabel('Tempo (s)')
+plt.ylabel('Erro $e(t) = r(t) - y(t)$')
+plt.title('Erro de seguimento — malha fechada unitária com $G(s)=1/(3s)$')
+plt.grid(True)
+plt.legend()
+plt.xlim(0, 30)
+plt.tight_layout()
+plt.show()
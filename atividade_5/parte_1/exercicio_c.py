@@ -1,22 +1,27 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.cache import default_cache
+from ltc.sweep import gain_sweep
 
 # G(s) = 1/(3 s)
-G = ctrl.tf([1], [3, 0])
+num, den = [1], [3, 0]
+G = ctrl.tf(num, den)
 
 t = np.linspace(0, 30, 1000)
 
 # ganhos a serem testados
 Ks = [1, 10]
 
-for K in Ks:
-    # sistema em malha fechada com ganho K
-    K_tf = ctrl.tf([K], [1])
-    T_closed = ctrl.feedback(G, K_tf)
+# malhas fechadas T = G/(1 + K G) de todos os ganhos, simuladas uma única vez
+sweep = gain_sweep(num, den, Ks, t, topology="feedback", cache=default_cache())
 
-    # resposta ao degrau unitário
-    t_out, y = ctrl.step_response(T_closed, T=t)
+for K, y in zip(Ks, sweep.y):
+    t_out = sweep.t
 
     # valor teórico de regime estacionário
     y_ss_teo = 1.0 / K
@@ -46,12 +51,9 @@ for K in Ks:
 
 # Figura comparativa (caso (c): ganho K no feedback)
 plt.figure(figsize=(8, 4.8))
-for K in Ks:
-    K_tf = ctrl.tf([K], [1])
-    T_closed = ctrl.feedback(G, K_tf)
-    t_out, y = ctrl.step_response(T_closed, T=t)
+for K, y in zip(Ks, sweep.y):
     y_ss = 1.0 / K
-    plt.plot(t_out, y, label=f"K={K} (y_ss={y_ss:.2f})")
+    plt.plot(sweep.t, y, label=f"K={K} (y_ss={y_ss:.2f})")
     plt.axhline(y_ss, linestyle='--', linewidth=0.8, color='gray')
 
 plt.xlabel("Tempo (s)")
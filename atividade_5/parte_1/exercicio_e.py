@@ -1,9 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.cache import default_cache
+from ltc.sweep import gain_sweep
 
 # G(s) = 1/(3 s)
-G = ctrl.tf([1], [3, 0])
+num, den = [1], [3, 0]
+G = ctrl.tf(num, den)
 
 t = np.linspace(0, 30, 1000)
 
@@ -12,15 +19,11 @@ Ks = [1, 10]
 
 resultados = []
 
-for K in Ks:
-	# ganho no ramo direto
-	Gd = ctrl.series(ctrl.tf([K], [1]), G)
-	T_closed = ctrl.feedback(Gd, 1)
- 
-	polos = ctrl.poles(T_closed)
+# ganho no ramo direto: T = K G/(1 + K G) de todos os ganhos, uma única vez
+sweep = gain_sweep(num, den, Ks, t, topology="forward", cache=default_cache())
 
-	# resposta ao degrau unitário
-	t_out, y = ctrl.step_response(T_closed, T=t)
+for K, y, polos in zip(Ks, sweep.y, sweep.poles):
+	t_out = sweep.t
 
 	# valor teórico de regime estacionário
 	y_ss_teo = 1.0
@@ -36,6 +39,7 @@ for K in Ks:
 
 	resultados.append({
 		'K': K,
+		'y': y,
 		'polos': polos,
 		'y_final_num': y_final_num,
 		'y_ss_teo': y_ss_teo,
@@ -67,11 +71,7 @@ for K in Ks:
 # figura comparativa
 plt.figure(figsize=(8, 4.8))
 for r in resultados:
-	K = r['K']
-	Gd = ctrl.series(ctrl.tf([K], [1]), G)
-	T_closed = ctrl.feedback(Gd, 1)
-	t_out, y = ctrl.step_response(T_closed, T=t)
-	plt.plot(t_out, y, label=f"K={K}")
+	plt.plot(sweep.t, r['y'], label=f"K={r['K']}")
 
 plt.axhline(1.0, linestyle='--', color='black', linewidth=1, label='y_ss = 1')
 plt.xlabel("Tempo (s)")
@@ -1,20 +1,22 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.polezero import analyze
 
 # Definição do sistema G(s) = 1 / (s^2 + 1.2 s + 9)
 num = [1.0]
 den = [1.0, 1.2, 9.0]
 G = ctrl.tf(num, den)
 
-# parâmetros do sistema de segunda ordem (a partir dos coeficientes)
-a1 = den[1]   # 1.2
-a0 = den[2]   # 9.0
-omega_n = np.sqrt(a0)
-zeta = a1 / (2 * omega_n)
-
-# polos
-polos = ctrl.poles(G)
+# polos e parâmetros de segunda ordem (ω_n = |p|, ζ = -Re(p)/|p|)
+analise = analyze(den)
+polos = analise.poles[0]
+omega_n = analise.wn[0, 0]
+zeta = analise.zeta[0, 0]
 
 # vetor de tempo (ajuste se quiser intervalo maior/menor)
 t = np.linspace(0, 10, 1000)
@@ -1,27 +1,31 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.cache import default_cache
+from ltc.polezero import damping
+from ltc.sweep import gain_sweep
 
 # sistema em malha aberta
-G = ctrl.tf([1.0], [1.0, 1.2, 9.0])
+num, den = [1.0], [1.0, 1.2, 9.0]
+G = ctrl.tf(num, den)
 
 t = np.linspace(0, 10, 1000)
 
 # ganhos a simular
 Ks = [1, 10]
 
-for K in Ks:
-    # T = G/(1 + K*G)
-    K_tf = ctrl.tf([K], [1])
-    T_closed = ctrl.feedback(G, K_tf)
+# T = G/(1 + K*G): respostas e polos de todos os ganhos numa única varredura
+sweep = gain_sweep(num, den, Ks, t, topology="feedback", cache=default_cache())
 
-    # resposta ao degrau unitário
-    t_out, y = ctrl.step_response(T_closed, T=t)
+for K, y, polos in zip(Ks, sweep.y, sweep.poles):
+    t_out = sweep.t
 
-    # polos, parâmetros teóricos
-    polos = ctrl.poles(T_closed)
-    wn = np.sqrt(9.0 + K)
-    zeta = 1.2 / (2.0 * wn)
+    # ω_n e ζ a partir dos polos (= sqrt(9 + K) e 1.2 / (2 ω_n))
+    wn, zeta = (float(v[0]) for v in damping(polos))
 
     # valores em regime
     y_ss_teo = 1.0 / (9.0 + K)
@@ -1,6 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import control as ctrl
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # raiz do repositório
+from ltc.cache import default_cache
+from ltc.polezero import damping
+from ltc.sweep import gain_sweep
 
 """
 Exercício (i): Considere agora os MESMOS ganhos do item (g), porém aplicados NO RAMO DIRETO.
@@ -34,25 +41,25 @@ Comparação importante:
 """
 
 # Planta
-G = ctrl.tf([1.0], [1.0, 1.2, 9.0])
+num, den = [1.0], [1.0, 1.2, 9.0]
+G = ctrl.tf(num, den)
 
 t = np.linspace(0, 10, 1000)
 Ks = [1, 10]
 
-resultados = []
+# as duas famílias de malha fechada são simuladas uma única vez e reutilizadas
+# nas figuras individuais e comparativas; o cache em disco (compartilhado com o
+# item (g)) evita simular de novo ao regenerar as figuras
+sweep_i = gain_sweep(num, den, Ks, t, topology="forward", cache=default_cache())   # K G /(1 + K G)
+sweep_g = gain_sweep(num, den, Ks, t, topology="feedback", cache=default_cache())  # G /(1 + K G)
 
-for K in Ks:
-	# ganho no ramo direto: série K * G(s)
-	Gd = ctrl.series(ctrl.tf([K], [1]), G)  # K*G(s)
-	T_closed = ctrl.feedback(Gd, 1)         # K G /(1 + K G)
+resultados = []
 
-	# resposta degrau
-	t_out, y = ctrl.step_response(T_closed, T=t)
+for K, y, polos in zip(Ks, sweep_i.y, sweep_i.poles):
+	t_out = sweep_i.t
 
-	# polos, parâmetros teóricos
-	polos = ctrl.poles(T_closed)
-	wn = np.sqrt(9.0 + K)
-	zeta = 1.2 / (2.0 * wn)
+	# ω_n e ζ a partir dos polos (= sqrt(9 + K) e 1.2 / (2 ω_n))
+	wn, zeta = (float(v[0]) for v in damping(polos))
 	y_ss_teo = K / (9.0 + K)
 	y_ss_num = float(y[-1])
 	e_ss_num = 1.0 - y_ss_num
@@ -82,6 +89,7 @@ for K in Ks:
 
 	resultados.append({
 		'K': K,
+		'y': y,
 		'polos': polos,
 		'wn': wn,
 		'zeta': zeta,
@@ -93,11 +101,7 @@ for K in Ks:
 # Figura comparativa das respostas (ganho direto)
 plt.figure(figsize=(8, 4.8))
 for r in resultados:
-	K = r['K']
-	Gd = ctrl.series(ctrl.tf([K], [1]), G)
-	T_closed = ctrl.feedback(Gd, 1)
-	t_out, y = ctrl.step_response(T_closed, T=t)
-	plt.plot(t_out, y, label=f"K={K} (y_ss={r['y_ss_teo']:.2f})")
+	plt.plot(sweep_i.t, r['y'], label=f"K={r['K']} (y_ss={r['y_ss_teo']:.2f})")
 
 plt.xlabel("Tempo (s)")
 plt.ylabel("Saída y(t)")
@@ -110,14 +114,10 @@ plt.close()
 print("Gravado: comparacao_respostas_ganho_direto.png")
 
 # (Opcional) Comparação direta com caso (g) para o mesmo K
-for K in Ks:
-	# Caso (g): ganho na realimentação => T_g = G/(1 + K G)
-	K_tf = ctrl.tf([K], [1])
-	T_g = ctrl.feedback(G, K_tf)
-	# Caso (i): ganho direto => T_i = K G /(1 + K G)
-	T_i = ctrl.feedback(K * G, 1)
-	t_out, y_g = ctrl.step_response(T_g, T=t)
-	_, y_i = ctrl.step_response(T_i, T=t)
+# Caso (g): ganho na realimentação => T_g = G/(1 + K G)
+# Caso (i): ganho direto => T_i = K G /(1 + K G)
+for K, y_g, y_i in zip(Ks, sweep_g.y, sweep_i.y):
+	t_out = sweep_g.t
 
 	plt.figure(figsize=(8, 4.8))
 	plt.plot(t_out, y_g, label=f"Caso (g) y_g (y_ss={1/(9+K):.2f})")
@@ -1,5 +1,16 @@
 import control as ctrl
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.lti import LTIBatch
+from ltc.plots import plot_root_locus
+from ltc.rootlocus import root_loci
+from ltc.stages import pipeline
+
+# estágios reaproveitados entre execuções enquanto os sistemas não mudam
+stages = pipeline(__file__)
 
 # sistema 1
 num = [1, 10]  # s + 10
@@ -19,17 +30,20 @@ den4 = [1, 5, 20, 16, 0] # s^4 + 5 s^3 + 20 s^2 + 16 s
 num5 = [1, 2, 4] # s^2 + 2 s + 4
 den5 = [1, 11.4, 39, 43.6, 24, 0] # s^5 + 11.4 s^4 + 39 s^3 + 43.6 s^2 + 24 s
 
-# funções de transferência
-G1 = ctrl.TransferFunction(num, den)
-G2 = ctrl.TransferFunction(num2, den2)
-G3 = ctrl.TransferFunction(num3, den3)
-G4 = ctrl.TransferFunction(num4, den4)
-G5 = ctrl.TransferFunction(num5, den5)
+# os 5 sistemas num único lote de coeficientes
+sistemas = LTIBatch.from_pairs([(num, den), (num2, den2), (num3, den3),
+                                (num4, den4), (num5, den5)])
+
+# funções de transferência (para exibição)
+G1, G2, G3, G4, G5 = sistemas.to_ctrl()
+
+# lugar das raízes dos 5 sistemas numa única chamada em lote
+L1, L2, L3, L4, L5 = stages.run("lugares", root_loci, sistemas.pairs())
 
 # plot sistema 1
 print("Funcao de transferencia G1(s):")
 print(G1)
-ctrl.rlocus(G1)
+plot_root_locus(L1)
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 1")
 plt.show()
@@ -37,7 +51,7 @@ plt.show()
 # plot sistema 2
 print("Funcao de transferencia G2(s):")
 print(G2)
-ctrl.rlocus(G2)
+plot_root_locus(L2)
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 2")
 plt.show()
@@ -45,7 +59,7 @@ plt.show()
 # plot sistema 3
 print("Funcao de transferencia G3(s):")
 print(G3)
-ctrl.rlocus(G3)
+plot_root_locus(L3)
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 3")
 plt.show()
@@ -53,7 +67,7 @@ plt.show()
 # plot sistema 4
 print("Funcao de transferencia G4(s):")
 print(G4)
-ctrl.rlocus(G4)
+plot_root_locus(L4)
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 4")
 plt.show()
@@ -61,7 +75,7 @@ plt.show()
 # plot sistema 5
 print("Funcao de transferencia G5(s):")
 print(G5)
-ctrl.rlocus(G5)
+plot_root_locus(L5)
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 5")
 plt.show()
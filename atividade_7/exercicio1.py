@@ -1,5 +1,11 @@
 import control as ctrl
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.plots import plot_root_locus
+from ltc.rootlocus import root_locus
 
 # numerador e denominador
 num = [1] # 1
@@ -13,7 +19,7 @@ print(G)
 # plot
 print("Funcao de transferencia G(s):")
 print(G)
-ctrl.rlocus(G)
+plot_root_locus(root_locus(num, den))
 plt.grid(True)
 plt.title("Lugar das Raizes - Sistema 1")
 plt.show()
@@ -1,6 +1,16 @@
 import control as ctrl
 import matplotlib.pyplot as plt
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import oscillation
+from ltc.stages import pipeline
+from ltc.tuning import ultimate_gain
+
+# Kcr/Pcr e a resposta em Kcr reaproveitados enquanto planta e t não mudam
+stages = pipeline(__file__)
 
 # numerador e denominador
 num = [1] # 1
@@ -11,40 +21,43 @@ G = ctrl.TransferFunction(num, den)
 print("Função de transferência G(s):")
 print(G)
 
-# ganho crítico
-Kcr = 30
+# ganho e período críticos pelos cruzamentos do eixo jω de s^3 + 6 s^2 + 5 s + K
+Kcr, Pcr_teo = stages.run("critico", ultimate_gain, num, den)
+print(f"Kcr (analítico) = {Kcr:.6f}")
+print(f"Pcr (analítico) = {Pcr_teo:.6f} s")
 
-# função de transferência
-Gcl = ctrl.feedback(Kcr * G, 1)
+# simulação da resposta ao degrau da malha com ganho K
+def closed_loop_step(num, den, K, t):
+	G = ctrl.TransferFunction(num, den)
+	Gcl = ctrl.feedback(K * G, 1)
+	t_out, y_out = ctrl.step_response(Gcl, T=t)
+	return np.asarray(t_out), np.asarray(y_out)  # arrays simples (pickle)
 
-# simulação da resposta ao degrau
 t_final = 60.0
 t = np.linspace(0, t_final, 5000)
-t_out, y_out = ctrl.step_response(Gcl, T=t)
+t_out, y_out = stages.run("resposta", closed_loop_step, num, den, Kcr, t)
 
 # plot da resposta ao degrau
 plt.figure(figsize=(10,4))
 plt.plot(t_out, y_out, label='Resposta')
 plt.xlabel('Tempo (s)')
 plt.ylabel('Saída')
-plt.title('Resposta ao degrau em malha fechada com K = 30')
+plt.title(f'Resposta ao degrau em malha fechada com K = {Kcr:.2f}')
 plt.grid(True)
 
 
-# detectar picos e calcular tempo entre os dois primeiros
-peaks_idx = []
-for i in range(1, len(y_out) - 1):
-	if y_out[i - 1] < y_out[i] and y_out[i] > y_out[i + 1]:
-		peaks_idx.append(i)
+# detectar picos (interpolação parabólica) e calcular tempo entre os dois primeiros
+osc = oscillation(y_out, t_out)
 
 print ("\n")
 
-if len(peaks_idx) >= 2:
-	i1, i2 = peaks_idx[0], peaks_idx[1]
-	t1, y1 = t_out[i1], y_out[i1]
-	t2, y2 = t_out[i2], y_out[i2]
+if len(osc.t_peaks) >= 2:
+	t1, y1 = osc.t_peaks[0], osc.y_peaks[0]
+	t2, y2 = osc.t_peaks[1], osc.y_peaks[1]
 	dt12 = t2 - t1
 	print(f"Pcr (entre 1º e 2º picos) = {dt12:.6f} s")
+	print(f"Pcr (média entre {len(osc.t_peaks)} picos) = {osc.period:.6f} s")
+	print(f"Razão de decaimento = {osc.decay_ratio:.6f}")
 
 	# marcar os dois primeiros picos
 	plt.plot([t1], [y1], 'o', color='red', label='1º pico')
@@ -1,6 +1,19 @@
 import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import first_persistent_time, settling_index
+from ltc.simulation import step_responses
+from ltc.stages import pipeline
+from ltc.timegrid import auto_grid, refine
+from ltc.tuning import ultimate_gain
+
+# estágios reaproveitados entre execuções: Kcr/Pcr e as simulações só são
+# refeitos quando a planta, os ganhos ou a precisão pedida mudam
+stages = pipeline(__file__)
 
 # numerador e denominador
 num = [1]   # 1
@@ -11,31 +24,39 @@ print("Planta G(s) =", G)
 # malha fechada sem controlador
 Gcl = ctrl.feedback(G, 1)
 
-# simulação
-n_points = 30000
-t_final = 300.0
-t = np.linspace(0, t_final, n_points)
-t_out, y_out = ctrl.step_response(Gcl, T=t)
-
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, low, high):
-    idxs = np.where((signal >= low) & (signal <= high))[0]
-    if idxs.size == 0:
-        return None
-    for idx in idxs:
-        if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-            return time[idx]
-    return None
-
 # limites visuais: inferior 98,2% e teto 102%
 visual_low_pct = 0.982
 visual_high_pct = 1.02
 low = visual_low_pct * 1.0
 high = visual_high_pct * 1.0
 
+# precisão dos valores impressos: y(∞) com 6 casas e t_s com 3
+tol_final = 5e-7   # cauda abaixo de meia unidade da 6ª casa no fim da grade
+resolucao = 1e-3   # s, passo em torno do pico e da acomodação
+
+# simulação: horizonte pelo polo dominante de malha fechada e passo pelos
+# modos ainda ativos (denso no transitório, esparso na cauda acomodada);
+# uma segunda passada reamostra o pico e a última saída da faixa. Com o PI o
+# par dominante é pouco amortecido (ζ ≈ 0,01, período ≈ 4,2 s): a cauda só cai
+# abaixo de tol_final em ~1100 s e exige ~30 amostras por período até lá
+def simulate(num_cl, den_cl, low, high, tol_final, resolucao):
+    t = auto_grid(den_cl, tol=tol_final)
+    y = step_responses(num_cl, den_cl, t)[0]
+    i_peak = int(np.argmax(y))
+    spans = [(t[max(i_peak - 1, 0)], t[min(i_peak + 1, t.size - 1)])]
+    i_ts = int(settling_index(y, low, high))
+    if i_ts > 0:
+        spans.append((t[i_ts - 1], t[i_ts]))
+    t = refine(t, spans, resolucao)
+    return t, step_responses(num_cl, den_cl, t)[0]
+
+t_out, y_out = stages.run("sem_controlador", simulate, Gcl.num[0][0], Gcl.den[0][0],
+                          low, high, tol_final, resolucao)
+print(f"Grade automática: {t_out.size} amostras até {t_out[-1]:.1f} s")
+
 # valor final aproximado, overshoot e tempo de acomodação visual
 y_inf = float(y_out[-1])
-Mp = (np.max(y_out) - 1.0) / 1.0 * 100.0
+Mp = max(0.0, (np.max(y_out) - 1.0) / 1.0 * 100.0)  # sem sobressinal: 0
 ts_vis = first_persistent_time(y_out, t_out, low, high)
 
 print("\nResultados da malha fechada sem controlador (realimentação unitária):")
@@ -67,9 +88,8 @@ plt.show()
 
 # controlador PI por Ziegler–Nichols
 
-# parâmetros
-Kcr = 30.00
-Pcr = 2.81
+# parâmetros (cruzamento do eixo jω da malha com ganho K, ver exercício 2)
+Kcr, Pcr = stages.run("critico", ultimate_gain, num, den)
 
 # fórmulas de ZN para PI
 Kp = 0.45 * Kcr
@@ -89,11 +109,13 @@ Cpi = ctrl.TransferFunction([Kp, Ki], [1, 0])
 Gcl_pi = ctrl.feedback(Cpi * G, 1)
 
 # resposta ao degrau
-t_pi, y_pi = ctrl.step_response(Gcl_pi, T=t)
+t_pi, y_pi = stages.run("pi", simulate, Gcl_pi.num[0][0], Gcl_pi.den[0][0],
+                        low, high, tol_final, resolucao)
+print(f"Grade automática (PI): {t_pi.size} amostras até {t_pi[-1]:.1f} s")
 
 # métricas
 y_inf_pi = float(y_pi[-1])
-Mp_pi = (np.max(y_pi) - 1.0) / 1.0 * 100.0
+Mp_pi = max(0.0, (np.max(y_pi) - 1.0) / 1.0 * 100.0)
 ts_vis_pi = first_persistent_time(y_pi, t_pi, low, high)
 
 print("\nResultados com PI:")
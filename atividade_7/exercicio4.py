@@ -1,6 +1,16 @@
 import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.metrics import first_persistent_time
+from ltc.stages import pipeline
+from ltc.tuning import ultimate_gain
+
+# Kcr/Pcr reaproveitados entre execuções enquanto a planta não muda
+stages = pipeline(__file__)
 
 # numerador e denominador
 num = [1]
@@ -12,25 +22,14 @@ n_points = 1000
 t_final = 50.0
 t = np.linspace(0, t_final, n_points)
 
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, low, high):
-	idxs = np.where((signal >= low) & (signal <= high))[0]
-	if idxs.size == 0:
-		return None
-	for idx in idxs:
-		if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-			return time[idx]
-	return None
-
 # limites visuais: inferior 98,2% e teto 102%
 visual_low_pct = 0.982
 visual_high_pct = 1.02
 low = visual_low_pct * 1.0
 high = visual_high_pct * 1.0
 
-# parâmetros críticos
-Kcr = 30.00
-Pcr = 2.81
+# parâmetros críticos (cruzamento do eixo jω da malha com ganho K, ver exercício 2)
+Kcr, Pcr = stages.run("critico", ultimate_gain, num, den)
 
 # manter Kcr e Pcr para a sintonia do PID
 # controlador PID por Ziegler–Nichols
@@ -1,163 +1,168 @@
-import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.pareto import explore
+from ltc.polezero import MARGINAL, UNSTABLE
+from ltc.robust import RobustConstraint, perturb_grid, robustness
+from ltc.stages import pipeline
+from ltc.tuning import evaluate_batch, pid_grid_search, pid_optimize, ultimate_gain, zn_pid
 
 # numerador e denominador
 num = [1]
 den = [1, 6, 5, 0]
-G = ctrl.TransferFunction(num, den)
 
 # simulação
 n_points = 2000
 t_final = 20.0
 t = np.linspace(0, t_final, n_points)
 
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, low, high):
-	idxs = np.where((signal >= low) & (signal <= high))[0]
-	if idxs.size == 0:
-		return None
-	for idx in idxs:
-		if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-			return time[idx]
-	return None
-
 # limites visuais: inferior 98,2% e teto 102%
 visual_low_pct = 0.982
 visual_high_pct = 1.02
 low = visual_low_pct * 1.0
 high = visual_high_pct * 1.0
 
-# parâmetros críticos
-Kcr = 30.00
-Pcr = 2.81
+# estágios reaproveitados entre execuções: Kcr/Pcr, a busca e a robustez só
+# são refeitos quando a planta, os critérios ou os ganhos mudam
+stages = pipeline(__file__)
+
+# parâmetros críticos (cruzamento do eixo jω da malha com ganho K, ver exercício 2)
+Kcr, Pcr = stages.run("critico", ultimate_gain, num, den)
 
 # controlador PID por Ziegler–Nichols
-Kp0 = 0.6 * Kcr
-Ti0 = 0.5 * Pcr
-Td0 = 0.125 * Pcr
-Ki0 = Kp0 / Ti0
-Kd0 = Kp0 * Td0
-
-print("\nInicial:")
-print(f"Kp0={Kp0:.6f}, Ki0={Ki0:.6f}, Kd0={Kd0:.6f}")
-
-# avalia métricas (Ts visual e overshoot) para um PID
-def evaluate_pid(Kp, Ki, Kd):
-	"""Retorna Ts, Mp, y_inf, t, y para o PID dado; ignora candidatos inválidos."""
-	# C(s) = (Kd s^2 + Kp s + Ki) / s
-	Cpid = ctrl.TransferFunction([Kd, Kp, Ki], [1, 0])
-	Gcl = ctrl.feedback(Cpid * G, 1)
-	try:
-		tr, yr = ctrl.step_response(Gcl, T=t)
-	except Exception:
-		return None
-	if np.any(~np.isfinite(yr)):
-		return None
-	y_inf = float(yr[-1])
-	Mp = (np.max(yr) - 1.0) * 100.0
-	Ts = first_persistent_time(yr, tr, low, high)
-	if Ts is None:
-		idx = np.where(yr >= low)[0]
-		Ts = float(tr[idx[0]]) if idx.size else np.inf
-	return {
-		"Kp": Kp, "Ki": Ki, "Kd": Kd,
-		"t": tr, "y": yr, "y_inf": y_inf,
-		"Mp": float(Mp), "Ts": float(Ts)
-	}
+Kp0, Ki0, Kd0 = zn_pid(Kcr, Pcr)
 
 # critérios de projeto
 TS_MAX = 7.0
 MP_MAX = 20.0
 
-# busca ao redor do ZN (multiplicadores)
+# busca ao redor do ZN (multiplicadores) + refino local (0.8–1.2) ao redor do
+# melhor candidato; os candidatos são avaliados num pool de processos, em lotes
+# simulados em espaço de estados e interrompidos assim que o candidato é
+# rejeitado por Mp/Ts ou comprovadamente acomoda (method="early")
 mults_coarse = [0.5, 0.75, 1.0, 1.25, 1.5]
-tested = 0
-best_feasible = None  # melhor que satisfaz os critérios
-best_near = None      # melhor (menor custo) mesmo que não satisfaça
-
-def cost(candidate):
-	pen_ts = max(0.0, candidate["Ts"] - TS_MAX) / TS_MAX
-	pen_mp = max(0.0, candidate["Mp"] - MP_MAX) / MP_MAX
-	return 10.0 * (pen_ts + pen_mp) + candidate["Ts"]
-
-for mP in mults_coarse:
-	for mI in mults_coarse:
-		for mD in mults_coarse:
-			cand = evaluate_pid(Kp0 * mP, Ki0 * mI, Kd0 * mD)
-			if cand is None:
-				continue
-			tested += 1
-			ok = (cand["Ts"] < TS_MAX) and (cand["Mp"] < MP_MAX)
-			if ok:
-				if (best_feasible is None) or (cand["Ts"] < best_feasible["Ts"]):
-					best_feasible = cand
-			else:
-				if (best_near is None) or (cost(cand) < cost(best_near)):
-					best_near = cand
-
-# refino local ao redor do melhor candidato
-def refine_around(base, scales=(0.8, 0.9, 1.0, 1.1, 1.2)):
-	global tested
-	best_ok = base if ((base is not None) and (base["Ts"] < TS_MAX) and (base["Mp"] < MP_MAX)) else None
-	best_alt = base
-	if base is None:
-		return None, None
-	for mP in scales:
-		for mI in scales:
-			for mD in scales:
-				cand = evaluate_pid(base["Kp"] * mP, base["Ki"] * mI, base["Kd"] * mD)
-				if cand is None:
-					continue
-				tested += 1
-				ok = (cand["Ts"] < TS_MAX) and (cand["Mp"] < MP_MAX)
-				if ok:
-					if (best_ok is None) or (cand["Ts"] < best_ok["Ts"]):
-						best_ok = cand
-				else:
-					if (best_alt is None) or (cost(cand) < cost(best_alt)):
-						best_alt = cand
-	return best_ok, best_alt
-
-if best_feasible is None:
-	ref_ok, ref_alt = refine_around(best_near)
-	best_feasible = ref_ok
-	best_near = ref_alt
-else:
-	ref_ok, ref_alt = refine_around(best_feasible)
-	best_feasible = ref_ok or best_feasible
-	best_near = ref_alt or best_near
-
-print(f"\nCombinações avaliadas: {tested}")
-
-chosen = best_feasible or best_near
-if chosen is None:
-	raise RuntimeError("Nenhum candidato válido foi avaliado. Verifique a instalação da biblioteca 'control'.")
-
-meets = (chosen["Ts"] < TS_MAX) and (chosen["Mp"] < MP_MAX)
-
-print("\nResultado final:")
-print(f"Atende critérios? {'SIM' if meets else 'NÃO'}  (Ts={chosen['Ts']:.3f}s, Mp={chosen['Mp']:.2f}%)")
-print(f"Ganhos: Kp={chosen['Kp']:.6f}, Ki={chosen['Ki']:.6f}, Kd={chosen['Kd']:.6f}")
-
-# gráfico (PID ajustado)
-tr, yr = chosen["t"], chosen["y"]
-Mp = chosen["Mp"]
-Ts = chosen["Ts"]
-
-plt.figure(figsize=(9,5))
-plt.plot(tr, yr, label="G(s) com PID (ajustado)", linewidth=2)
-plt.axhline(1.0, color="k", linestyle="--", label="Valor final = 1.00")
-plt.axhline(low, color="orange", linestyle=":", label=f"Inferior {visual_low_pct*100:.1f}% = {low:.3f}")
-plt.axhline(high, color="orange", linestyle=":", label=f"Superior {visual_high_pct*100:.1f}% = {high:.2f}")
-idx_peak = int(np.argmax(yr))
-y_peak = float(yr[idx_peak])
-plt.axhline(y_peak, color='red', linestyle=':', linewidth=1.5, label=f"Overshoot = {Mp:.2f}%")
-if np.isfinite(Ts):
-	plt.axvline(Ts, color='red', linestyle='--', linewidth=1, label=f"T_s visual = {Ts:.3f} s")
-plt.title("Resposta ao degrau — PID ajustado (ts<7 s, Mp<20%)")
-plt.xlabel("Tempo [s]")
-plt.ylabel("Saída y(t)")
-plt.grid(True, ls="--", alpha=0.6)
-plt.legend()
-plt.show()
+mults_refine = [0.8, 0.9, 1.0, 1.1, 1.2]
+
+# alternativa à grade: otimização local a partir do ZN ("nelder-mead" ou
+# "gradient"), com no máximo OTIM_ORCAMENTO simulações
+# ou "pareto": varredura grande (Sobol) guardando só a fronteira (Ts, Mp,
+# esforço), gravada em PARETO_ARQUIVO; o projeto de cada par de critérios
+# sai da fronteira, sem simular de novo
+BUSCA = "grade"
+OTIM_ORCAMENTO = 48
+PARETO_AMOSTRAS = 4096
+PARETO_ARQUIVO = Path(__file__).with_name("pareto_pid.npz")
+CRITERIOS_EXTRAS = [(5.0, 10.0), (10.0, 5.0), (4.0, 25.0)]
+
+# robustez: coeficientes não nulos de D(s) variando ±ROBUSTEZ_TOL numa grade
+# de ROBUSTEZ_PONTOS valores cada (22³ ≈ 10⁴ plantas); com ROBUSTEZ_RESTRICAO
+# a busca (grade ou otimização) só aceita ganhos que atendem os critérios
+# em pelo menos ROBUSTEZ_FRACAO das plantas
+ROBUSTEZ_TOL = 0.10
+ROBUSTEZ_PONTOS = 22
+ROBUSTEZ_RESTRICAO = False
+ROBUSTEZ_FRACAO = 0.9
+
+def grid_search(num, den, t, base, ts_max, mp_max, mults, scales, band, constraint):
+	# busca em grade e número de verificações da restrição (que não sobrevive
+	# ao reaproveitamento do estágio)
+	best_feasible, best_near, tested = pid_grid_search(
+		num, den, t, base, ts_max, mp_max, mults=mults, scales=scales,
+		band=band, method="early", constraint=constraint)
+	return best_feasible, best_near, tested, (0 if constraint is None else constraint.checks)
+
+# o pool reimporta este script nos processos filhos: só o processo principal
+# executa a busca e os gráficos
+if __name__ == "__main__":
+	print("\nInicial:")
+	print(f"Kp0={Kp0:.6f}, Ki0={Ki0:.6f}, Kd0={Kd0:.6f}")
+
+	plantas = perturb_grid(den, ROBUSTEZ_TOL, ROBUSTEZ_PONTOS)
+	restricao = (RobustConstraint(num, plantas, t, TS_MAX, MP_MAX, ROBUSTEZ_FRACAO,
+		(visual_low_pct, visual_high_pct)) if ROBUSTEZ_RESTRICAO else None)
+
+	checks = 0
+	if BUSCA == "grade":
+		best_feasible, best_near, tested, checks = stages.run("grade", grid_search,
+			num, den, t, (Kp0, Ki0, Kd0), TS_MAX, MP_MAX, mults_coarse, mults_refine,
+			(visual_low_pct, visual_high_pct), restricao)
+	elif BUSCA == "pareto":
+		archive = explore(num, den, t, (Kp0, Ki0, Kd0), n=PARETO_AMOSTRAS,
+			band=(visual_low_pct, visual_high_pct))
+		archive.save(PARETO_ARQUIVO)
+		tested = archive.evaluated
+		print(f"\nFronteira de Pareto: {len(archive)} de {tested} candidatos -> {PARETO_ARQUIVO.name}")
+		for ts_max, mp_max in CRITERIOS_EXTRAS:
+			ok, near = archive.pick(ts_max, mp_max)
+			d = ok or near
+			print(f"  Ts<{ts_max:g} s, Mp<{mp_max:g}%: {'SIM' if ok else 'NÃO'}  "
+				f"Kp={d['Kp']:.4f}, Ki={d['Ki']:.4f}, Kd={d['Kd']:.4f}  "
+				f"(Ts={d['Ts']:.3f}s, Mp={d['Mp']:.2f}%, esforço={d['effort']:.1f})")
+		# a fronteira não guarda respostas: só o escolhido é simulado, para o gráfico
+		best_feasible, best_near = [
+			d and evaluate_batch(num, den, t, [(d["Kp"], d["Ki"], d["Kd"])],
+				(visual_low_pct, visual_high_pct))[0]
+			for d in archive.pick(TS_MAX, MP_MAX)]
+		for d in (best_feasible, best_near):
+			if d is not None:
+				d["t"] = t
+	else:
+		best_feasible, best_near, tested, trace = pid_optimize(
+			num, den, t, (Kp0, Ki0, Kd0), TS_MAX, MP_MAX,
+			band=(visual_low_pct, visual_high_pct), method=BUSCA, budget=OTIM_ORCAMENTO,
+			constraint=restricao)
+		checks = 0 if restricao is None else restricao.checks
+		print("\nConvergência (custo contínuo):")
+		for i in range(0, tested, 8):
+			print(f"  simulação {i + 1:3d}: J={trace['J'][i]:10.4f}  melhor={trace['J_best'][i]:10.4f}")
+
+	print(f"\nCombinações avaliadas: {tested}")
+
+	chosen = best_feasible or best_near
+	if chosen is None:
+		raise RuntimeError("Nenhum candidato válido foi avaliado. Verifique a instalação da biblioteca 'control'.")
+
+	meets = (chosen["Ts"] < TS_MAX) and (chosen["Mp"] < MP_MAX)
+
+	print("\nResultado final:")
+	print(f"Atende critérios? {'SIM' if meets else 'NÃO'}  (Ts={chosen['Ts']:.3f}s, Mp={chosen['Mp']:.2f}%)")
+	print(f"Ganhos: Kp={chosen['Kp']:.6f}, Ki={chosen['Ki']:.6f}, Kd={chosen['Kd']:.6f}")
+
+	# robustez do PID escolhido frente às perturbações de D(s)
+	rob = stages.run("robustez", robustness, num, plantas, (chosen["Kp"], chosen["Ki"], chosen["Kd"]),
+		t, TS_MAX, MP_MAX, (visual_low_pct, visual_high_pct))
+	instaveis = np.isin(rob.poles.regime, (UNSTABLE, MARGINAL)).sum()
+	pior = rob.worst
+	print(f"\nRobustez (±{ROBUSTEZ_TOL * 100:.0f}% nos coeficientes de D(s), {len(plantas)} plantas):")
+	if restricao is not None:
+		print(f"  restrição na busca: ≥ {ROBUSTEZ_FRACAO * 100:.0f}% das plantas ({checks} verificações)")
+	print(f"  atende critérios em {rob.fraction * 100:.1f}% das plantas; instáveis: {instaveis}")
+	print(f"  Ts: {np.min(rob.Ts):.3f} a {np.max(rob.Ts):.3f} s;  Mp: {np.min(rob.Mp):.2f} a {np.max(rob.Mp):.2f}%")
+	print("  pior caso: D(s) = [" + ", ".join(f"{c:.3f}" for c in rob.plants[pior]) + "]"
+		f"  (Ts={rob.Ts[pior]:.3f}s, Mp={rob.Mp[pior]:.2f}%)")
+	print("  polos de malha fechada: " + ", ".join(f"{p:.3f}" for p in rob.poles.poles[pior]))
+
+	# gráfico (PID ajustado)
+	tr, yr = chosen["t"], chosen["y"]
+	Mp = chosen["Mp"]
+	Ts = chosen["Ts"]
+
+	plt.figure(figsize=(9,5))
+	plt.plot(tr, yr, label="G(s) com PID (ajustado)", linewidth=2)
+	plt.axhline(1.0, color="k", linestyle="--", label="Valor final = 1.00")
+	plt.axhline(low, color="orange", linestyle=":", label=f"Inferior {visual_low_pct*100:.1f}% = {low:.3f}")
+	plt.axhline(high, color="orange", linestyle=":", label=f"Superior {visual_high_pct*100:.1f}% = {high:.2f}")
+	idx_peak = int(np.argmax(yr))
+	y_peak = float(yr[idx_peak])
+	plt.axhline(y_peak, color='red', linestyle=':', linewidth=1.5, label=f"Overshoot = {Mp:.2f}%")
+	if np.isfinite(Ts):
+		plt.axvline(Ts, color='red', linestyle='--', linewidth=1, label=f"T_s visual = {Ts:.3f} s")
+	plt.title("Resposta ao degrau — PID ajustado (ts<7 s, Mp<20%)")
+	plt.xlabel("Tempo [s]")
+	plt.ylabel("Saída y(t)")
+	plt.grid(True, ls="--", alpha=0.6)
+	plt.legend()
+	plt.show()
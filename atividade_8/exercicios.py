@@ -1,6 +1,19 @@
 import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.design import design_gains, structure, zeta_from_mp
+from ltc.metrics import step_metrics
+from ltc.plots import plot_root_locus
+from ltc.rootlocus import root_loci
+from ltc.stages import pipeline
+
+# estágios com entradas endereçadas por conteúdo: numa nova execução só é
+# recalculado o que depende de algo que mudou (ex.: TS_MAX não refaz os lugares)
+stages = pipeline(__file__)
 
 # planta (1 / (s^2 + 5*s + 6))
 num = [1]
@@ -20,33 +33,23 @@ n_points = 2000
 t_final = 100.0
 t = np.linspace(0.0, t_final, n_points)
 
-# função para achar tempo visual (2% de tolerância)
-def first_persistent_time(signal, time, low, high):
-	idxs = np.where((signal >= low) & (signal <= high))[0]
-	if idxs.size == 0:
-		return None
-	for idx in idxs:
-		if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
-			return time[idx]
-	return None
-
 # limites visuais (98%–102%)
 visual_low_pct = 0.98
 visual_high_pct = 1.02
 low = visual_low_pct * 1.0
 high = visual_high_pct * 1.0
 
-# lugar das raízes (0 < K < ∞)
-plt.figure(figsize=(7,6))
-# plota o lugar das raízes; versões recentes podem não retornar tupla
-ctrl.rlocus(G)
+# lugar das raízes (0 < K < ∞) de K·G, K/s·G e K(s+1)/s·G, numa só chamada
+locus_P, locus_I, locus_PI = stages.run("lugares", root_loci, [
+	(num, den),
+	(num, np.polymul([1, 0], den)),
+	(np.polymul([1, 1], num), np.polymul([1, 0], den)),
+])
 
-# linhas iso-ζ (constante razão de amortecimento)
-def zeta_from_mp(mp_pct: float) -> float:
-	mp = max(1e-9, min(99.9, mp_pct)) / 100.0
-	ln_mp = np.log(mp)
-	return -ln_mp / np.sqrt(np.pi**2 + ln_mp**2)
+plt.figure(figsize=(7,6))
+plot_root_locus(locus_P)
 
+# linhas iso-ζ (constante razão de amortecimento); ζ alvo vem de zeta_from_mp
 def draw_iso_zeta(ax, zeta: float, color='gray', ls='--', lw=1.0, label=None):
 	zeta = np.clip(zeta, 1e-6, 0.999999)
 	theta = np.arccos(zeta)
@@ -88,7 +91,7 @@ plt.show()
 # ----- controlador integrador: Gc(s) = K/s ----- #
 
 plt.figure(figsize=(7,6))
-ctrl.rlocus(ctrl.TransferFunction([1], [1, 0]) * G)  # rlocus de Gc*G com Gc=1/s; K escala o lugar
+plot_root_locus(locus_I)  # lugar de Gc*G com Gc=1/s; K escala o lugar
 
 # reutilizar linhas iso-ζ
 zeta_target = zeta_from_mp(MP_MAX)
@@ -116,8 +119,7 @@ plt.show()
 # ----- controlador PI: Gc(s) = K (1 + 1/s) = K (s+1)/s ----- #
 
 plt.figure(figsize=(7,6))
-G_pi_base = ctrl.TransferFunction([1, 1], [1, 0]) * G  # (s+1)/s * G(s); K escala o lugar
-ctrl.rlocus(G_pi_base)
+plot_root_locus(locus_PI)  # (s+1)/s * G(s); K escala o lugar
 
 # reutilizar linhas iso-ζ
 zeta_target = zeta_from_mp(MP_MAX)
@@ -146,48 +148,57 @@ plt.show()
 
 # ----- Respostas ao degrau em malha fechada (P, I, PI) no mesmo gráfico ----- #
 
-K_P = 10.38   # ganho para controlador proporcional Gc=K
-K_I = 3.567   # ganho para integrador Gc=K/s
-K_PI = 8.402  # ganho para PI Gc=K(1 + 1/s)
-
-# Controladores
-Gc_P = ctrl.TransferFunction([K_P], [1])
-Gc_I = ctrl.TransferFunction([K_I], [1, 0])                 # K/s
-Gc_PI = ctrl.TransferFunction([K_PI, K_PI], [1, 0])         # K*(s+1)/s
-
-# Malhas fechadas T(s) = feedback(Gc*G, 1)
-T_P = ctrl.feedback(Gc_P * G, 1)
-T_I = ctrl.feedback(Gc_I * G, 1)
-T_PI = ctrl.feedback(Gc_PI * G, 1)
+# intervalos de K em que os polos dominantes têm ζ ≥ ζ alvo e Re(s) ≤ σ alvo,
+# calculados sobre o polinômio característico (sem ler o gráfico)
+structures = {kind: structure(kind) for kind in ("P", "I", "PI")}  # PI: K(1 + 1/s)
+regions = stages.run("projeto", design_gains,
+	[(np.polymul(cn, num), np.polymul(cd, den)) for cn, cd in structures.values()],
+	zeta_target, sigma_target)
+
+# ganho no interior da região de cada estrutura (os extremos são ganhos de
+# fronteira, com Mp exatamente em MP_MAX); estruturas sem K viável ficam de fora
+gains = {}
+for kind, region in zip(structures, regions):
+	if not len(region.intervals):
+		print(f"{kind}: nenhum K viável para Mp ≤ {MP_MAX}% e Ts ≤ {TS_MAX}s")
+		continue
+	K = region.gain()
+	print(f"{kind}: K viável em " + ", ".join(f"[{lo:.4g}, {hi:.4g}]" for lo, hi in region.intervals)
+		+ ("" if K is None else f"; K escolhido = {K:.4g}"))
+	if K is not None:
+		gains[kind] = K
+
+def closed_loop_steps(num, den, gains, t):
+	G = ctrl.TransferFunction(num, den)
+
+	# Controladores K·C(s): P = K, I = K/s, PI = K(s+1)/s
+	# Malhas fechadas T(s) = feedback(Gc*G, 1); respostas como arrays simples
+	# (o NamedSignal do control não sobrevive ao pickle)
+	steps = {}
+	for kind, K in gains.items():
+		cn, cd = structures[kind]
+		Gc = ctrl.TransferFunction(K * cn, cd)
+		steps[kind] = tuple(np.asarray(a) for a in ctrl.step_response(ctrl.feedback(Gc * G, 1), T=t))
+	return steps
 
 # Vetor de tempo comum já definido acima: t
-yP_t, yP = ctrl.step_response(T_P, T=t)
-yI_t, yI = ctrl.step_response(T_I, T=t)
-yPI_t, yPI = ctrl.step_response(T_PI, T=t)
+steps = stages.run("respostas", closed_loop_steps, num, den, gains, t)
 
-def compute_metrics(y: np.ndarray, time: np.ndarray, tol: float = 0.02):
+def compute_metrics(Y: np.ndarray, time: np.ndarray, tol: float = 0.02):
 	# valor final pela média no trecho de cauda (mais robusto a pequenas oscilações)
-	n_tail = max(10, int(0.05 * len(y)))
-	y_final = float(np.mean(y[-n_tail:]))
-	y_max = float(np.max(y))
-	denom = abs(y_final) if abs(y_final) > 1e-12 else 1.0
-	mp_pct = max(0.0, (y_max - y_final) / denom * 100.0)
-	low_b = (1.0 - tol) * y_final
-	high_b = (1.0 + tol) * y_final
-	ts = first_persistent_time(y, time, low_b, high_b)
-	return y_final, mp_pct, ts
-
-yf_P, mp_P, ts_P = compute_metrics(yP, yP_t)
-yf_I, mp_I, ts_I = compute_metrics(yI, yI_t)
-yf_PI, mp_PI, ts_PI = compute_metrics(yPI, yPI_t)
+	n_tail = max(10, int(0.05 * Y.shape[-1]))
+	m = step_metrics(Y, time, band=(1.0 - tol, 1.0 + tol), n_tail=n_tail)
+	return m["y_final"], np.maximum(0.0, m["Mp"]), m["Ts"]
 
 def fmt_ts(ts_val):
-	return f"{ts_val:.2f}s" if ts_val is not None else f"> {t[-1]:.0f}s"
+	return f"{ts_val:.2f}s" if np.isfinite(ts_val) else f"> {t[-1]:.0f}s"
 
 plt.figure(figsize=(8,5))
-plt.plot(yP_t, yP, label=f"P (K={K_P:.2f}) — Mp={mp_P:.1f}%  Ts={fmt_ts(ts_P)}")
-plt.plot(yI_t, yI, label=f"I (K={K_I:.2f}) — Mp={mp_I:.1f}%  Ts={fmt_ts(ts_I)}")
-plt.plot(yPI_t, yPI, label=f"PI (K={K_PI:.2f}) — Mp={mp_PI:.1f}%  Ts={fmt_ts(ts_PI)}")
+if steps:
+	# métricas das respostas numa única chamada (uma resposta por linha)
+	_, mps, tss = stages.run("metricas", compute_metrics, np.vstack([y for _, y in steps.values()]), t)
+	for (kind, (y_t, y)), mp, ts in zip(steps.items(), mps, tss):
+		plt.plot(y_t, y, label=f"{kind} (K={gains[kind]:.2f}) — Mp={mp:.1f}%  Ts={fmt_ts(ts)}")
 plt.axhline(1.0, color='k', ls=':', lw=1.0, label='Referência = 1')
 plt.xlabel('Tempo (s)')
 plt.ylabel('Saída y(t)')
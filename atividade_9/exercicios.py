@@ -1,39 +1,39 @@
-import control as ctrl
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
 
-# ----- G1(s) = 1000 / ((s+10)(s+100)) -----
-num = [1000]
-den = [1, 110, 1000]
-G = ctrl.TransferFunction(num, den)
-print("Função de transferência G1(s):")
-print(G)
-ctrl.bode(G, dB=True, Hz=False, omega_limits=[0.1, 1000])
-plt.show()
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
+from ltc.frequency import bode, stability_margins
+from ltc.lti import LTIBatch
+from ltc.plots import plot_bode
+from ltc.stages import pipeline
 
-# ----- G2(s) = (s + 100) / ((s + 2)(s + 25)) -----
-num2 = [1, 100]
-den2 = [1, 27, 50]
-G2 = ctrl.TransferFunction(num2, den2)
-print("\nFunção de transferência G2(s):")
-print(G2)
-ctrl.bode(G2, dB=True, Hz=False, omega_limits=[0.1, 1000])
-plt.show()
+# estágios reaproveitados entre execuções enquanto os sistemas não mudam
+stages = pipeline(__file__)
 
-# ----- G3(s) = 100 / (s^2 + 2 s + 50) -----
-num3 = [100]
-den3 = [1, 2, 50]
-G3 = ctrl.TransferFunction(num3, den3)
-print("\nFunção de transferência G3(s):")
-print(G3)
-ctrl.bode(G3, dB=True, Hz=False, omega_limits=[0.1, 1000])
-plt.show()
+sistemas = [
+    # G1(s) = 1000 / ((s+10)(s+100))
+    ("G1", [1000], [1, 110, 1000]),
+    # G2(s) = (s + 100) / ((s + 2)(s + 25))
+    ("G2", [1, 100], [1, 27, 50]),
+    # G3(s) = 100 / (s^2 + 2 s + 50)
+    ("G3", [100], [1, 2, 50]),
+    # G4(s) = (s - 6) / ((s + 3)(s^2 + 12 s + 50))
+    ("G4", [1, -6], [1, 15, 86, 150]),
+]
 
-# ----- G4(s) = (s - 6) / ((s + 3)(s^2 + 12 s + 50)) -----
-num4 = [1, -6]
-den4 = [1, 15, 86, 150]
-G4 = ctrl.TransferFunction(num4, den4)
-print("\nFunção de transferência G4(s):")
-print(G4)
-ctrl.bode(G4, dB=True, Hz=False, omega_limits=[0.1, 1000])
-plt.show()
+# resposta em frequência dos 4 sistemas numa única chamada (mesma grade ω)
+lote = LTIBatch.from_pairs([(num, den) for _, num, den in sistemas])
+resp = stages.run("bode", bode, lote.num, lote.den, omega_limits=[0.1, 1000])
+margens = stages.run("margens", stability_margins, lote.num, lote.den)
+
+for i, (nome, num, den) in enumerate(sistemas):
+    G = lote.to_ctrl(i)
+    print(f"\nFunção de transferência {nome}(s):")
+    print(G)
+    gm, pm, wcg, wcp = (np.asarray(m)[i] for m in margens)
+    gm_db = 20 * np.log10(gm) if np.isfinite(gm) else np.inf
+    print(f"MG = {gm_db:.2f} dB (ω = {wcg:.3f} rad/s), MF = {pm:.2f}° (ω = {wcp:.3f} rad/s)")
+    plot_bode(resp, i, title=f"Bode - {nome}(s)")
+    plt.show()
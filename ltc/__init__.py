@@ -0,0 +1,58 @@
+"""Rotinas compartilhadas pelos scripts das atividades de LTC.
+
+Os scripts de cada ``atividade_*`` adicionam a raiz do repositório ao
+``sys.path`` e importam daqui as partes comuns:
+
+- ``ltc.metrics``: tempo de acomodação, métricas da resposta ao degrau
+  (também incrementais, por blocos) e detecção de picos/oscilação;
+- ``ltc.second_order``: respostas analíticas de 2ª ordem para grades (ωn, ζ);
+- ``ltc.simulation``: simulação em lote (espaço de estados discretizado),
+  inclusive em fluxo de blocos com memória constante, e entradas
+  arbitrárias com discretização ZOH/FOH em cache;
+- ``ltc.polezero``: polos em lote de famílias paramétricas (fórmulas
+  fechadas até a 4ª ordem), ωn, ζ e regime de amortecimento;
+- ``ltc.lti``: lotes de sistemas SISO em arrays de coeficientes (polos,
+  zeros, ganho DC, série, realimentação, degrau, conversão ctrl);
+- ``ltc.tracking``: seguimento de degrau, rampa, parábola e sinais
+  amostrados em lote, com erro em regime e constantes Kp, Kv e Ka;
+- ``ltc.montecarlo``: Monte Carlo de tolerâncias (RLC ou coeficientes de
+  planta) com envelopes por percentis e distribuições de ωn, ζ, Ts e Mp;
+- ``ltc.timegrid``: horizonte e passo automáticos a partir dos polos;
+- ``ltc.cache``: cache LRU (memória + ``.npz`` em disco) de respostas;
+- ``ltc.stages``: estágios dos scripts com entradas endereçadas por
+  conteúdo, reexecutados só quando alguma entrada muda;
+- ``ltc.sweep``: varredura de ganho K no ramo direto ou na realimentação;
+- ``ltc.tuning``: ganho crítico (Ziegler–Nichols), busca de ganhos PID
+  em paralelo e otimização local (Nelder–Mead/gradiente);
+- ``ltc.pareto``: varredura amostrada (Sobol/LHS) dos ganhos PID com
+  fronteira de Pareto incremental em (Ts, Mp, esforço);
+- ``ltc.robust``: robustez de um PID a perturbações da planta (polos em
+  lote, Ts/Mp, pior caso) e restrição de robustez para as buscas;
+- ``ltc.rootlocus``: lugar das raízes em lote, com ramos contínuos;
+- ``ltc.design``: intervalos de ganho que atendem ζ e σ de projeto;
+- ``ltc.frequency``: resposta em frequência (Bode) e margens em lote;
+- ``ltc.plots``: desenho com matplotlib (lugar das raízes, Bode);
+- ``ltc.report``: geração headless e em paralelo das figuras de todas as
+  atividades (``python -m ltc.report``);
+- ``ltc.bench``: benchmarks dos caminhos quentes, com histórico JSON e
+  detecção de regressões (``python -m ltc.bench``).
+
+Só as métricas (NumPy puro) são reexportadas aqui; os demais módulos
+(SciPy, python-control, matplotlib) são importados diretamente.
+"""
+
+from .metrics import (
+    STEP_METRICS,
+    RunningMetrics,
+    first_persistent_time,
+    settling_index,
+    step_metrics,
+)
+
+__all__ = [
+    "STEP_METRICS",
+    "RunningMetrics",
+    "first_persistent_time",
+    "settling_index",
+    "step_metrics",
+]
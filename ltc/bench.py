@@ -0,0 +1,346 @@
+"""Benchmarks dos caminhos quentes de simulação e análise.
+
+Cada benchmark monta seus dados uma única vez (sementes fixas) e mede só a
+chamada: o número de execuções por repetição é calibrado para ~0,2 s e o
+resultado é o melhor tempo por chamada entre as repetições (e a mediana).
+Cada execução acrescenta um registro ao histórico JSON; com uma referência
+gravada, os benchmarks mais lentos que ela além da tolerância são marcados
+como regressão (código de saída 1).
+
+Uso, a partir da raiz do repositório::
+
+    python -m ltc.bench [nomes ...] [--repeat 5] [--save-baseline] [--tolerance 0.25]
+
+Os nomes aceitam padrões (``"pid*"``); ``--list`` lista os disponíveis.
+Os motores do pacote que substituem chamadas do python-control têm o
+caminho original registrado como referência (``ctrl.*`` e a busca PID com
+``method="control"``), medido junto e comparado na coluna ``vs ref``.
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import control as ctrl
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+HISTORY = ROOT / "benchmarks" / "history.json"
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+SEED = 1234
+
+# plantas usadas nas atividades
+PLANTS = {
+    "s3": ([1.0], [1.0, 6.0, 5.0, 0.0]),   # 1/(s³ + 6s² + 5s), atividade_7
+    "s2_lightly": ([1.0], [1.0, 1.2, 9.0]),  # 1/(s² + 1.2s + 9), atividade_5
+    "s2_over": ([1.0], [1.0, 5.0, 6.0]),     # 1/(s² + 5s + 6)
+}
+ROOT_LOCUS_SYSTEMS = [  # atividade_6
+    ([1, 10], [1, 7, 10, 0]),
+    ([1, 3], [1, 7, 10, 0]),
+    ([1], [1, 5, 9, 5, 0]),
+    ([1, 3], [1, 5, 20, 16, 0]),
+    ([1, 2, 4], [1, 11.4, 39, 43.6, 24, 0]),
+]
+BODE_SYSTEMS = [  # atividade_9
+    ([1000], [1, 110, 1000]),
+    ([1, 100], [1, 27, 50]),
+    ([100], [1, 2, 50]),
+    ([1, -6], [1, 15, 86, 150]),
+]
+
+_REGISTRY = {}
+_REFERENCES = {}  # benchmark -> benchmark do caminho original (python-control)
+
+
+def benchmark(name, reference=None):
+    """Registra uma função de preparo que devolve a chamada a medir.
+
+    ``reference`` é o nome do benchmark do caminho que esta chamada
+    substitui; a razão entre os dois entra no registro (``speedup``).
+    """
+    def register(setup):
+        _REGISTRY[name] = setup
+        if reference is not None:
+            _REFERENCES[name] = reference
+        return setup
+    return register
+
+
+for _n in (2_000, 20_000, 200_000):
+    @benchmark(f"first_persistent_time[{_n}]")
+    def _(n=_n):
+        from .metrics import first_persistent_time
+
+        rng = np.random.default_rng(SEED)
+        t = np.linspace(0.0, 20.0, n)
+        y = 1.0 - np.exp(-0.4 * t) * np.cos(2.0 * t) + 1e-3 * rng.standard_normal(n)
+        return lambda: first_persistent_time(y, t, 0.982, 1.02)
+
+
+for _name, (_num, _den) in PLANTS.items():
+    @benchmark(f"ctrl.step_response[{_name}]")
+    def _(num=_num, den=_den):
+        G = ctrl.TransferFunction(num, den)
+        t = np.linspace(0.0, 20.0, 2000)
+        return lambda: ctrl.step_response(G, T=t)
+
+
+@benchmark("step_responses[3 plantas]")
+def _():
+    from .simulation import pad_coefs, step_responses
+
+    coefs = pad_coefs([p for pair in PLANTS.values() for p in pair])
+    t = np.linspace(0.0, 20.0, 2000)
+    return lambda: step_responses(coefs[0::2], coefs[1::2], t)
+
+
+@benchmark("forced_responses[3 plantas, 30000]")
+def _():
+    from .simulation import discretize, forced_responses, pad_coefs
+
+    coefs = pad_coefs([p for pair in PLANTS.values() for p in pair])
+    t = np.linspace(0.0, 300.0, 30_000)
+    u = np.random.default_rng(SEED).standard_normal(t.size)
+    discretize(coefs[0::2], coefs[1::2], t[1] - t[0], "foh")  # mede só a recorrência
+    return lambda: forced_responses(coefs[0::2], coefs[1::2], t, u)
+
+
+@benchmark("monte_carlo[rlc, 10000]")
+def _():
+    from .montecarlo import monte_carlo, rlc_coefs, sample_parameters
+
+    # atividade_1/exercicio2.py com tolerâncias de 5%/10%/10%, em série
+    R, L, C = sample_parameters([50.0, 10e-3, 10e-6], (0.05, 0.10, 0.10), 10_000, seed=SEED).T
+    num, den = rlc_coefs(R, L, C)
+    t = np.linspace(0.0, 0.02, 2000)
+    return lambda: monte_carlo(num, den, t, processes=1)
+
+
+def _pid_problem():
+    from .tuning import ultimate_gain, zn_pid
+
+    num, den = PLANTS["s3"]
+    t = np.linspace(0.0, 20.0, 2000)
+    return num, den, t, zn_pid(*ultimate_gain(num, den))
+
+
+@benchmark("pid_grid_search[atividade_7, control]")
+def _():
+    from .tuning import pid_grid_search
+
+    num, den, t, base = _pid_problem()
+    # busca original de atividade_7/exercicio5.py: python-control, em série
+    return lambda: pid_grid_search(num, den, t, base, 7.0, 20.0, processes=1, method="control")
+
+
+@benchmark("pid_grid_search[atividade_7]", reference="pid_grid_search[atividade_7, control]")
+def _():
+    from .tuning import pid_grid_search
+
+    num, den, t, base = _pid_problem()
+    # mesma configuração de atividade_7/exercicio5.py, em série
+    return lambda: pid_grid_search(num, den, t, base, 7.0, 20.0, processes=1, method="early")
+
+
+@benchmark("pid_optimize[atividade_7]")
+def _():
+    from .tuning import pid_optimize
+
+    num, den, t, base = _pid_problem()
+    return lambda: pid_optimize(num, den, t, base, 7.0, 20.0)
+
+
+@benchmark("robustness[atividade_7, 22³ plantas]")
+def _():
+    from .robust import perturb_grid, robustness
+
+    num, den, t, base = _pid_problem()
+    plants = perturb_grid(den, 0.10, 22)
+    return lambda: robustness(num, plants, base, t, 7.0, 20.0, reject=True)
+
+
+@benchmark("ctrl.root_locus_map[atividade_6]")
+def _():
+    systems = [ctrl.TransferFunction(num, den) for num, den in ROOT_LOCUS_SYSTEMS]
+
+    # cálculo de ctrl.rlocus, sistema a sistema, sem o desenho
+    def run():
+        for G in systems:
+            ctrl.root_locus_map(G)
+    return run
+
+
+@benchmark("root_loci[atividade_6]", reference="ctrl.root_locus_map[atividade_6]")
+def _():
+    from .rootlocus import root_loci
+
+    return lambda: root_loci(ROOT_LOCUS_SYSTEMS)
+
+
+@benchmark("ctrl.bode+margin[atividade_9]")
+def _():
+    systems = [ctrl.TransferFunction(num, den) for num, den in BODE_SYSTEMS]
+
+    # cálculo de ctrl.bode (sem o desenho) e ctrl.margin, sistema a sistema
+    def run():
+        for G in systems:
+            ctrl.frequency_response(G, omega_limits=(0.1, 1000.0))
+            ctrl.margin(G)
+    return run
+
+
+@benchmark("bode+margins[atividade_9]", reference="ctrl.bode+margin[atividade_9]")
+def _():
+    from .frequency import bode, margins_of
+    from .simulation import pad_coefs
+
+    coefs = pad_coefs([p for pair in BODE_SYSTEMS for p in pair])
+
+    def run():
+        bode(coefs[0::2], coefs[1::2], omega_limits=(0.1, 1000.0))
+        margins_of(BODE_SYSTEMS)
+    return run
+
+
+def measure(func, repeat=5, target=0.2):
+    """(melhor, mediana, execuções por repetição) em segundos por chamada."""
+    func()  # aquecimento (imports, caches)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or number >= 1_000_000:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(target / elapsed) + 1))
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return min(times), float(np.median(times)), number
+
+
+def select(patterns=None):
+    """Nomes registrados que casam com algum padrão (todos, sem padrões).
+
+    As referências dos escolhidos entram junto, para o cálculo das razões.
+    """
+    if not patterns:
+        return list(_REGISTRY)
+    chosen = {name for name in _REGISTRY if any(fnmatch.fnmatchcase(name, p) for p in patterns)}
+    chosen |= {_REFERENCES[name] for name in chosen if name in _REFERENCES}
+    return [name for name in _REGISTRY if name in chosen]
+
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names, repeat=5):
+    """Executa os benchmarks e devolve o registro (dicionário serializável)."""
+    results = {}
+    for name in names:
+        best, median, number = measure(_REGISTRY[name](), repeat)
+        results[name] = {"best": best, "median": median, "number": number}
+    for name, res in results.items():
+        ref = results.get(_REFERENCES.get(name))
+        if ref is not None:
+            res["reference"] = _REFERENCES[name]
+            res["speedup"] = ref["best"] / res["best"]
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "control": ctrl.__version__,
+        "results": results,
+    }
+
+
+def regressions(record, baseline, tolerance=0.25):
+    """{nome: razão} dos benchmarks com melhor tempo > (1 + tolerance) × referência."""
+    out = {}
+    for name, res in record["results"].items():
+        ref = baseline.get("results", {}).get(name)
+        if ref is not None and res["best"] > (1.0 + tolerance) * ref["best"]:
+            out[name] = res["best"] / ref["best"]
+    return out
+
+
+def _read(path, default):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else default
+
+
+def _write(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _format(seconds):
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos quentes do pacote ltc.")
+    parser.add_argument("names", nargs="*", help="benchmarks ou padrões (padrão: todos)")
+    parser.add_argument("--repeat", type=int, default=5, help="repetições por benchmark")
+    parser.add_argument("--history", default=HISTORY, help="histórico JSON (acrescentado)")
+    parser.add_argument("--baseline", default=BASELINE, help="referência para regressões")
+    parser.add_argument("--save-baseline", action="store_true", help="grava esta execução como referência")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="folga relativa antes de acusar regressão")
+    parser.add_argument("--list", action="store_true", help="lista os benchmarks e sai")
+    args = parser.parse_args(argv)
+
+    names = select(args.names)
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print("nenhum benchmark corresponde aos nomes dados", file=sys.stderr)
+        return 2
+
+    record = run(names, args.repeat)
+    baseline = _read(args.baseline, {})
+    slow = regressions(record, baseline, args.tolerance)
+    for name, res in record["results"].items():
+        ref = baseline.get("results", {}).get(name)
+        ratio = f"  x{res['best'] / ref['best']:5.2f}" if ref else ""
+        flag = "  REGRESSÃO" if name in slow else ""
+        speedup = f"  vs ref x{res['speedup']:7.1f}" if "speedup" in res else ""
+        print(f"{name:40s} {_format(res['best'])}  (mediana {_format(res['median'])})"
+              f"{ratio}{speedup}{flag}")
+
+    history = _read(args.history, [])
+    history.append(record)
+    _write(args.history, history)
+    if args.save_baseline:
+        _write(args.baseline, record)
+    if slow:
+        print(f"\n{len(slow)} regressão(ões) acima de {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Cache de malhas fechadas, polos e respostas ao degrau.
+
+As entradas são endereçadas pelo conteúdo: a chave é o hash dos coeficientes
+num/den de malha fechada (que já codificam a topologia e o ganho) e da grade
+de tempo. A camada em memória é LRU limitada; a camada opcional em disco
+guarda um ``.npz`` por entrada, de modo que regenerar os relatórios não
+repete simulações já feitas.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .simulation import poles, step_responses
+
+
+def content_key(*arrays, tag=""):
+    """Hash SHA-1 dos arrays (float64, formato incluído) e de uma etiqueta."""
+    h = hashlib.sha1(tag.encode())
+    for a in arrays:
+        a = np.ascontiguousarray(np.asarray(a, dtype=float) + 0.0)  # -0.0 -> 0.0
+        h.update(str(a.shape).encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """Cache LRU de (resposta ao degrau, polos) por sistema de malha fechada.
+
+    ``maxsize`` limita o número de entradas em memória; com ``directory``
+    as entradas também são gravadas/lidas em disco. Os contadores ``hits``,
+    ``disk_hits`` e ``misses`` acumulam desde a criação (ou ``clear``).
+    """
+
+    def __init__(self, maxsize=1024, directory=None):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits,
+                "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self):
+        """Esvazia a camada em memória e zera os contadores (o disco fica)."""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}.npz"
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        if self.directory is not None and self._path(key).exists():
+            with np.load(self._path(key)) as data:
+                entry = {name: data[name] for name in data.files}
+            self._remember(key, entry)
+            self.disk_hits += 1
+            return entry
+        return None
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # grava num temporário e renomeia: leitores nunca veem arquivo parcial
+            tmp = self.directory / f"{key}.tmp.npz"
+            np.savez(tmp, **entry)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def responses(self, num, den, t):
+        """Respostas ao degrau (M, T) e polos (M, n) de um lote de sistemas.
+
+        ``num``/``den`` são 1-D ou um sistema por linha, de larguras
+        quaisquer (completadas com zeros à esquerda). Só os sistemas ausentes
+        do cache são simulados, todos numa única chamada em lote.
+        """
+        num = np.atleast_2d(np.asarray(num, dtype=float))
+        den = np.atleast_2d(np.asarray(den, dtype=float))
+        # zeros à esquerda até a mesma largura antes do broadcast das linhas
+        width = max(num.shape[1], den.shape[1])
+        num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+        den = np.pad(den, ((0, 0), (width - den.shape[1], 0)))
+        num, den = np.broadcast_arrays(num, den)
+        t = np.asarray(t, dtype=float)
+        keys = [content_key(n, d, t, tag="step") for n, d in zip(num, den)]
+
+        entries = [self.get(k) for k in keys]
+        missing = [i for i, e in enumerate(entries) if e is None]
+        if missing:
+            self.misses += len(missing)
+            Y = step_responses(num[missing], den[missing], t)
+            P = poles(den[missing])
+            for i, y, p in zip(missing, Y, P):
+                entries[i] = {"y": y, "poles": p}
+                self.put(keys[i], entries[i])
+        return (np.array([e["y"] for e in entries]),
+                np.array([e["poles"] for e in entries]))
+
+
+_default = None
+
+
+def default_cache():
+    """Cache compartilhado pelos scripts.
+
+    O diretório em disco vem de ``LTC_CACHE_DIR`` (padrão: ``.ltc_cache`` na
+    raiz do repositório); ``LTC_CACHE_DIR=""`` desativa a camada em disco.
+    """
+    global _default
+    if _default is None:
+        directory = os.environ.get("LTC_CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".ltc_cache"))
+        _default = ResponseCache(directory=directory or None)
+    return _default
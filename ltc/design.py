@@ -0,0 +1,198 @@
+"""Ganhos que colocam os polos de malha fechada na região de projeto.
+
+Para L(s) = K N(s)/D(s) com realimentação unitária, procura os intervalos
+de K > 0 em que os polos dominantes de D(s) + K N(s) têm ζ ≥ ζ_alvo e
+Re(s) ≤ σ_alvo. As fronteiras são obtidas resolvendo diretamente o
+polinômio característico sobre as retas da fronteira da região (a reta
+vertical Re(s) = σ e as semirretas de ζ constante): em s = a + b x, K =
+-D(s)/N(s) precisa ser real, e Im(D(s) N*(s)) = 0 é um polinômio real em x.
+Entre duas fronteiras consecutivas a pertinência só muda onde muda o
+conjunto de polos dominantes; os testes de todas as estruturas vão num só
+lote.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .rootlocus import _closed_loop_roots
+from .simulation import pad_coefs
+
+
+class DesignRegion(NamedTuple):
+    intervals: np.ndarray  # intervalos [K_min, K_max] viáveis (m, 2); K_max pode ser inf
+    boundaries: np.ndarray  # ganhos em que algum polo cruza a fronteira da região
+
+    def gain(self, k_limit=1e6):
+        """Ganho no interior do intervalo viável de maiores ganhos; None se não há.
+
+        Os extremos são ganhos de fronteira (polos dominantes sobre a linha
+        de ζ ou de σ alvo, sem folga): devolve o ponto médio geométrico do
+        intervalo (aritmético se K_min = 0), com K_max limitado a ``k_limit``.
+        """
+        if not len(self.intervals):
+            return None
+        lo, hi = self.intervals[-1]
+        hi = min(hi, k_limit)
+        if lo >= hi:
+            return None
+        return float(np.sqrt(lo * hi) if lo > 0 else 0.5 * (lo + hi))
+
+
+def zeta_from_mp(mp_pct):
+    """ζ de 2ª ordem que dá a sobrelevação ``mp_pct`` (%)."""
+    mp = np.clip(mp_pct, 1e-9, 99.9) / 100.0
+    ln_mp = np.log(mp)
+    return -ln_mp / np.sqrt(np.pi**2 + ln_mp**2)
+
+
+def design_targets(mp_max, ts_max):
+    """(ζ_alvo, σ_alvo) para Mp máximo (%) e Ts máximo (2%): σ = -4/Ts."""
+    zeta = float(zeta_from_mp(mp_max))
+    wn = 4.0 / (zeta * ts_max)
+    return zeta, -zeta * wn
+
+
+def structure(kind, zeros=()):
+    """(num, den) do controlador K·C(s) para "P", "I", "PI" ou "PID".
+
+    ``zeros`` são os zeros fixos do controlador (um para PI, dois para PID);
+    o PI padrão é K(1 + 1/s), com zero em -1.
+    """
+    kind = kind.upper()
+    if kind == "P":
+        return np.ones(1), np.ones(1)
+    if kind == "I":
+        return np.ones(1), np.array([1.0, 0.0])
+    expected = {"PI": 1, "PID": 2}.get(kind)
+    if expected is None:
+        raise ValueError(f"estrutura desconhecida: {kind!r}")
+    zeros = (-1.0,) if kind == "PI" and not len(zeros) else zeros
+    if len(zeros) != expected:
+        raise ValueError(f"{kind} precisa de {expected} zero(s) fixo(s)")
+    return np.real(np.poly(zeros)), np.array([1.0, 0.0])
+
+
+def _compose(p, a, b):
+    # coeficientes crescentes em x de p(a + b x), p em potências decrescentes
+    out = np.zeros(1, dtype=complex)
+    for c in p:
+        out = np.polynomial.polynomial.polymul(out, [a, b])
+        out[0] += c
+    return out
+
+
+def _line_crossings(num, den, a, b):
+    # ganhos K > 0 em que D(s) + K N(s) tem raiz em s = a + b x, x ≥ 0
+    P = np.polynomial.polynomial
+    d, n = _compose(den, a, b), _compose(num, a, b)
+    im = P.polymul(d, np.conj(n)).imag
+    im[np.abs(im) < 1e-12 * np.abs(im).max(initial=1.0)] = 0.0
+    x = P.polyroots(P.polytrim(im)) if np.any(im) else np.array([])
+    x = np.unique(np.concatenate([[0.0], x[np.abs(x.imag) < 1e-7].real]))
+    x = x[x >= 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K = -P.polyval(x, d) / P.polyval(x, n)
+    ok = np.isfinite(K) & (np.abs(K.imag) <= 1e-7 * np.abs(K)) & (K.real > 0)
+    return K.real[ok]
+
+
+def _dominant(roots, zeros, dominance, cancel):
+    # polos dominantes de cada linha: fora os quase cancelados por um zero
+    # (distância ≤ cancel·|z|) e os com parte real além de dominance × a do
+    # polo mais lento que sobrou (todos, com dominance=None)
+    keep = np.ones(roots.shape, dtype=bool)
+    if cancel and zeros.size:
+        gap = np.abs(roots[..., None] - zeros)
+        keep = ~np.any(gap <= cancel * np.maximum(np.abs(zeros), 1e-12), axis=-1)
+        keep[~keep.any(axis=-1)] = True
+    if dominance is None:
+        return keep
+    slow = np.max(np.where(keep, roots.real, -np.inf), axis=-1, keepdims=True)
+    return keep & (roots.real >= np.where(slow < 0, dominance * slow, slow))
+
+
+def _inside(roots, zeta, sigma, mask, tol=1e-9):
+    scale = np.maximum(np.abs(roots), 1.0)
+    re = roots.real
+    ok_sigma = re <= sigma + tol * scale
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ok_zeta = (-re >= zeta * np.abs(roots) - tol * scale)
+    return np.all((ok_sigma & ok_zeta) | ~mask, axis=-1)
+
+
+def _members(jobs, zeta, sigma, dominance, cancel):
+    # pertinência (K,) à região de cada job (N, D, K, zeros), num só lote
+    roots = _closed_loop_roots([job[:3] for job in jobs])
+    return [_inside(R, zeta, sigma, _dominant(R, job[3], dominance, cancel))
+            for R, job in zip(roots, jobs)]
+
+
+def _samples(edges, n):
+    # n ganhos em progressão geométrica dentro de cada trecho entre fronteiras
+    # (o último trecho, até ∞, é amostrado até 10⁴·max(K_n, 1))
+    lo = np.where(edges[:-1] > 0, edges[:-1], 1e-6 * np.minimum(edges[1], 1.0))
+    hi = np.where(np.isfinite(edges[1:]), edges[1:], 1e4 * np.maximum(edges[:-1], 1.0))
+    return np.exp(np.linspace(np.log(lo), np.log(hi), n + 2)[1:-1].T)  # (trechos, n)
+
+
+def design_gains(systems, zeta, sigma, dominance=5.0, cancel=0.05, samples=16, rtol=1e-10):
+    """Intervalos de K viáveis para vários L(s) = K N(s)/D(s) (pares (num, den)).
+
+    Retorna um ``DesignRegion`` por sistema. Os polos dominantes de malha
+    fechada precisam ter ζ ≥ ``zeta`` e Re(s) ≤ ``sigma`` (σ < 0): o par
+    mais lento e os polos com parte real até ``dominance`` vezes a dele;
+    polos a menos de ``cancel``·|z| de um zero z de L(s) (quase cancelados)
+    não contam. ``dominance=None`` e ``cancel=0`` exigem todos os polos na
+    região.
+
+    Fora das fronteiras da região, a pertinência só muda quando o conjunto
+    dominante muda: cada trecho é testado em ``samples`` ganhos e as trocas
+    entre amostras são localizadas por bissecção (tolerância relativa
+    ``rtol``); trechos dominantes mais curtos que o espaçamento das amostras
+    podem escapar.
+    """
+    theta = np.arccos(np.clip(zeta, 0.0, 1.0))
+    ray = np.exp(1j * (np.pi - theta))
+
+    jobs = []
+    for num, den in systems:
+        N, D = pad_coefs([num, den])
+        zeros = np.roots(np.trim_zeros(N, "f")) if np.count_nonzero(N) > 1 else np.zeros(0)
+        K = np.unique(np.concatenate([
+            _line_crossings(N, D, sigma, 1j),   # reta Re(s) = σ (x = ω)
+            _line_crossings(N, D, 0.0, ray),    # semirreta ζ constante (x = |s|)
+        ]))
+        edges = np.concatenate([[0.0], K, [np.inf]])
+        jobs.append((N, D, _samples(edges, samples).ravel(), zeros, K, edges))
+
+    out = []
+    for (N, D, Ks, zeros, K, edges), ok in zip(jobs, _members(jobs, zeta, sigma, dominance, cancel)):
+        Ks, ok = Ks.reshape(-1, samples), ok.reshape(-1, samples)
+        starts, states = [], []
+        for j in range(Ks.shape[0]):
+            starts.append(edges[j])
+            states.append(ok[j, 0])
+            # trocas do conjunto dominante entre amostras vizinhas
+            for i in np.flatnonzero(ok[j, 1:] != ok[j, :-1]):
+                a, b = Ks[j, i], Ks[j, i + 1]
+                while b - a > rtol * b:
+                    mid = np.sqrt(a * b)
+                    inside = _members([(N, D, np.array([mid]), zeros)], zeta, sigma,
+                                      dominance, cancel)[0][0]
+                    a, b = (mid, b) if inside == ok[j, i] else (a, mid)
+                starts.append(b)
+                states.append(ok[j, i + 1])
+        starts, states = np.array(starts), np.array(states)
+        ends = np.concatenate([starts[1:], [np.inf]])
+        # trechos viáveis consecutivos viram um único intervalo
+        first = states & ~np.concatenate([[False], states[:-1]])
+        last = states & ~np.concatenate([states[1:], [False]])
+        out.append(DesignRegion(np.column_stack([starts[first], ends[last]]),
+                                np.union1d(K, starts[1:])))
+    return out
+
+
+def design_gain(num, den, zeta, sigma, **options):
+    """Intervalos de K viáveis de um único L(s) (ver ``design_gains``)."""
+    return design_gains([(num, den)], zeta, sigma, **options)[0]
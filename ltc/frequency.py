@@ -0,0 +1,214 @@
+"""Resposta em frequência e margens de estabilidade em lote.
+
+H(jω) de todos os sistemas (um por linha de coeficientes) sobre uma grade ω
+compartilhada sai de uma única passada de Horner vetorizada, em aritmética
+real (partes par e ímpar dos polinômios). As margens não
+dependem da grade: as frequências de cruzamento são raízes reais positivas
+de polinômios em ω (|N|² - |D|² para o ganho, Im(N D*) para a fase),
+calculadas em lote e polidas por Newton.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .simulation import pad_coefs, poles
+
+
+class Bode(NamedTuple):
+    w: np.ndarray       # frequências (W,) em rad/s
+    mag: np.ndarray     # |H| (M, W)
+    mag_db: np.ndarray  # 20 log10 |H| (M, W)
+    phase: np.ndarray   # fase desenrolada em graus (M, W)
+
+
+class Margins(NamedTuple):
+    gm: np.ndarray   # margem de ganho (razão; inf se a fase não cruza -180°)
+    pm: np.ndarray   # margem de fase em graus (inf se |H| não cruza 1)
+    wcg: np.ndarray  # frequência de cruzamento de fase (nan se não há)
+    wcp: np.ndarray  # frequência de cruzamento de ganho (nan se não há)
+
+
+def _rows(num, den):
+    num = np.atleast_2d(np.asarray(num, dtype=float))
+    den = np.atleast_2d(np.asarray(den, dtype=float))
+    width = max(num.shape[1], den.shape[1])
+    num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+    den = np.pad(den, ((0, 0), (width - den.shape[1], 0)))
+    return np.broadcast_arrays(num, den)
+
+
+def horner(coefs, x):
+    """Avalia polinômios reais (M, n+1) em pontos reais x (W,), devolvendo (M, W)."""
+    coefs = np.atleast_2d(coefs)
+    out = np.empty((coefs.shape[0], np.size(x)), dtype=np.result_type(coefs, x))
+    out[:] = coefs[:, :1]
+    for c in coefs.T[1:]:
+        out *= x
+        out += c[:, None]
+    return out
+
+
+def _parts_jw(coefs, w, dtype=np.float64):
+    # P(jω) = E(-ω²) + jω O(-ω²): partes real e imaginária por Horner real,
+    # cada uma com metade do grau
+    coefs = np.atleast_2d(np.asarray(coefs, dtype=dtype))
+    coefs = coefs[:, np.argmax(np.any(coefs != 0, axis=0)):]  # colunas só de zeros à esquerda
+    asc = coefs[:, ::-1]
+    w = np.asarray(w, dtype=dtype)
+    x = -w**2
+    re = horner(asc[:, 0::2][:, ::-1], x)
+    if asc.shape[1] > 1:
+        im = horner(asc[:, 1::2][:, ::-1], x)
+        im *= w
+    else:
+        im = np.zeros_like(re)
+    return re, im
+
+
+def eval_jw(coefs, w):
+    """P(jω) (M, W) de polinômios reais (M, n+1) em ω (W,)."""
+    re, im = _parts_jw(coefs, w)
+    return re + 1j * im
+
+
+def freq_response(num, den, w):
+    """H(jω) (M, W) de lotes num/den (1-D ou um sistema por linha)."""
+    num, den = _rows(num, den)
+    return eval_jw(num, w) / eval_jw(den, w)
+
+
+def bode(num, den, w=None, omega_limits=(0.1, 1000.0), n=1000, dtype=np.float64):
+    """Módulo e fase de lotes de sistemas numa grade log compartilhada.
+
+    Tudo em aritmética real: |H| = |N|/|D| e ∠H = ∠N - ∠D. A fase é
+    desenrolada ao longo de ω e deslocada de múltiplos de 360° para começar
+    em (-270°, 90°], como no ctrl.bode. ``dtype=np.float32`` calcula em
+    precisão simples (metade da memória, para varreduras grandes).
+    """
+    if w is None:
+        w = np.geomspace(omega_limits[0], omega_limits[1], n)
+    w = np.asarray(w, dtype=float)
+    num, den = _rows(num, den)
+    nr, ni = _parts_jw(num, w, dtype)
+    dr, di = _parts_jw(den, w, dtype)
+    phase = np.arctan2(ni, nr)
+    phase -= np.arctan2(di, dr)
+    # |H|² = (nr² + ni²)/(dr² + di²), reaproveitando os buffers
+    nr *= nr
+    ni *= ni
+    nr += ni
+    dr *= dr
+    di *= di
+    dr += di
+    nr /= dr
+    with np.errstate(divide="ignore"):
+        mag_db = 10.0 * np.log10(nr)
+    mag = np.sqrt(nr, out=nr)
+    # desenrolamento: saltos entre amostras vizinhas trazidos para (-π, π]
+    jump = np.diff(phase, axis=1)
+    jump -= 2.0 * np.pi * np.round(jump / (2.0 * np.pi))
+    np.cumsum(jump, axis=1, out=phase[:, 1:])
+    phase[:, 1:] += phase[:, :1]
+    np.degrees(phase, out=phase)
+    phase -= 360.0 * np.ceil((phase[:, :1] - 90.0) / 360.0)
+    return Bode(w, mag, mag_db, phase)
+
+
+def _split_jw(coefs):
+    # P(jω) = Pr(ω) + j Pi(ω); coeficientes crescentes em ω, por linha
+    asc = coefs[:, ::-1]
+    k = np.arange(asc.shape[1])
+    unit = 1j ** k
+    return asc * unit.real, asc * unit.imag
+
+
+def _polymul(a, b):
+    # produto linha a linha de polinômios (coeficientes crescentes)
+    out = np.zeros((a.shape[0], a.shape[1] + b.shape[1] - 1))
+    for k in range(b.shape[1]):
+        out[:, k:k + a.shape[1]] += a * b[:, k:k + 1]
+    return out
+
+
+def _rowwise(coefs, x):
+    # polinômio i (coeficientes crescentes) avaliado nos pontos x[i], (M, K)
+    out = np.zeros(x.shape, dtype=np.result_type(coefs, x))
+    for c in coefs.T[::-1]:
+        out *= x
+        out += c[:, None]
+    return out
+
+
+def _positive_roots(poly, rtol=1e-7):
+    # raízes reais positivas de cada linha (coeficientes crescentes), (M, K)
+    # com nan nas posições vazias; as linhas são agrupadas pelo grau efetivo e
+    # cada grupo vai numa única chamada de autovalores; depois, dois passos
+    # de Newton
+    scale = np.abs(poly).max(axis=1, keepdims=True)
+    scale[scale == 0] = 1.0
+    poly = np.where(np.abs(poly) > 1e-12 * scale, poly, 0.0)
+    nz = poly != 0
+    degree = np.where(nz.any(axis=1), poly.shape[1] - 1 - np.argmax(nz[:, ::-1], axis=1), 0)
+    out = np.full((poly.shape[0], max(int(degree.max()), 1)), np.nan)
+    for deg in np.unique(degree[degree > 0]):
+        rows = np.nonzero(degree == deg)[0]
+        c = poly[rows, :deg + 1]
+        r = poles(c[:, ::-1])
+        ok = (np.abs(r.imag) <= rtol * np.maximum(np.abs(r), 1.0)) & (r.real > 0)
+        x = np.where(ok, r.real, np.nan)
+        dc = c[:, 1:] * np.arange(1, deg + 1)
+        for _ in range(2):
+            d = _rowwise(dc, x)
+            x = np.where(d != 0, x - _rowwise(c, x) / np.where(d != 0, d, 1.0), x)
+        out[rows, :deg] = x
+    return out
+
+
+def _rowwise_jw(coefs, w):
+    # P(jω) com pontos por linha: coeficientes decrescentes (M, n+1), ω (M, K)
+    return _rowwise(coefs[:, ::-1].astype(complex), 1j * w)
+
+
+def stability_margins(num, den):
+    """Margens de ganho e de fase de L(s) = num/den (um sistema por linha).
+
+    Entre vários cruzamentos escolhe o mais crítico (menor |log gm| e menor
+    |pm|); ω = 0 conta como cruzamento de fase quando H(0) é real negativo,
+    como no ctrl.stability_margins. Para entradas 1-D devolve escalares.
+    """
+    single = np.ndim(num) == 1 and np.ndim(den) == 1
+    num, den = _rows(num, den)
+    nr, ni = _split_jw(num)
+    dr, di = _split_jw(den)
+    gain_poly = _polymul(nr, nr) + _polymul(ni, ni) - _polymul(dr, dr) - _polymul(di, di)
+    phase_poly = _polymul(ni, dr) - _polymul(nr, di)
+    rows = np.arange(num.shape[0])
+
+    wg = np.column_stack([np.zeros(num.shape[0]), _positive_roots(phase_poly)])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        H = _rowwise_jw(num, wg) / _rowwise_jw(den, wg)
+        g = 1.0 / np.abs(H)
+        score = np.where(np.isfinite(g) & (H.real < 0) & (g > 0), np.abs(np.log(g)), np.inf)
+    k = np.argmin(score, axis=1)
+    found = np.isfinite(score[rows, k])
+    gm = np.where(found, g[rows, k], np.inf)
+    wcg = np.where(found, wg[rows, k], np.nan)
+
+    wp = _positive_roots(gain_poly)
+    with np.errstate(invalid="ignore"):
+        margin = np.degrees(np.angle(-(_rowwise_jw(num, wp) / _rowwise_jw(den, wp))))
+        score = np.where(np.isnan(wp), np.inf, np.abs(margin))
+    k = np.argmin(score, axis=1)
+    found = np.isfinite(score[rows, k])
+    pm = np.where(found, margin[rows, k], np.inf)
+    wcp = np.where(found, wp[rows, k], np.nan)
+    if single:
+        return Margins(gm[0], pm[0], wcg[0], wcp[0])
+    return Margins(gm, pm, wcg, wcp)
+
+
+def margins_of(systems):
+    """``stability_margins`` para uma lista de pares (num, den) de graus variados."""
+    rows = pad_coefs([p for pair in systems for p in pair])
+    return stability_margins(rows[0::2], rows[1::2])
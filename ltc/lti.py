@@ -0,0 +1,165 @@
+"""Lotes de sistemas SISO guardados como arrays de coeficientes.
+
+``LTIBatch`` guarda M funções de transferência como duas matrizes contíguas
+(M, n+1) de coeficientes em potências decrescentes de s, com zeros à
+esquerda nos sistemas de ordem menor; um milhão de sistemas de 3ª ordem
+ocupam 64 MB. As operações (polos, zeros, ganho DC, série, realimentação,
+resposta ao degrau) são vetorizadas sobre o lote; as que dependem da ordem
+(raízes, realização de estado) agrupam as linhas de mesma ordem efetiva. A
+conversão de e para o python-control fica nas bordas.
+"""
+
+import control as ctrl
+import numpy as np
+
+from .frequency import _polymul
+from .polezero import _by_degree, _degrees, batch_roots
+from .simulation import companion, forced_responses, pad_coefs, step_responses
+
+
+def _pair_rows(a, b):
+    # alinha dois lotes para operações linha a linha (lote de 1 é repetido)
+    M = max(a.shape[0], b.shape[0])
+    return np.broadcast_to(a, (M, a.shape[1])), np.broadcast_to(b, (M, b.shape[1]))
+
+
+class LTIBatch:
+    """M sistemas SISO N(s)/D(s) em arrays de coeficientes (M, n+1).
+
+    ``num`` e ``den`` são 1-D (um sistema) ou 2-D (um por linha); linhas
+    com graus diferentes são completadas com zeros à esquerda. Os
+    numeradores não podem ter grau maior que os denominadores.
+    """
+
+    __slots__ = ("num", "den", "_ss")
+
+    def __init__(self, num, den):
+        num = np.atleast_2d(np.asarray(num, dtype=float))
+        den = np.atleast_2d(np.asarray(den, dtype=float))
+        width = max(num.shape[1], den.shape[1])
+        num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+        den = np.pad(den, ((0, 0), (width - den.shape[1], 0)))
+        num, den = np.broadcast_arrays(num, den)
+        # colunas de zeros à esquerda comuns a todas as linhas não guardam nada
+        used = np.any((num != 0) | (den != 0), axis=0)
+        first = int(np.argmax(used)) if used.any() else width - 1
+        self.num = np.ascontiguousarray(num[:, first:])
+        self.den = np.ascontiguousarray(den[:, first:])
+        if np.any(_degrees(self.num) > _degrees(self.den)):
+            raise ValueError("numerador de grau maior que o denominador")
+        self._ss = None
+
+    @classmethod
+    def from_pairs(cls, systems):
+        """Lote a partir de uma lista de pares (num, den)."""
+        rows = pad_coefs([p for pair in systems for p in pair])
+        return cls(rows[0::2], rows[1::2])
+
+    @classmethod
+    def from_ctrl(cls, systems):
+        """Lote a partir de sistemas SISO do python-control (tf ou ss)."""
+        if isinstance(systems, ctrl.LTI):
+            systems = [systems]
+        pairs = []
+        for sys in systems:
+            tf = ctrl.tf(sys)
+            pairs.append((np.asarray(tf.num[0][0], dtype=float), np.asarray(tf.den[0][0], dtype=float)))
+        return cls.from_pairs(pairs)
+
+    def to_ctrl(self, index=None):
+        """``ctrl.TransferFunction`` do sistema ``index`` ou lista de todos."""
+        if index is None:
+            return [self.to_ctrl(i) for i in range(len(self))]
+        return ctrl.TransferFunction(*self.pair(index))
+
+    def pair(self, index):
+        """(num, den) do sistema ``index``, sem zeros à esquerda."""
+        num = np.trim_zeros(self.num[index], "f")
+        return (num if num.size else np.zeros(1)), np.trim_zeros(self.den[index], "f")
+
+    def pairs(self):
+        return [self.pair(i) for i in range(len(self))]
+
+    def __len__(self):
+        return self.den.shape[0]
+
+    def __getitem__(self, index):
+        if np.ndim(index) == 0 and not isinstance(index, slice):
+            index = [index]
+        return LTIBatch(self.num[index], self.den[index])
+
+    def __repr__(self):
+        return f"LTIBatch({len(self)} sistemas, ordem ≤ {self.den.shape[1] - 1})"
+
+    @property
+    def orders(self):
+        """Ordem (grau do denominador) de cada sistema."""
+        return _degrees(self.den)
+
+    def poles(self):
+        """Polos (M, n) ordenados como em ``sort_poles``; nan nos de ordem menor."""
+        return batch_roots(self.den)
+
+    def zeros(self):
+        """Zeros (M, m), com nan completando as linhas de menos zeros."""
+        return batch_roots(self.num)
+
+    def dc_gain(self):
+        """N(0)/D(0): ±inf com integrador, nan se N(0) = D(0) = 0 (como ctrl.dcgain)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.num[:, -1] / self.den[:, -1]
+
+    def series(self, other):
+        """Produto self·other, linha a linha (um dos lotes pode ter 1 sistema)."""
+        other = other if isinstance(other, LTIBatch) else LTIBatch(*other)
+        num = _polymul(*_pair_rows(self.num, other.num))
+        den = _polymul(*_pair_rows(self.den, other.den))
+        return LTIBatch(num, den)
+
+    def feedback(self, other=None, sign=-1):
+        """Malha fechada self/(1 - sign·self·other); ``other=None`` é unitária."""
+        if other is None:
+            return LTIBatch(self.num, self.den - sign * self.num)
+        other = other if isinstance(other, LTIBatch) else LTIBatch(*other)
+        num = _polymul(*_pair_rows(self.num, other.den))
+        den = _polymul(*_pair_rows(self.den, other.den))
+        loop = _polymul(*_pair_rows(self.num, other.num))
+        return LTIBatch(num, den - sign * loop)
+
+    def ss(self):
+        """Realização canônica controlável (A, B, C, D) em pilhas, como ``companion``.
+
+        Exige todos os sistemas da mesma ordem; o resultado fica guardado.
+        """
+        if self._ss is None:
+            degree = self.orders
+            if np.any(degree != degree[0]):
+                raise ValueError("realização em pilha exige sistemas da mesma ordem")
+            first = self.den.shape[1] - 1 - int(degree[0])
+            self._ss = companion(self.num[:, first:], self.den[:, first:])
+        return self._ss
+
+    def step(self, t):
+        """Respostas ao degrau (M, len(t)); cada ordem é simulada num só lote."""
+        t = np.asarray(t, dtype=float)
+        Y = np.empty((len(self), t.size))
+        for deg, rows in _by_degree(self.den).items():
+            first = self.den.shape[1] - 1 - deg
+            Y[rows] = step_responses(self.num[rows, first:], self.den[rows, first:], t)
+        return Y
+
+    def forced(self, t, u, hold="foh"):
+        """Respostas a entradas arbitrárias numa grade uniforme, por ordem.
+
+        ``u`` segue ``forced_responses``: (T,) ou (M, T) dá (M, T); (M, R, T)
+        ou (1, R, T) dá (M, R, T), cada sistema sob as R entradas.
+        """
+        t = np.asarray(t, dtype=float)
+        u = np.asarray(u, dtype=float)
+        shared = u.ndim == 1 or u.shape[0] == 1
+        Y = np.empty((len(self),) + (u.shape[1:] if u.ndim == 3 else (t.size,)))
+        for deg, rows in _by_degree(self.den).items():
+            first = self.den.shape[1] - 1 - deg
+            Y[rows] = forced_responses(self.num[rows, first:], self.den[rows, first:], t,
+                                       u if shared else u[rows], hold)
+        return Y
@@ -0,0 +1,254 @@
+"""Métricas de resposta temporal (tempo de acomodação, sobressinal, ...).
+
+Todas as funções aceitam um sinal 1-D ou uma matriz 2-D com uma resposta por
+linha. O vetor de tempo pode ser compartilhado (1-D) ou ter uma linha por
+resposta (2-D).
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+# campos devolvidos por step_metrics (um registro por resposta)
+STEP_METRICS = np.dtype([
+    ("y_final", float),  # valor final (média das n_tail últimas amostras)
+    ("y_peak", float),   # valor de pico
+    ("t_peak", float),   # instante do pico
+    ("Mp", float),       # sobressinal [%] em relação ao alvo
+    ("Ts", float),       # tempo de acomodação (NaN se não acomoda)
+    ("Tr", float),       # tempo de subida 10%-90% do alvo (NaN se não sobe)
+    ("e_ss", float),     # erro em regime (referência - y_final)
+])
+
+
+def _per_row(value):
+    # escalar ou um valor por linha -> broadcast contra (..., n_amostras)
+    return np.asarray(value, dtype=float)[..., None]
+
+
+def _time_at(time, idx):
+    # tempo no índice idx de cada linha (vetor de tempo 1-D ou 2-D)
+    idx = np.maximum(idx, 0)
+    if time.ndim == 1:
+        return time[idx]
+    return np.take_along_axis(time, np.asarray(idx)[..., None], axis=-1)[..., 0]
+
+
+def _first_index(mask):
+    # primeiro índice True de cada linha, -1 se não houver
+    return np.where(mask.any(axis=-1), np.argmax(mask, axis=-1), -1)
+
+
+def settling_index(signal, low, high):
+    """Índice a partir do qual o sinal permanece dentro de [low, high].
+
+    É o índice seguinte à última saída da faixa, encontrado numa única
+    varredura reversa (O(n)). ``low``/``high`` podem ser escalares ou ter um
+    valor por linha. Retorna -1 onde o sinal termina fora da faixa.
+    """
+    y = np.asarray(signal)
+    n = y.shape[-1]
+    if n == 0:
+        return np.full(y.shape[:-1], -1, dtype=np.intp)[()]
+    outside = ~((y >= _per_row(low)) & (y <= _per_row(high)))
+    rev = outside[..., ::-1]
+    last_out = n - 1 - np.argmax(rev, axis=-1)
+    idx = np.where(rev.any(axis=-1), last_out + 1, 0)
+    idx = np.where(idx < n, idx, -1)
+    return idx[()]
+
+
+def first_persistent_time(signal, time, low, high):
+    """Primeiro instante em que o sinal entra na faixa e não sai mais.
+
+    Para um sinal 1-D retorna o tempo (ou None se não acomoda); para uma
+    matriz 2-D retorna um array com NaN nas respostas que não acomodam.
+    """
+    time = np.asarray(time)
+    idx = settling_index(signal, low, high)
+    if np.ndim(idx) == 0:
+        return _time_at(time, idx) if idx >= 0 else None
+    return np.where(idx >= 0, _time_at(time, idx), np.nan)
+
+
+def step_metrics(responses, time, band=(0.982, 1.02), target=None, n_tail=1,
+                 fallback=False):
+    """Métricas da resposta ao degrau de uma ou várias respostas.
+
+    ``responses`` é (N_sistemas x N_amostras) ou 1-D. Sobressinal e faixa de
+    acomodação (``band`` em fração do alvo) são relativos a ``target``; com
+    ``target=None`` usa-se o valor final de cada resposta. Com ``fallback``,
+    respostas que não acomodam recebem o primeiro instante em que atingem o
+    limite inferior da faixa. Retorna um array estruturado ``STEP_METRICS``
+    (um registro escalar para entrada 1-D).
+    """
+    y = np.asarray(responses, dtype=float)
+    single = y.ndim == 1
+    Y = np.atleast_2d(y)
+    time = np.asarray(time, dtype=float)
+    T = time if time.ndim == 1 else np.atleast_2d(time)
+    rows = np.arange(Y.shape[0])
+
+    out = np.empty(Y.shape[0], dtype=STEP_METRICS)
+    y_final = Y[:, -n_tail:].mean(axis=1)
+    if target is None:
+        ref = y_final
+    else:
+        ref = np.broadcast_to(np.asarray(target, dtype=float), y_final.shape)
+    denom = np.where(np.abs(ref) > 1e-12, np.abs(ref), 1.0)
+    # pico e subida medidos no sentido do alvo (alvos negativos invertem)
+    sign = np.where(ref < 0, -1.0, 1.0)
+
+    i_peak = np.argmax(Y * sign[:, None], axis=1)
+    y_peak = Y[rows, i_peak]
+    out["y_final"] = y_final
+    out["y_peak"] = y_peak
+    out["t_peak"] = _time_at(T, i_peak)
+    out["Mp"] = sign * (y_peak - ref) / denom * 100.0
+    out["e_ss"] = (1.0 if target is None else ref) - y_final
+
+    # tempo de acomodação (faixa ordenada para alvos negativos)
+    low = np.minimum(band[0] * ref, band[1] * ref)
+    high = np.maximum(band[0] * ref, band[1] * ref)
+    idx = settling_index(Y, low, high)
+    if fallback:
+        idx = np.where(idx >= 0, idx, _first_index(Y >= low[:, None]))
+    out["Ts"] = np.where(idx >= 0, _time_at(T, idx), np.nan)
+
+    # tempo de subida 10%-90%
+    i10 = _first_index(Y * sign[:, None] >= 0.1 * np.abs(ref)[:, None])
+    i90 = _first_index(Y * sign[:, None] >= 0.9 * np.abs(ref)[:, None])
+    ok = (i10 >= 0) & (i90 >= 0)
+    out["Tr"] = np.where(ok, _time_at(T, i90) - _time_at(T, i10), np.nan)
+
+    return out[0] if single else out
+
+
+class Oscillation(NamedTuple):
+    t_peaks: np.ndarray   # instantes dos picos (interpolados)
+    y_peaks: np.ndarray   # valores dos picos (interpolados)
+    period: float         # período médio entre picos consecutivos (NaN se < 2)
+    decay_ratio: float    # razão média entre amplitudes sucessivas (NaN se < 2)
+
+
+def local_peaks(signal, time):
+    """Máximos locais estritos de um sinal 1-D, com interpolação parabólica.
+
+    Cada pico amostrado y[i-1] < y[i] > y[i+1] é refinado pelo vértice da
+    parábola pelos três pontos. Retorna (índices, t_pico, y_pico).
+    """
+    y = np.asarray(signal, dtype=float)
+    t = np.asarray(time, dtype=float)
+    idx = np.flatnonzero((y[1:-1] > y[:-2]) & (y[1:-1] > y[2:])) + 1
+    y0, y1, y2 = y[idx - 1], y[idx], y[idx + 1]
+    delta = 0.5 * (y0 - y2) / (y0 - 2.0 * y1 + y2)  # em amostras, |delta| < 0.5
+    # passo local (grades não uniformes: lado para o qual o vértice se desloca)
+    dt = np.where(delta >= 0, t[idx + 1] - t[idx], t[idx] - t[idx - 1])
+    return idx, t[idx] + delta * dt, y1 - 0.25 * (y0 - y2) * delta
+
+
+def oscillation(signal, time, baseline=None):
+    """Picos, período médio e razão de decaimento de uma resposta oscilatória.
+
+    A razão de decaimento é a média de (y_{k+1} - base) / (y_k - base) entre
+    picos sucessivos; sem ``baseline`` a base é a média do sinal entre o
+    primeiro e o último pico (centro da oscilação).
+    """
+    idx, t_pk, y_pk = local_peaks(signal, time)
+    if idx.size < 2:
+        return Oscillation(t_pk, y_pk, np.nan, np.nan)
+    if baseline is None:
+        baseline = float(np.mean(np.asarray(signal, dtype=float)[idx[0]:idx[-1]]))
+    amp = y_pk - baseline
+    return Oscillation(t_pk, y_pk, float(np.mean(np.diff(t_pk))),
+                       float(np.mean(amp[1:] / amp[:-1])))
+
+
+class RunningMetrics:
+    """Métricas de resposta ao degrau atualizadas bloco a bloco.
+
+    Para simulações em fluxo (ltc.simulation.step_chunks): cada ``update``
+    recebe um bloco (M, C) de respostas e o tempo (C,) correspondente, e a
+    memória não cresce com o horizonte. O pico, a última saída da faixa
+    (acomodação) e os instantes de 10%/90% são acumulados; o valor final é
+    estimado pela média das ``n_tail`` últimas amostras vistas.
+
+    A faixa é relativa a ``target`` (escalar ou um por resposta), que é
+    obrigatório: julgada contra a estimativa móvel do valor final, a
+    acomodação dos blocos já descartados não poderia ser refeita. Para o
+    alvo do valor final use o ganho DC (num[-1]/den[-1]), que ``step_metrics``
+    reproduz com ``target=None`` num horizonte já acomodado.
+    """
+
+    __slots__ = ("band", "target", "n_tail", "y_peak", "t_peak", "Ts", "_pending",
+                 "_t10", "_t90", "_tail")
+
+    def __init__(self, band=(0.982, 1.02), target=1.0, n_tail=1):
+        if target is None:
+            raise ValueError("RunningMetrics precisa de um alvo (ex.: o ganho DC)")
+        self.band = band
+        self.target = target
+        self.n_tail = n_tail
+        self.y_peak = self.t_peak = self.Ts = None
+        self._pending = self._t10 = self._t90 = self._tail = None
+
+    def _start(self, M):
+        # pico inicial no sentido oposto ao do alvo (-inf, ou +inf para alvos negativos)
+        sign = np.where(np.broadcast_to(np.asarray(self.target, dtype=float), (M,)) < 0, -1.0, 1.0)
+        self.y_peak = -sign * np.inf
+        self.t_peak = np.full(M, np.nan)
+        self.Ts = np.full(M, np.nan)
+        self._pending = np.ones(M, dtype=bool)  # última amostra vista fora da faixa
+        self._t10 = np.full(M, np.nan)
+        self._t90 = np.full(M, np.nan)
+        self._tail = np.empty((M, 0))
+
+    @property
+    def y_final(self):
+        return self._tail.mean(axis=1)
+
+    def update(self, t, y):
+        y = np.atleast_2d(np.asarray(y, dtype=float))
+        t = np.asarray(t, dtype=float)
+        if self.y_peak is None:
+            self._start(y.shape[0])
+        rows = np.arange(y.shape[0])
+        self._tail = np.concatenate([self._tail, y[:, -self.n_tail:]], axis=1)[:, -self.n_tail:]
+        ref = np.broadcast_to(np.asarray(self.target, dtype=float), (y.shape[0],))
+        sign = np.where(ref < 0, -1.0, 1.0)
+
+        i_peak = np.argmax(y * sign[:, None], axis=1)
+        better = y[rows, i_peak] * sign > self.y_peak * sign
+        self.y_peak = np.where(better, y[rows, i_peak], self.y_peak)
+        self.t_peak = np.where(better, t[i_peak], self.t_peak)
+
+        low = np.minimum(self.band[0] * ref, self.band[1] * ref)
+        high = np.maximum(self.band[0] * ref, self.band[1] * ref)
+        idx = settling_index(y, low, high)
+        exited = idx != 0  # alguma amostra do bloco fora da faixa
+        entered = (idx > 0) | (~exited & self._pending)
+        self.Ts = np.where(entered, t[np.maximum(idx, 0)], np.where(exited, np.nan, self.Ts))
+        self._pending = np.where(exited, idx < 0, False)
+
+        for level, attr in ((0.1, "_t10"), (0.9, "_t90")):
+            first = _first_index(y * sign[:, None] >= level * np.abs(ref)[:, None])
+            seen = getattr(self, attr)
+            setattr(self, attr, np.where(np.isnan(seen) & (first >= 0), t[first], seen))
+        return self
+
+    def result(self):
+        """Registros ``STEP_METRICS`` com o estado atual."""
+        out = np.empty(self.y_peak.size, dtype=STEP_METRICS)
+        y_final = self.y_final
+        ref = np.broadcast_to(np.asarray(self.target, dtype=float), y_final.shape)
+        denom = np.where(np.abs(ref) > 1e-12, np.abs(ref), 1.0)
+        sign = np.where(ref < 0, -1.0, 1.0)
+        out["y_final"] = y_final
+        out["y_peak"] = self.y_peak
+        out["t_peak"] = self.t_peak
+        out["Mp"] = sign * (self.y_peak - ref) / denom * 100.0
+        out["Ts"] = self.Ts
+        out["Tr"] = self._t90 - self._t10
+        out["e_ss"] = ref - y_final
+        return out
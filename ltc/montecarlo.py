@@ -0,0 +1,202 @@
+"""Monte Carlo de tolerâncias: envelopes e distribuições de respostas ao degrau.
+
+Os parâmetros (R, L, C de um circuito ou coeficientes de uma planta) são
+sorteados em torno do nominal e cada realização vira uma linha de um lote
+num/den. O horizonte é dividido em trechos independentes, distribuídos
+num pool de processos: cada trecho parte do estado exato no seu primeiro
+instante (x[k] por duplicação, como em ``StepStream``) e é simulado em
+janelas de poucas amostras para todas as realizações, de modo que a
+memória fica limitada a ~``memory`` números qualquer que seja o horizonte. De cada janela saem os percentis
+exatos da resposta em cada instante e resumos por realização (pico, última
+saída da faixa, cruzamentos de 10% e 90%) que, combinados em ordem, dão
+as mesmas métricas de ``step_metrics`` com o ganho DC como alvo.
+"""
+
+from functools import partial
+from math import ceil
+from os import cpu_count
+from typing import NamedTuple
+
+import numpy as np
+
+from .metrics import STEP_METRICS
+from .polezero import analyze
+from .simulation import _lift, _window_maps, discretize, uniform_step
+from .tuning import _pool
+
+# percentis padrão dos envelopes
+LEVELS = (1.0, 5.0, 25.0, 50.0, 75.0, 95.0, 99.0)
+
+
+def sample_parameters(nominal, tolerance, n, dist="uniform", seed=0):
+    """``n`` realizações (n, k) de parâmetros com tolerância relativa.
+
+    ``dist="uniform"`` sorteia em nominal·(1 ± tolerance); ``"normal"`` usa
+    desvio padrão tolerance/3 (a tolerância é o limite de 3σ).
+    """
+    nominal = np.asarray(nominal, dtype=float)
+    tol = np.broadcast_to(np.asarray(tolerance, dtype=float), nominal.shape)
+    rng = np.random.default_rng(seed)
+    if dist == "uniform":
+        rel = rng.uniform(-1.0, 1.0, (n,) + nominal.shape)
+    elif dist == "normal":
+        rel = rng.standard_normal((n,) + nominal.shape) / 3.0
+    else:
+        raise ValueError(f"distribuição desconhecida: {dist!r}")
+    return nominal * (1.0 + tol * rel)
+
+
+def rlc_coefs(R, L, C):
+    """(num, den) em lote de vC/Vin = 1/(LC s² + RC s + 1)."""
+    R, L, C = np.broadcast_arrays(*(np.asarray(x, dtype=float).ravel() for x in (R, L, C)))
+    return np.ones((R.size, 1)), np.column_stack([L * C, R * C, np.ones(R.size)])
+
+
+class MonteCarlo(NamedTuple):
+    t: np.ndarray         # (T,)
+    levels: np.ndarray    # percentis (Q,)
+    envelope: np.ndarray  # percentis de y em cada instante (Q, T)
+    wn: np.ndarray        # ωn de cada realização (N,)
+    zeta: np.ndarray      # ζ de cada realização (N,)
+    metrics: np.ndarray   # registros STEP_METRICS (N,), alvo = ganho DC
+
+    def percentiles(self, values, levels=None):
+        """Percentis (ignorando nan) de ``values``, nos ``levels`` do envelope."""
+        return np.nanpercentile(values, self.levels if levels is None else levels, axis=-1)
+
+
+def natural(den):
+    """(ωn, ζ) por linha: do polinômio em 2ª ordem, do polo dominante acima.
+
+    Para a s² + b s + c, ωn = √(c/a) e ζ = b/(2√(ac)) (ζ > 1 nos
+    superamortecidos); nas demais ordens, ωn e ζ do polo de maior parte real.
+    """
+    den = np.atleast_2d(np.asarray(den, dtype=float))
+    if den.shape[1] == 3 and np.all(den[:, 0] != 0):
+        a, b, c = den.T
+        with np.errstate(invalid="ignore"):
+            return np.sqrt(c / a), b / (2.0 * np.sqrt(a * c))
+    pa = analyze(den)
+    rows = np.arange(den.shape[0])
+    dominant = np.argmax(np.where(np.isnan(pa.poles), -np.inf, pa.poles.real), axis=1)
+    return pa.wn[rows, dominant], pa.zeta[rows, dominant]
+
+
+def _align(num, den):
+    # lotes num/den contíguos com as mesmas linhas e colunas
+    num = np.atleast_2d(np.asarray(num, dtype=float))
+    den = np.atleast_2d(np.asarray(den, dtype=float))
+    width = max(num.shape[1], den.shape[1])
+    num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+    den = np.pad(den, ((0, 0), (width - den.shape[1], 0)))
+    return tuple(np.ascontiguousarray(a) for a in np.broadcast_arrays(num, den))
+
+
+def _quantiles(Y, levels):
+    # percentis (Q, w) de cada linha de Y (w, M), interpolação linear como
+    # em np.percentile; ordenar a linha inteira sai mais barato que selecionar
+    Y = np.sort(Y, axis=1)
+    pos = np.asarray(levels) / 100.0 * (Y.shape[1] - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, Y.shape[1] - 1)
+    a, b = Y[:, lo].T, Y[:, hi].T
+    return a + (b - a) * (pos - lo)[:, None]
+
+
+def _segment(num, den, dt, band, levels, memory, span):
+    # percentis e resumos por realização das amostras span = (início, fim)
+    start, stop = span
+    Phi, Gam, C, D, _, _ = discretize(num, den, dt)
+    M, n = C.shape
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ref = num[:, -1] / den[:, -1]
+    sign = np.where(ref < 0, -1.0, 1.0)
+    low = np.minimum(band[0] * ref, band[1] * ref)
+    high = np.maximum(band[0] * ref, band[1] * ref)
+
+    # janelas de ``width`` amostras: y = C Φ^i x + C S_i + D para todas as
+    # realizações de uma vez, e o estado salta a janela com (Φ^w, S_w)
+    width = max(1, min(stop - start, memory // (M * (n + 1))))
+    O, F = _window_maps(Phi, Gam, C, D, width)
+    P, S = _lift(Phi, Gam, width)
+    x = _lift(Phi, Gam, start)[1]
+    pct = np.empty((len(levels), stop - start))
+    peak = np.full(M, -np.inf)
+    i_peak = np.zeros(M, dtype=np.intp)
+    last_out = np.full(M, -1)
+    cross = np.full((2, M), -1)
+    for k0 in range(start, stop, width):
+        r = min(width, stop - k0)
+        Y = np.einsum("imn,mn->im", O[:r], x) + F[:r]  # (r, M)
+        x = np.einsum("mjk,mk->mj", P, x) + S
+        pct[:, k0 - start:k0 - start + r] = _quantiles(Y, levels)
+        # os argmax (caros ao longo do tempo) só nas colunas que mudam
+        Ys = Y * sign
+        top = Ys.max(axis=0)
+        j = np.flatnonzero(top > peak)
+        peak[j] = top[j]
+        i_peak[j] = k0 + np.argmax(Ys[:, j], axis=0)
+        out = (Y < low) | (Y > high)
+        j = np.flatnonzero(out.any(axis=0))
+        last_out[j] = k0 + r - 1 - np.argmax(out[::-1, j], axis=0)
+        for row, level in zip(cross, (0.1, 0.9)):
+            j = np.flatnonzero(row < 0)
+            if j.size:
+                hit = Ys[:, j] >= level * np.abs(ref[j])
+                row[j] = np.where(hit.any(axis=0), k0 + np.argmax(hit, axis=0), -1)
+    return pct, sign * peak, i_peak, last_out, cross, Y[-1]
+
+
+def monte_carlo(num, den, t, levels=LEVELS, band=(0.982, 1.02), processes=None,
+                memory=2**22, spans=None):
+    """Envelopes e métricas das respostas ao degrau de N realizações num/den.
+
+    ``t`` é uma grade uniforme começando em 0. O horizonte é dividido em
+    ``spans`` trechos (padrão: 4 por processo) avaliados em ``processes``
+    processos (1: em série); o resultado não depende da divisão. Métricas
+    como em ``step_metrics(..., target=ganho DC)``.
+    """
+    num, den = _align(num, den)
+    t = np.asarray(t, dtype=float)
+    dt = uniform_step(t) if t.size > 1 else 1.0
+    levels = np.asarray(levels, dtype=float)
+    T, M = t.size, num.shape[0]
+    if spans is None:
+        spans = 1 if processes == 1 else 4 * (processes or cpu_count() or 1)
+    size = ceil(T / max(1, min(spans, T)))
+    bounds = [(k, min(k + size, T)) for k in range(0, T, size)]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ref = num[:, -1] / den[:, -1]
+    sign = np.where(ref < 0, -1.0, 1.0)
+
+    job = partial(_segment, num, den, dt, band, levels, memory)
+    pct = np.empty((levels.size, T))
+    peak = np.full(M, np.nan)
+    i_peak = np.zeros(M, dtype=np.intp)
+    last_out = np.full(M, -1)
+    cross = np.full((2, M), -1)
+    with _pool(processes) as executor:
+        mapper = map if executor is None else executor.map
+        for (k0, k1), res in zip(bounds, mapper(job, bounds)):
+            p, pk, ipk, lo, cr, y_final = res
+            pct[:, k0:k1] = p
+            better = ~(sign * pk <= sign * peak)  # primeiro trecho ou pico maior
+            peak = np.where(better, pk, peak)
+            i_peak = np.where(better, ipk, i_peak)
+            last_out = np.where(lo >= 0, lo, last_out)
+            cross = np.where(cross < 0, cr, cross)
+
+    denom = np.where(np.abs(ref) > 1e-12, np.abs(ref), 1.0)
+    out = np.empty(M, dtype=STEP_METRICS)
+    out["y_final"] = y_final
+    out["y_peak"] = peak
+    out["t_peak"] = t[i_peak]
+    out["Mp"] = sign * (peak - ref) / denom * 100.0
+    settle = last_out + 1
+    out["Ts"] = np.where(settle < T, t[np.minimum(settle, T - 1)], np.nan)
+    ok = (cross >= 0).all(axis=0)
+    out["Tr"] = np.where(ok, t[cross[1]] - t[cross[0]], np.nan)
+    out["e_ss"] = ref - y_final
+    wn, zeta = natural(den)
+    return MonteCarlo(t, levels, pct, wn, zeta, out)
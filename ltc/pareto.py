@@ -0,0 +1,169 @@
+"""Exploração do espaço de ganhos PID e fronteira de Pareto (Ts, Mp, esforço).
+
+Uma amostra grande de ganhos (hipercubo latino ou Sobol, em escala log ao
+redor de um ponto base, tipicamente o de Ziegler–Nichols) é simulada em lotes,
+opcionalmente num pool de processos. Cada lote atualiza um arquivo de Pareto
+incremental, que guarda só os candidatos não dominados em (Ts, Mp, esforço).
+O melhor projeto para qualquer par (Ts_max, Mp_max) está sempre nesse
+conjunto (um candidato dominado nunca é mais rápido que quem o domina e é
+viável sempre que ele for), então a escolha para várias especificações
+não exige novas simulações.
+
+O arquivo é gravado em ``.npz`` com uma coluna por campo.
+"""
+
+from functools import partial
+
+import numpy as np
+from scipy.stats import qmc
+
+from .metrics import step_metrics
+from .simulation import PIDLoop
+from .tuning import BAND, _pool, cost
+
+COLUMNS = ("Kp", "Ki", "Kd", "Ts", "Mp", "effort")
+OBJECTIVES = ("Ts", "Mp", "effort")
+
+
+def sample_gains(base, n, span=(0.25, 4.0), method="sobol", seed=0):
+    """``n`` ganhos (n, 3) com multiplicadores log-uniformes de ``base`` em ``span``.
+
+    ``method`` é "sobol" (sequência de Sobol embaralhada; n potência de 2
+    evita o aviso de balanço da sequência) ou "lhs" (hipercubo latino).
+    """
+    if method == "sobol":
+        sampler = qmc.Sobol(3, scramble=True, seed=seed)
+    elif method == "lhs":
+        sampler = qmc.LatinHypercube(3, seed=seed)
+    else:
+        raise ValueError(f"amostragem desconhecida: {method!r}")
+    lo, hi = np.log(span[0]), np.log(span[1])
+    u = sampler.random(n)
+    return np.asarray(base, dtype=float) * np.exp(lo + (hi - lo) * u)
+
+
+def evaluate_objectives(num, den, t, gains, band=BAND):
+    """(Ts, Mp, esforço) por candidato, (M, 3); linhas com nan para os inválidos.
+
+    Ts e Mp seguem ``evaluate_batch``; o esforço é ∫u² dt do sinal de
+    controle ao degrau no horizonte ``t``, sem o impulso do derivativo.
+    """
+    t = np.asarray(t, dtype=float)
+    out = np.full((len(gains), 3), np.nan)
+    if len(gains) == 0:
+        return out
+    Y, U = PIDLoop(num, den).step_with_control(gains, t)
+    valid = np.isfinite(Y).all(axis=1) & np.isfinite(U).all(axis=1)
+    m = step_metrics(Y[valid], t, band=band, target=1.0, fallback=True)
+    out[valid, 0] = np.where(np.isfinite(m["Ts"]), m["Ts"], np.inf)
+    out[valid, 1] = m["Mp"]
+    out[valid, 2] = np.trapezoid(U[valid] ** 2, t, axis=1)
+    return out
+
+
+def _dominated(F, G):
+    # linhas de F dominadas por alguma linha de G (≤ em tudo, < em alguma)
+    le = (G[None, :, :] <= F[:, None, :]).all(axis=-1)
+    lt = (G[None, :, :] < F[:, None, :]).any(axis=-1)
+    return (le & lt).any(axis=1)
+
+
+def non_dominated(F):
+    """Máscara das linhas não dominadas de F (N, k); repetidas ficam só uma vez."""
+    F = np.asarray(F, dtype=float)
+    keep = ~_dominated(F, F)
+    # cópias idênticas não se dominam: fica a primeira de cada grupo
+    _, first = np.unique(F[keep], axis=0, return_index=True)
+    mask = np.zeros(len(F), dtype=bool)
+    mask[np.nonzero(keep)[0][first]] = True
+    return mask
+
+
+class ParetoArchive:
+    """Conjunto não dominado de candidatos, atualizado por lotes.
+
+    ``gains`` (N, 3) e ``objectives`` (N, 3) em (Ts, Mp, esforço), todos a
+    minimizar; a ordem das linhas segue a ordem de chegada.
+    """
+
+    __slots__ = ("gains", "objectives", "evaluated")
+
+    def __init__(self, gains=None, objectives=None, evaluated=0):
+        self.gains = np.empty((0, 3)) if gains is None else np.asarray(gains, dtype=float)
+        self.objectives = (np.empty((0, 3)) if objectives is None
+                           else np.asarray(objectives, dtype=float))
+        self.evaluated = evaluated  # candidatos válidos já oferecidos ao arquivo
+
+    def __len__(self):
+        return len(self.gains)
+
+    def add(self, gains, objectives):
+        """Acrescenta um lote; candidatos inválidos (nan) são descartados."""
+        gains = np.asarray(gains, dtype=float)
+        objectives = np.asarray(objectives, dtype=float)
+        ok = ~np.isnan(objectives).any(axis=1)
+        gains, objectives = gains[ok], objectives[ok]
+        self.evaluated += len(gains)
+        if not len(gains):
+            return
+        # o lote só é comparado ao arquivo (pequeno) e a si mesmo
+        new = non_dominated(objectives)
+        new &= ~_dominated(objectives, self.objectives)
+        old = ~_dominated(self.objectives, objectives[new])
+        self.gains = np.vstack([self.gains[old], gains[new]])
+        self.objectives = np.vstack([self.objectives[old], objectives[new]])
+
+    def designs(self):
+        """Candidatos como dicionários (Kp, Ki, Kd, Ts, Mp, effort), sem resposta."""
+        return [dict(zip(COLUMNS, map(float, row)))
+                for row in np.hstack([self.gains, self.objectives])]
+
+    def pick(self, ts_max, mp_max):
+        """(melhor viável por Ts, melhor inviável por custo), como em ``select``.
+
+        Empates ficam com o primeiro candidato do arquivo; qualquer um dos
+        dois pode ser None.
+        """
+        Ts, Mp = self.objectives[:, 0], self.objectives[:, 1]
+        feasible = (Ts < ts_max) & (Mp < mp_max)
+        designs = self.designs()
+        best = near = None
+        if feasible.any():
+            best = designs[np.flatnonzero(feasible)[np.argmin(Ts[feasible])]]
+        if (~feasible).any():
+            costs = [cost(designs[i], ts_max, mp_max) for i in np.flatnonzero(~feasible)]
+            near = designs[np.flatnonzero(~feasible)[np.argmin(costs)]]
+        return best, near
+
+    def save(self, path):
+        """Grava o arquivo em ``.npz`` compactado, uma coluna por campo."""
+        columns = np.hstack([self.gains, self.objectives]).T
+        np.savez_compressed(path, evaluated=self.evaluated, **dict(zip(COLUMNS, columns)))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            columns = np.column_stack([data[c] for c in COLUMNS])
+            evaluated = int(data["evaluated"])
+        return cls(columns[:, :3], columns[:, 3:], evaluated)
+
+
+def explore(num, den, t, base, n=4096, batch=512, span=(0.25, 4.0), method="sobol",
+            seed=0, band=BAND, processes=None, archive=None):
+    """Simula ``n`` ganhos amostrados ao redor de ``base`` e devolve o ``ParetoArchive``.
+
+    Os lotes de ``batch`` candidatos são avaliados em ``processes``
+    processos (1: em série) e entram no arquivo na ordem da amostra, de modo
+    que o resultado não depende do número de processos. Um ``archive``
+    existente é estendido.
+    """
+    archive = ParetoArchive() if archive is None else archive
+    gains = sample_gains(base, n, span, method, seed)
+    batches = [gains[i:i + batch] for i in range(0, n, batch)]
+    job = partial(evaluate_objectives, tuple(num), tuple(den), np.asarray(t, dtype=float),
+                  band=band)
+    with _pool(processes) as executor:
+        mapper = map if executor is None else executor.map
+        for g, objectives in zip(batches, mapper(job, batches)):
+            archive.add(g, objectives)
+    return archive
@@ -0,0 +1,42 @@
+"""Desenho com matplotlib dos resultados do pacote (lugar das raízes, Bode).
+
+Separado dos módulos de cálculo, que devolvem só arrays: matplotlib é
+importado apenas aqui.
+"""
+
+import matplotlib.pyplot as plt
+
+from .rootlocus import locus_window
+
+
+def plot_root_locus(locus, ax=None, window=True):
+    """Ramos, polos (x) e zeros (o) de um ``RootLocus``, no estilo do ctrl.rlocus."""
+    ax = plt.gca() if ax is None else ax
+    for branch in locus.roots.T:
+        ax.plot(branch.real, branch.imag, lw=1.5)
+    ax.plot(locus.poles.real, locus.poles.imag, "x", color="k", ms=8)
+    ax.plot(locus.zeros.real, locus.zeros.imag, "o", color="k", mfc="none", ms=7)
+    if window:
+        xlim, ylim = locus_window(locus)
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+    ax.set_xlabel("Real")
+    ax.set_ylabel("Imaginary")
+    return ax
+
+
+def plot_bode(bode, index=0, fig=None, title=None):
+    """Módulo (dB) e fase (graus) do sistema ``index`` de um ``Bode``."""
+    fig = plt.figure() if fig is None else fig
+    ax_mag, ax_phase = fig.subplots(2, 1, sharex=True)
+    ax_mag.semilogx(bode.w, bode.mag_db[index])
+    ax_phase.semilogx(bode.w, bode.phase[index])
+    ax_mag.set_ylabel("Magnitude [dB]")
+    ax_phase.set_ylabel("Phase [deg]")
+    ax_phase.set_xlabel("Frequency [rad/s]")
+    for ax in (ax_mag, ax_phase):
+        ax.grid(True, which="both")
+    ax_phase.set_xlim(bode.w[0], bode.w[-1])
+    if title is not None:
+        fig.suptitle(title)
+    return ax_mag, ax_phase
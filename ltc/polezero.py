@@ -0,0 +1,229 @@
+"""Polos em lote de famílias paramétricas de polinômios, com ωn, ζ e regime.
+
+Cada linha da matriz de coeficientes (potências decrescentes de s) é um
+polinômio; tipicamente uma coluna varia com o parâmetro (s² + a s + 1 para
+vários ``a``). Até a 4ª ordem as raízes vêm de fórmulas fechadas vetorizadas
+(Bhaskara, Cardano, Ferrari) seguidas de um passo de Newton; acima disso, de
+uma chamada de autovalores sobre as companheiras empilhadas. Linhas de
+graus diferentes são agrupadas pelo grau efetivo.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .simulation import companion, sort_poles
+
+# rótulos dos códigos de ``regime``
+REGIMES = (
+    "subamortecido",
+    "criticamente amortecido",
+    "superamortecido",
+    "marginalmente estável",
+    "instável",
+)
+UNDER, CRITICAL, OVER, MARGINAL, UNSTABLE = range(len(REGIMES))
+
+
+class PoleAnalysis(NamedTuple):
+    poles: np.ndarray   # polos (M, n) ordenados por parte real; nan nas linhas de grau menor
+    wn: np.ndarray      # |p| de cada polo (M, n)
+    zeta: np.ndarray    # -Re(p)/|p| de cada polo (M, n); nan em p = 0
+    regime: np.ndarray  # código do regime (M,), índice em REGIMES
+
+    @property
+    def labels(self):
+        """Rótulos de ``regime`` como array de strings."""
+        return np.take(np.array(REGIMES), self.regime)
+
+
+def family(*columns):
+    """Matriz de coeficientes (M, n+1) a partir de colunas escalares ou arrays.
+
+    ``family(1.0, a, 1.0)`` empilha s² + a s + 1 para cada valor de ``a``.
+    """
+    return np.column_stack(np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in columns)))
+
+
+def _degrees(P):
+    # grau efetivo de cada linha (-1 para o polinômio nulo)
+    nz = P != 0
+    return np.where(nz.any(axis=1), P.shape[1] - 1 - np.argmax(nz, axis=1), -1)
+
+
+def _by_degree(P):
+    # {grau: índices das linhas}, em ordem crescente de grau
+    deg = _degrees(P)
+    return {int(d): np.flatnonzero(deg == d) for d in np.unique(deg)}
+
+
+def _quadratic(b, c):
+    # raízes de x² + b x + c; a raiz de maior módulo sem cancelamento
+    disc = (b * b - 4.0 * c).astype(complex)
+    sq = np.sqrt(disc)
+    sq = np.where((sq.real * b.real + sq.imag * b.imag) < 0, -sq, sq)
+    q = -0.5 * (b + sq)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        other = np.where(q != 0, c / q, 0.0)
+    return np.stack([q, other], axis=-1)
+
+
+def _real_quadratic(b, c):
+    # como _quadratic para coeficientes reais, já na ordem de sort_poles:
+    # reais em ordem crescente, pares conjugados exatos com +j primeiro
+    disc = b * b - 4.0 * c
+    real = disc >= 0
+    sq = np.sqrt(np.abs(disc))
+    out = np.empty((b.size, 2), dtype=complex)
+    q = -0.5 * (b + np.copysign(sq, b))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        other = np.where(q != 0, c / q, 0.0)
+    out.real[:, 0] = np.where(real, np.minimum(q, other), -0.5 * b)
+    out.real[:, 1] = np.where(real, np.maximum(q, other), -0.5 * b)
+    out.imag[:, 0] = np.where(real, 0.0, 0.5 * sq)
+    out.imag[:, 1] = -out.imag[:, 0]
+    return out
+
+
+def _cubic(a, b, c):
+    # raízes de x³ + a x² + b x + c (Cardano em aritmética complexa)
+    p = b - a * a / 3.0
+    q = 2.0 * a**3 / 27.0 - a * b / 3.0 + c
+    sq = np.sqrt((q * q / 4.0 + p**3 / 27.0).astype(complex))
+    w = -q / 2.0 + sq
+    w2 = -q / 2.0 - sq
+    w = np.where(np.abs(w2) > np.abs(w), w2, w)
+    u = w ** (1.0 / 3.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.where(u != 0, -p / (3.0 * u), 0.0)
+    omega = np.exp(2j * np.pi / 3.0)
+    k = np.arange(3)
+    t = u[:, None] * omega**k + v[:, None] * omega**(-k)
+    return t - (a / 3.0)[:, None]
+
+
+def _quartic(a, b, c, d):
+    # raízes de x⁴ + a x³ + b x² + c x + d (Ferrari, cúbica resolvente)
+    a2 = a * a
+    p = b - 3.0 * a2 / 8.0
+    q = c - a * b / 2.0 + a2 * a / 8.0
+    r = d - a * c / 4.0 + a2 * b / 16.0 - 3.0 * a2 * a2 / 256.0
+    m = _cubic(p, p * p / 4.0 - r, -q * q / 8.0)
+    m = m[np.arange(m.shape[0]), np.argmax(np.abs(m), axis=1)]
+    s = np.sqrt(2.0 * m)
+    y = np.empty((a.size, 4), dtype=complex)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, sign in enumerate((1.0, -1.0)):
+            inner = np.sqrt(-(2.0 * p + 2.0 * m + sign * 2.0 * q / s))
+            y[:, 2 * i] = 0.5 * (sign * s + inner)
+            y[:, 2 * i + 1] = 0.5 * (sign * s - inner)
+    # biquadrada (q = 0 e m = 0): y² = raízes de z² + p z + r
+    bi = s == 0
+    if bi.any():
+        z = np.sqrt(_quadratic(p[bi].astype(complex), r[bi].astype(complex)))
+        y[bi] = np.concatenate([z, -z], axis=1)
+    return y - (a / 4.0)[:, None]
+
+
+def _polish(coefs, x):
+    # um passo de Newton por raiz, aceito só se reduz |P(x)|
+    def horner(c, x):
+        out = np.broadcast_to(c[:, :1], x.shape).astype(complex)
+        for col in c.T[1:]:
+            out = out * x + col[:, None]
+        return out
+
+    n = coefs.shape[1] - 1
+    dc = coefs[:, :-1] * np.arange(n, 0, -1)
+    px = horner(coefs, x)
+    dpx = horner(dc, x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        new = x - px / dpx
+    better = np.isfinite(new) & (np.abs(horner(coefs, new)) < np.abs(px))
+    return np.where(better, new, x)
+
+
+def _snap_real(x, rtol=1e-9):
+    # parte imaginária residual das fórmulas fechadas em raízes reais
+    tiny = np.abs(x.imag) <= rtol * np.maximum(np.abs(x), 1.0)
+    return np.where(tiny, x.real + 0j, x)
+
+
+def batch_roots(coefs):
+    """Raízes de cada linha de ``coefs`` (M, n+1), (M, grau máximo) complexas.
+
+    Ordenadas como em ``sort_poles``; linhas de grau menor completadas com
+    nan. Fórmulas fechadas até grau 4, autovalores acima.
+    """
+    P = np.atleast_2d(np.asarray(coefs, dtype=float))
+    width = max(int(_degrees(P).max(initial=0)), 0)
+    out = np.full((P.shape[0], width), np.nan, dtype=complex)
+    for deg, rows in _by_degree(P).items():
+        if deg <= 0:
+            continue
+        c = P[rows, P.shape[1] - 1 - deg:]
+        if deg > 4:
+            A, _, _, _ = companion(np.ones(1), c)
+            r = np.linalg.eigvals(A).astype(complex)
+        else:
+            m = c[:, 1:] / c[:, :1]  # mônico
+            if deg <= 2:
+                # fórmulas exatas a menos de arredondamento, já ordenadas
+                r = -m if deg == 1 else _real_quadratic(m[:, 0], m[:, 1])
+                out[rows, :deg] = r + 0.0  # -0.0 -> 0.0
+                continue
+            if deg == 3:
+                r = _cubic(m[:, 0], m[:, 1], m[:, 2])
+            else:
+                r = _quartic(m[:, 0], m[:, 1], m[:, 2], m[:, 3])
+            r = _snap_real(_polish(c, r))
+        out[rows, :deg] = sort_poles(r) + 0.0
+    return out
+
+
+def damping(p):
+    """(ωn, ζ) de cada polo: ωn = |p| e ζ = -Re(p)/|p| (nan em p = 0)."""
+    p = np.asarray(p, dtype=complex)
+    wn = np.abs(p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeta = np.where(wn > 0, -p.real / wn, np.nan)
+    return wn, zeta
+
+
+def classify(p, rtol=1e-6):
+    """Código de regime por linha de polos (M, n), ver ``REGIMES``.
+
+    Algum polo com Re > 0 é instável; sobre o eixo jω, marginalmente
+    estável. Os estáveis são subamortecidos se há polo complexo,
+    criticamente amortecidos se há polos reais repetidos (a menos de
+    ``rtol``) e superamortecidos caso contrário. Entradas nan são ignoradas.
+    """
+    p = np.atleast_2d(np.asarray(p, dtype=complex))
+    valid = ~np.isnan(p)
+    scale = np.where(valid, np.maximum(np.abs(p), 1.0), 1.0)
+    tol = rtol * scale
+    re = np.where(valid, p.real, -np.inf)
+    is_real = valid & (np.abs(p.imag) <= tol)
+    unstable = (re > tol).any(axis=1)
+    marginal = (np.abs(re) <= tol).any(axis=1)
+    complex_ = (valid & ~is_real).any(axis=1)
+    # repetidos: vizinhos na ordenação por parte real (os polos já vêm ordenados)
+    r = np.where(is_real, p.real, np.nan)
+    r = np.sort(r, axis=1)
+    with np.errstate(invalid="ignore"):
+        gap = np.abs(np.diff(r, axis=1)) <= rtol * np.maximum(np.abs(r[:, 1:]), 1.0)
+    repeated = gap.any(axis=1)
+
+    code = np.full(p.shape[0], OVER, dtype=np.int8)
+    code[repeated] = CRITICAL
+    code[complex_] = UNDER
+    code[marginal] = MARGINAL
+    code[unstable] = UNSTABLE
+    return code
+
+
+def analyze(den, rtol=1e-6):
+    """Polos, ωn, ζ e regime de cada linha de ``den`` (``PoleAnalysis``)."""
+    p = batch_roots(den)
+    wn, zeta = damping(p)
+    return PoleAnalysis(p, wn, zeta, classify(p, rtol))
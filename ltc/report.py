@@ -0,0 +1,204 @@
+"""Geração headless das figuras de todas as atividades.
+
+Cada script roda uma única vez, no processo principal, com o backend Agg;
+``plt.show`` e ``plt.savefig`` são interceptados e apenas registram a
+figura (serializada com pickle) e o hash do seu conteúdo (dados das curvas,
+textos, limites, tamanho e opções de gravação). A rasterização, que é a
+parte cara, vai para um pool de processos e só acontece para figuras cujo
+hash mudou ou cujo arquivo não existe. O manifesto ``manifest.json`` no
+diretório de saída guarda, por figura, script, caminho e hash.
+
+Uso, a partir da raiz do repositório::
+
+    python -m ltc.report [scripts ...] [--out imagens] [--processes N] [--force]
+
+Figuras gravadas pelo próprio script com ``savefig`` mantêm o nome dado
+(relativo à raiz); as exibidas com ``show`` vão para ``--out`` como
+``<atividade>_<script>_<n>.png``.
+"""
+
+import argparse
+import hashlib
+import json
+import pickle
+import runpy
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+# resolve o backend já aqui: o pyplot o carrega preguiçosamente e, ao fazê-lo,
+# reescreve plt.show, que fica substituído durante a execução dos scripts
+plt.switch_backend("Agg")
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = "manifest.json"
+
+
+def _relative(path):
+    # caminho relativo à raiz do repositório, quando está dentro dela
+    path = Path(path).resolve()
+    return path.relative_to(ROOT) if path.is_relative_to(ROOT) else path
+
+
+def _update(h, value):
+    if isinstance(value, np.ndarray) or isinstance(value, (list, tuple)) and value \
+            and not isinstance(value[0], str):
+        try:
+            a = np.ascontiguousarray(np.asarray(value, dtype=float))
+        except (TypeError, ValueError):
+            h.update(repr(value).encode())
+            return
+        h.update(str(a.shape).encode())
+        h.update(a.tobytes())
+    else:
+        h.update(repr(value).encode())
+
+
+def figure_key(fig, options=None):
+    """Hash do conteúdo de uma figura (o que muda o PNG), sem renderizá-la."""
+    h = hashlib.sha1(repr(sorted((options or {}).items())).encode())
+    _update(h, fig.get_size_inches())
+    for artist in fig.findobj():
+        h.update(type(artist).__name__.encode())
+        if not artist.get_visible():
+            continue
+        if hasattr(artist, "get_xydata"):
+            _update(h, artist.get_xydata())
+            _update(h, (artist.get_color(), artist.get_linestyle(), artist.get_linewidth(),
+                        artist.get_marker()))
+        if hasattr(artist, "get_text") and hasattr(artist, "get_position"):
+            _update(h, (artist.get_text(), artist.get_position()))
+        if hasattr(artist, "get_offsets"):
+            _update(h, artist.get_offsets())
+        if hasattr(artist, "get_paths") and not hasattr(artist, "get_xydata"):
+            for path in artist.get_paths():
+                _update(h, path.vertices)
+        if hasattr(artist, "get_xlim") and hasattr(artist, "get_ylim"):
+            _update(h, (artist.get_xlim(), artist.get_ylim(),
+                        artist.get_xscale(), artist.get_yscale()))
+        if hasattr(artist, "get_facecolor"):
+            _update(h, np.ravel(artist.get_facecolor()))
+    return h.hexdigest()
+
+
+class _Capture:
+    """Substitui plt.show/plt.savefig durante a execução de um script."""
+
+    def __init__(self, script, out_dir, dpi):
+        self.script = Path(script)
+        self.out_dir = Path(out_dir)
+        self.dpi = dpi
+        self.figures = []  # (caminho, hash, figura serializada, opções)
+        self._saved = set()
+        self._shown = 0
+
+    def _record(self, fig, path, options):
+        options = {"dpi": self.dpi, **options}
+        self.figures.append((Path(path), figure_key(fig, options), pickle.dumps(fig), options))
+
+    def savefig(self, fname, *args, **kwargs):
+        fig = plt.gcf()
+        self._record(fig, ROOT / fname, kwargs)
+        self._saved.add(id(fig))
+
+    def show(self, *args, **kwargs):
+        script = _relative(self.script)
+        stem = "_".join(script.with_suffix("").parts) if not script.is_absolute() else script.stem
+        for num in plt.get_fignums():
+            fig = plt.figure(num)
+            if id(fig) not in self._saved:
+                self._shown += 1
+                self._record(fig, self.out_dir / f"{stem}_{self._shown}.png", {})
+        plt.close("all")
+        self._saved.clear()
+
+
+def capture(script, out_dir, dpi=150):
+    """Executa o script e devolve as figuras registradas (sem renderizar)."""
+    cap = _Capture(script, out_dir, dpi)
+    show, savefig = plt.show, plt.savefig
+    plt.show, plt.savefig = cap.show, cap.savefig
+    argv = sys.argv
+    sys.argv = [str(script)]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+        cap.show()  # figuras que o script deixou abertas
+    finally:
+        plt.show, plt.savefig = show, savefig
+        sys.argv = argv
+        plt.close("all")
+    return cap.figures
+
+
+def _render(path, data, options):
+    fig = pickle.loads(data)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, **options)
+    plt.close(fig)
+    return str(path)
+
+
+def default_scripts():
+    # só os scripts de exercício (fica de fora, por exemplo, o tempCodeRunnerFile.py
+    # que o Code Runner deixa nas pastas)
+    return sorted(ROOT.glob("atividade_*/**/exercicio*.py"))
+
+
+def build(scripts=None, out_dir=None, processes=None, force=False, dpi=150):
+    """Gera as figuras dos scripts; devolve o manifesto e os erros por script."""
+    scripts = [Path(s) for s in (scripts or default_scripts())]
+    out_dir = Path(out_dir) if out_dir is not None else ROOT / "imagens"
+    manifest_path = out_dir / MANIFEST
+    old = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    manifest, errors, futures = {}, {}, []
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for script in scripts:
+            try:
+                figures = capture(script, out_dir, dpi)
+            except Exception:
+                errors[str(script)] = traceback.format_exc()
+                continue
+            for path, key, data, options in figures:
+                name = str(_relative(path))
+                entry = {"script": str(_relative(script)), "key": key}
+                manifest[name] = entry
+                unchanged = old.get(name, {}).get("key") == key and path.exists()
+                entry["rendered"] = force or not unchanged
+                if entry["rendered"]:
+                    futures.append(pool.submit(_render, path, data, options))
+        for f in futures:
+            f.result()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False))
+    return manifest, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera as figuras das atividades (headless).")
+    parser.add_argument("scripts", nargs="*", help="scripts (padrão: todos de atividade_*)")
+    parser.add_argument("--out", default=None, help="diretório das figuras (padrão: imagens/)")
+    parser.add_argument("--processes", type=int, default=None, help="processos de renderização")
+    parser.add_argument("--dpi", type=int, default=150, help="dpi das figuras sem dpi próprio")
+    parser.add_argument("--force", action="store_true", help="renderiza mesmo sem mudança")
+    args = parser.parse_args(argv)
+
+    manifest, errors = build(args.scripts, args.out, args.processes, args.force, args.dpi)
+    rendered = sum(e["rendered"] for e in manifest.values())
+    print(f"{len(manifest)} figuras: {rendered} renderizadas, {len(manifest) - rendered} sem mudança")
+    for script, tb in errors.items():
+        print(f"\nerro em {script}:\n{tb}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    # via ``python -m`` este módulo é __main__; as funções enviadas ao pool
+    # precisam vir de ltc.report para o pickle encontrá-las
+    from ltc.report import main as _main
+
+    sys.exit(_main())
@@ -0,0 +1,161 @@
+"""Robustez de um PID frente a incertezas nos coeficientes da planta.
+
+O denominador da planta é perturbado (grade de multiplicadores ou sorteio
+com tolerância) e, para um mesmo PID, cada perturbação vira uma malha
+fechada s D_i(s) + (Kd s² + Kp s + Ki) N(s). Os polos de todas saem de uma
+chamada de ``batch_roots`` (fórmulas fechadas até a 4ª ordem): as
+perturbações instáveis são descartadas sem simulação. As estáveis são
+simuladas juntas em blocos pelo mesmo núcleo de ``evaluate_early``; cada
+perturbação sai do lote quando a acomodação é comprovada ou, com
+``reject=True``, assim que viola Ts ou Mp. Ts segue a regra de reserva de
+``evaluate_batch`` (``step_metrics(..., fallback=True)``) e o custo e o
+atendimento são os de ``tuning.cost``/``tuning.is_feasible``: um PID aceito
+por ``pid_grid_search`` atende às especificações na planta nominal.
+
+``RobustConstraint`` embrulha a verificação para as buscas de ganhos:
+``select`` só a consulta para candidatos nominalmente viáveis que
+superariam o melhor atual, então poucas verificações são feitas por busca.
+"""
+
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+
+from .montecarlo import sample_parameters
+from .polezero import UNSTABLE, MARGINAL, PoleAnalysis, analyze
+from .simulation import pad_coefs
+from .tuning import BAND, _early_step, cost, is_feasible
+
+
+def perturb_grid(den, tolerance, points=5):
+    """Denominadores (points^k, n+1) com os k coeficientes não nulos em grade.
+
+    Cada coeficiente é multiplicado por valores igualmente espaçados em
+    [1 - tolerance, 1 + tolerance] (``tolerance`` escalar ou um por
+    coeficiente); com ``points`` ímpar, a linha central (``points^k // 2``)
+    é a planta nominal.
+    """
+    den = np.asarray(den, dtype=float)
+    tol = np.broadcast_to(np.asarray(tolerance, dtype=float), den.shape)
+    free = np.flatnonzero(den != 0)
+    axes = [1.0 + tol[i] * np.linspace(-1.0, 1.0, points) for i in free]
+    mult = np.ones((points ** free.size, den.size))
+    mult[:, free] = np.array(list(product(*axes)))
+    return den * mult
+
+
+def perturb_random(den, tolerance, n, dist="uniform", seed=0):
+    """``n`` denominadores sorteados com tolerância relativa (``sample_parameters``)."""
+    return sample_parameters(den, tolerance, n, dist, seed)
+
+
+def pid_family(num, dens, gains):
+    """Malhas fechadas (num (1, m), den (N, m)) de um PID sobre N plantas."""
+    Kp, Ki, Kd = gains
+    dens = np.atleast_2d(np.asarray(dens, dtype=float))
+    controlled = np.polymul([Kd, Kp, Ki], np.trim_zeros(np.atleast_1d(num), "f"))
+    sD = np.pad(dens, ((0, 0), (0, 1)))  # s D(s)
+    rows = pad_coefs([sD[0], controlled])
+    width = rows.shape[1]
+    den_cl = np.pad(sD, ((0, 0), (width - sD.shape[1], 0))) + rows[1]
+    return rows[1][None, :], den_cl
+
+
+class Robustness(NamedTuple):
+    plants: np.ndarray     # denominadores perturbados (N, n+1)
+    poles: PoleAnalysis    # polos de malha fechada de cada perturbação
+    Ts: np.ndarray         # tempo de acomodação (N,); inf se não acomoda ou instável
+    Mp: np.ndarray         # sobressinal [%] (N,); inf se instável
+    exact: np.ndarray      # Ts e Mp exatos (False: interrompidos, limites inferiores)
+    cost: np.ndarray       # custo de ``tuning.cost`` (N,); inf se instável
+    meets: np.ndarray      # atende Ts < ts_max e Mp < mp_max (N,)
+
+    @property
+    def fraction(self):
+        """Fração das perturbações que atendem às especificações."""
+        return float(self.meets.mean()) if self.meets.size else 1.0
+
+    @property
+    def worst(self):
+        """Índice do pior caso: entre as instáveis, a de polo mais à direita;
+        senão a de maior custo."""
+        unstable = np.isin(self.poles.regime, (UNSTABLE, MARGINAL))
+        if unstable.any():
+            right = np.nanmax(self.poles.poles.real, axis=1)
+            return int(np.flatnonzero(unstable)[np.argmax(right[unstable])])
+        return int(np.argmax(self.cost))
+
+
+def _simulate(num, den, t, band, ts_max, mp_max, chunk):
+    # Ts, Mp e exatidão de cada malha estável pelo mesmo núcleo de
+    # evaluate_early (regra de reserva de Ts incluída); com limites finitos,
+    # as que já violam Ts/Mp saem do lote (limites inferiores). Divergentes
+    # ficam com Ts = Mp = inf
+    M = den.shape[0]
+    _, stop, valid, rejected, Ts, metrics = _early_step(
+        np.broadcast_to(num, (M, num.shape[1])), den, t, band, ts_max, mp_max, chunk)
+    Mp = np.where(valid, metrics["Mp"], np.inf)
+    Ts = np.where(valid, Ts, np.inf)
+    return Ts, Mp, ~(rejected & (stop < t.size))
+
+
+def robustness(num, plants, gains, t, ts_max, mp_max, band=BAND, reject=False, chunk=100):
+    """Polos, Ts, Mp e atendimento das especificações do PID ``gains`` em cada planta.
+
+    ``plants`` são denominadores (N, n+1) (``perturb_grid``/``perturb_random``)
+    com o numerador ``num`` comum. Perturbações com polo de malha fechada em
+    Re ≥ 0 não são simuladas (Ts = Mp = inf). Com ``reject=True`` as que
+    violam Ts ou Mp param de ser simuladas: a fração e o atendimento são os
+    mesmos, mas Ts e Mp dessas ficam como limites inferiores (``exact``).
+    Como em ``evaluate_early``, depois de comprovada a acomodação o pico
+    restante fica dentro da faixa e não é mais acompanhado.
+    """
+    t = np.asarray(t, dtype=float)
+    plants = np.atleast_2d(np.asarray(plants, dtype=float))
+    n_cl, d_cl = pid_family(num, plants, gains)
+    pa = analyze(d_cl)
+    stable = ~np.isin(pa.regime, (UNSTABLE, MARGINAL))
+    N = plants.shape[0]
+    Ts, Mp = np.full(N, np.inf), np.full(N, np.inf)
+    exact = np.ones(N, dtype=bool)
+    if stable.any():
+        limits = (ts_max, mp_max) if reject else (np.inf, np.inf)
+        Ts[stable], Mp[stable], exact[stable] = _simulate(n_cl, d_cl[stable], t, band, *limits, chunk)
+    # mesmas regras de pid_grid_search: tuning.cost e tuning.is_feasible
+    rows = [{"Ts": ts, "Mp": mp} for ts, mp in zip(Ts.tolist(), Mp.tolist())]
+    costs = np.array([cost(r, ts_max, mp_max) for r in rows])
+    meets = np.array([is_feasible(r, ts_max, mp_max) for r in rows], dtype=bool)
+    return Robustness(plants, pa, Ts, Mp, exact, costs, meets)
+
+
+class RobustConstraint:
+    """Restrição de robustez para ``select``/``pid_grid_search``/``pid_optimize``.
+
+    Um candidato passa se o PID atende Ts < ``ts_max`` e Mp < ``mp_max`` em
+    pelo menos ``fraction`` das ``plants``. ``checks`` conta as verificações.
+    """
+
+    __slots__ = ("num", "plants", "t", "ts_max", "mp_max", "fraction", "band", "checks")
+
+    def __init__(self, num, plants, t, ts_max, mp_max, fraction=1.0, band=BAND):
+        self.num = num
+        self.plants = np.atleast_2d(np.asarray(plants, dtype=float))
+        self.t = np.asarray(t, dtype=float)
+        self.ts_max, self.mp_max = ts_max, mp_max
+        self.fraction = fraction
+        self.band = band
+        self.checks = 0
+
+    def __call__(self, candidate):
+        self.checks += 1
+        gains = (candidate["Kp"], candidate["Ki"], candidate["Kd"])
+        # instáveis bastam para reprovar, sem simular nenhuma perturbação
+        n_cl, d_cl = pid_family(self.num, self.plants, gains)
+        regime = analyze(d_cl).regime
+        allowed = (1.0 - self.fraction) * len(self.plants)
+        if np.isin(regime, (UNSTABLE, MARGINAL)).sum() > allowed:
+            return False
+        res = robustness(self.num, self.plants, gains, self.t, self.ts_max, self.mp_max,
+                         self.band, reject=True)
+        return res.fraction >= self.fraction
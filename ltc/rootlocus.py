@@ -0,0 +1,182 @@
+"""Lugar das raízes em lote, como arrays (sem matplotlib).
+
+Para cada sistema G = N/D, as raízes de D(s) + K N(s) = 0 na grade de
+ganhos saem de uma única chamada de autovalores sobre as matrizes
+companheiras empilhadas; sistemas de mesma ordem são avaliados juntos. Os
+ramos são seguidos por continuação (associação de vizinho mais próximo entre
+ganhos consecutivos) e a grade é refinada onde os ramos andam rápido
+(pontos de separação/chegada) e onde algum ramo cruza o eixo imaginário.
+"""
+
+from itertools import permutations
+from typing import NamedTuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from .simulation import companion, pad_coefs
+
+# ordem máxima para a associação por força bruta (n! permutações)
+_BRUTE_FORCE_MAX = 6
+
+
+class RootLocus(NamedTuple):
+    K: np.ndarray      # ganhos (G,), crescentes, começando em 0
+    roots: np.ndarray  # raízes de malha fechada por ramo (G, n)
+    poles: np.ndarray  # polos de malha aberta
+    zeros: np.ndarray  # zeros de malha aberta
+
+
+def _closed_loop_roots(jobs):
+    # jobs: lista de (N, D, K) com N/D já do mesmo comprimento; sistemas de
+    # mesma ordem vão numa única chamada de eigvals
+    out = [None] * len(jobs)
+    widths = {}
+    for i, (N, D, K) in enumerate(jobs):
+        widths.setdefault(D.size, []).append(i)
+    for group in widths.values():
+        rows = np.vstack([jobs[i][1] + jobs[i][2][:, None] * jobs[i][0] for i in group])
+        A, _, _, _ = companion(np.ones(1), rows)
+        roots = np.linalg.eigvals(A).astype(complex)
+        start = 0
+        for i in group:
+            size = jobs[i][2].size
+            out[i] = roots[start:start + size]
+            start += size
+    return out
+
+
+def _match(a, b):
+    """Permutações (K, n) que alinham as linhas de ``b`` às de ``a``.
+
+    Minimiza a soma das distâncias ao quadrado entre raízes associadas
+    (força bruta vetorizada até ordem 6, atribuição húngara acima disso).
+    """
+    n = a.shape[1]
+    if n <= _BRUTE_FORCE_MAX:
+        perms = np.array(list(permutations(range(n))))
+        cost = (np.abs(b[:, perms] - a[:, None, :]) ** 2).sum(-1)
+        return perms[np.argmin(cost, axis=1)]
+    best = np.empty(a.shape, dtype=int)
+    for k in range(a.shape[0]):
+        d = np.abs(a[k][:, None] - b[k][None, :]) ** 2
+        _, best[k] = linear_sum_assignment(d)
+    return best
+
+
+def _steps(roots):
+    # maior deslocamento de raiz entre ganhos consecutivos, já associadas;
+    # aceita também pares explícitos (K, 2, n)
+    if roots.ndim == 3:
+        a, b = roots[:, 0], roots[:, 1]
+    else:
+        a, b = roots[:-1], roots[1:]
+    b = np.take_along_axis(b, _match(a, b), axis=1)
+    return np.abs(b - a).max(axis=1)
+
+
+def track(roots):
+    """Reordena as colunas de (G, n) para que cada coluna seja um ramo contínuo."""
+    roots = np.asarray(roots)
+    G, n = roots.shape
+    if G < 2 or n < 2:
+        return roots.copy()
+    best = _match(roots[:-1], roots[1:])
+    out = np.empty_like(roots)
+    order = np.arange(n)
+    out[0] = roots[0]
+    for k in range(G - 1):
+        order = best[k][order]
+        out[k + 1] = roots[k + 1][order]
+    return out
+
+
+def _midpoints(lo, hi):
+    with np.errstate(invalid="ignore"):
+        return np.where(lo > 0, np.sqrt(lo * hi), 0.5 * (lo + hi))
+
+
+def root_loci(systems, n_gains=200, k_range=None, max_step=0.02, crossing_rtol=1e-6,
+              max_iter=20, max_points=20000):
+    """Lugar das raízes de vários sistemas (lista de pares (num, den)).
+
+    A grade inicial é 0 mais ``n_gains`` ganhos log-espaçados em
+    ``k_range`` (padrão: 1e-4 a 1e4 vezes |D|/|N|). Em cada iteração os
+    intervalos em que algum ramo anda mais que ``max_step`` vezes
+    max(escala do sistema, |raiz|), ou cruza o eixo imaginário com folga
+    relativa de ganho acima de ``crossing_rtol``, são bisseccionados.
+    Retorna uma lista de ``RootLocus``.
+    """
+    polys = [pad_coefs([num, den]) for num, den in systems]
+    grids = []
+    for N, D in polys:
+        if k_range is None:
+            k0 = np.abs(D).max() / np.abs(N).max()
+            lo, hi = k0 * 1e-4, k0 * 1e4
+        else:
+            lo, hi = k_range
+        grids.append(np.concatenate([[0.0], np.geomspace(lo, hi, n_gains)]))
+
+    roots = _closed_loop_roots([(N, D, K) for (N, D), K in zip(polys, grids)])
+    open_poles = [np.roots(np.trim_zeros(D, "f")) for _, D in polys]
+    open_zeros = [np.roots(np.trim_zeros(N, "f")) for N, _ in polys]
+    scales = [max(1.0, np.abs(np.concatenate([p, z])).max(initial=0.0))
+              for p, z in zip(open_poles, open_zeros)]
+
+    steps = [_steps(R) for R in roots]
+    active = list(range(len(polys)))
+    for _ in range(max_iter):
+        jobs, owners = [], []
+        for i in active:
+            K, R = grids[i], roots[i]
+            if K.size >= max_points:
+                continue
+            size = np.maximum(scales[i], np.abs(R[1:]).max(axis=1))
+            flag = steps[i] > max_step * size
+            # cruzamento do eixo jω: muda o número de raízes no semiplano direito
+            rhp = (R.real > 0).sum(axis=1)
+            flag |= (rhp[1:] != rhp[:-1]) & (np.diff(K) > crossing_rtol * K[1:])
+            if flag.any():
+                new = _midpoints(K[:-1][flag], K[1:][flag])
+                jobs.append((polys[i][0], polys[i][1], new))
+                owners.append(i)
+        if not jobs:
+            break
+        for i, (_, _, new), R_new in zip(owners, jobs, _closed_loop_roots(jobs)):
+            K = np.concatenate([grids[i], new])
+            order = np.argsort(K, kind="stable")
+            grids[i] = K[order]
+            roots[i] = np.concatenate([roots[i], R_new])[order]
+            # só os intervalos vizinhos aos pontos novos mudam de passo
+            fresh = order >= K.size - new.size
+            touched = fresh[:-1] | fresh[1:]
+            step = np.empty(K.size - 1)
+            step[~touched] = steps[i][order[:-1][~touched]]
+            j = np.nonzero(touched)[0]
+            step[j] = _steps(np.stack([roots[i][j], roots[i][j + 1]], axis=1))
+            steps[i] = step
+        active = owners
+
+    return [RootLocus(K, track(R), p, z)
+            for K, R, p, z in zip(grids, roots, open_poles, open_zeros)]
+
+
+def root_locus(num, den, **kwargs):
+    """Lugar das raízes de um único sistema (ver ``root_loci``)."""
+    return root_loci([(num, den)], **kwargs)[0]
+
+
+def locus_window(locus, margin=0.25, reach=3.0):
+    """Limites (xlim, ylim) para exibir o lugar das raízes.
+
+    Enquadra polos, zeros e a parte dos ramos a até ``reach`` vezes a escala
+    do sistema, com folga ``margin``.
+    """
+    pz = np.concatenate([locus.poles, locus.zeros])
+    scale = max(1.0, np.abs(pz).max(initial=0.0))
+    R = locus.roots.ravel()
+    pts = np.concatenate([pz, R[np.abs(R) <= reach * scale], [0j]])
+    x0, x1 = pts.real.min(), pts.real.max()
+    y1 = max(np.abs(pts.imag).max(), 0.5 * (x1 - x0))
+    pad = margin * max(x1 - x0, 2 * y1, 1e-9)
+    return (x0 - pad, x1 + pad), (-y1 - pad, y1 + pad)
@@ -0,0 +1,53 @@
+"""Respostas analíticas de sistemas de segunda ordem padrão.
+
+G(s) = ωn² / (s² + 2 ζ ωn s + ωn²), ganho DC unitário. Os regimes
+(subamortecido, crítico, sobreamortecido) são escolhidos por elemento com
+máscaras e cada regime é avaliado de uma vez, por broadcast, sobre todas as
+combinações (ωn, ζ) que caem nele.
+"""
+
+import numpy as np
+
+# |ζ - 1| <= ZETA_TOL é tratado como criticamente amortecido
+ZETA_TOL = 1e-8
+
+
+def second_order_step(wn, zeta, t, dtype=np.float64):
+    """Respostas ao degrau unitário (N, T) para arrays de ωn e ζ.
+
+    ``wn`` e ``zeta`` são escalares ou arrays (broadcast para N elementos);
+    ``t`` é um vetor compartilhado (T,) ou uma grade por sistema (N, T).
+    ``dtype=np.float32`` calcula e devolve em precisão simples (metade da
+    memória).
+    """
+    dtype = np.dtype(dtype)
+    wn, zeta = np.broadcast_arrays(np.asarray(wn, dtype=dtype).ravel(),
+                                   np.asarray(zeta, dtype=dtype).ravel())
+    t = np.asarray(t, dtype=dtype)
+    T = np.broadcast_to(t, (wn.size, t.shape[-1]))
+    Y = np.empty(T.shape, dtype=dtype)
+
+    under = zeta < 1.0 - ZETA_TOL
+    crit = np.abs(zeta - 1.0) <= ZETA_TOL
+    over = ~(under | crit)
+
+    if under.any():
+        w, z, tt = wn[under, None], zeta[under, None], T[under]
+        root = np.sqrt(1.0 - z**2)
+        Y[under] = 1.0 - np.exp(-z * w * tt) * np.sin(w * root * tt + np.arccos(z)) / root
+    if crit.any():
+        w, tt = wn[crit, None], T[crit]
+        Y[crit] = 1.0 - np.exp(-w * tt) * (1.0 + w * tt)
+    if over.any():
+        w, z, tt = wn[over, None], zeta[over, None], T[over]
+        root = np.sqrt(z**2 - 1.0)
+        s1 = -w * (z - root)
+        s2 = -w * (z + root)
+        Y[over] = 1.0 - (s2 * np.exp(s1 * tt) - s1 * np.exp(s2 * tt)) / (s2 - s1)
+    return Y
+
+
+def rlc_params(R, L, C):
+    """(ω0, ζ) do RLC série com saída em vC: 1 / (LC s² + RC s + 1)."""
+    R, L, C = (np.asarray(x, dtype=float) for x in (R, L, C))
+    return 1.0 / np.sqrt(L * C), (R / 2.0) * np.sqrt(C / L)
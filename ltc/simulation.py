@@ -0,0 +1,496 @@
+"""Simulação em espaço de estados de lotes de sistemas SISO.
+
+Os sistemas são dados por matrizes de coeficientes (um sistema por linha,
+potências decrescentes de s). A resposta ao degrau é exata nos instantes da
+grade: discretiza-se uma única vez por passo distinto (Φ = e^{AΔt}, Γ) e a
+simulação vira uma recorrência de produtos matriciais empilhados. Grades
+uniformes por trechos (ltc.timegrid) custam uma discretização por trecho.
+Para horizontes muito longos, ``step_chunks`` entrega a resposta em blocos
+de tamanho fixo, com memória constante. Entradas arbitrárias (não só o
+degrau) em grades uniformes passam por ``forced_responses``, com a
+discretização guardada em cache por (sistema, Δt).
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+from scipy.linalg import expm
+
+
+def pad_coefs(polys):
+    """Empilha polinômios de graus diferentes (zeros à esquerda)."""
+    polys = [np.atleast_1d(np.asarray(p, dtype=float)) for p in polys]
+    width = max(p.size for p in polys)
+    out = np.zeros((len(polys), width))
+    for row, p in zip(out, polys):
+        row[width - p.size:] = p
+    return out
+
+
+def companion(num, den):
+    """Realização canônica controlável (A, B, C, D) de lotes num/den.
+
+    ``num`` e ``den`` são 1-D (um sistema) ou 2-D (um por linha); o
+    numerador não pode ter grau maior que o denominador. Retorna A (M, n, n),
+    B (n,), C (M, n) e D (M,).
+    """
+    den = np.atleast_2d(np.asarray(den, dtype=float))
+    num = np.atleast_2d(np.asarray(num, dtype=float))
+    n = den.shape[1] - 1
+    if num.shape[1] > n + 1:
+        raise ValueError("numerador de grau maior que o denominador")
+    if num.shape[1] < n + 1:
+        num = np.pad(num, ((0, 0), (n + 1 - num.shape[1], 0)))
+    num, den = np.broadcast_arrays(num, den)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = den / den[:, :1]
+        b = num / den[:, :1]
+    D = b[:, 0]
+    C = (b[:, 1:] - D[:, None] * a[:, 1:])[:, ::-1]
+
+    A = np.zeros((den.shape[0], n, n))
+    A[:, np.arange(n - 1), np.arange(1, n)] = 1.0
+    if n:
+        A[:, -1, :] = -a[:, 1:][:, ::-1]
+    B = np.zeros(n)
+    if n:
+        B[-1] = 1.0
+    return A, B, np.ascontiguousarray(C), D
+
+
+def sort_poles(p):
+    """Ordena polos por parte real e, nos pares conjugados, +j primeiro."""
+    p = np.asarray(p)
+    order = np.lexsort((-p.imag, p.real), axis=-1)
+    return np.take_along_axis(p, order, axis=-1)
+
+
+def poles(den):
+    """Polos de um lote de denominadores: autovalores das companheiras (M, n)."""
+    A, _, _, _ = companion(np.ones(1), den)
+    return sort_poles(np.linalg.eigvals(A).astype(complex))
+
+
+def zoh(A, B, dt):
+    """Discretização por segurador de ordem zero de um lote (Φ, Γ).
+
+    Usa a exponencial da matriz aumentada [[A, B], [0, 0]] Δt, calculada para
+    todo o lote de uma vez.
+    """
+    A = np.asarray(A, dtype=float)
+    M, n = A.shape[0], A.shape[-1]
+    aug = np.zeros((M, n + 1, n + 1))
+    aug[:, :n, :n] = A * dt
+    aug[:, :n, n] = np.asarray(B, dtype=float) * dt
+    E = expm(aug)
+    return E[:, :n, :n], E[:, :n, n]
+
+
+def uniform_step(t):
+    """Passo de uma grade uniforme (ValueError se não for uniforme)."""
+    t = np.asarray(t, dtype=float)
+    dt = t[1] - t[0]
+    if not np.allclose(np.diff(t), dt, rtol=1e-9, atol=0.0):
+        raise ValueError("a grade de tempo precisa ser uniforme")
+    return dt
+
+
+def step_levels(t, rtol=1e-9):
+    """Passos distintos de uma grade (dts, índice do passo de cada intervalo).
+
+    Passos iguais a menos de ``rtol`` (ruído do linspace) são agrupados.
+    """
+    dts = np.diff(np.asarray(t, dtype=float))
+    keys = np.round(dts / dts.max() / rtol).astype(np.int64)
+    if keys.min() == keys.max():
+        return dts[:1], np.zeros(dts.size, dtype=np.intp)
+    _, first, which = np.unique(keys, return_index=True, return_inverse=True)
+    return dts[first], which
+
+
+def step_responses(num, den, t):
+    """Respostas ao degrau unitário de um lote de sistemas, (M, len(t)).
+
+    A entrada é aplicada em t[0] com estado nulo. ``t`` pode ser não
+    uniforme; cada passo distinto é discretizado uma única vez. Em grades
+    uniformes, partindo do repouso, y[i] = C S_i + D (S_i = Σ_{j<i} Φ^j Γ) é
+    montado por duplicação em blocos (``_step_uniform``): ~log2(T) produtos
+    empilhados em vez de uma recorrência amostra a amostra.
+    """
+    t = np.asarray(t, dtype=float)
+    dts, which = step_levels(t) if t.size > 1 else (np.ones(1), np.zeros(0, int))
+    n = np.shape(den)[-1] - 1
+    # sistemas sem estados e numeradores de grau maior ficam com companion
+    if dts.size == 1 and 0 < n and np.shape(num)[-1] <= n + 1:
+        return _step_uniform(discretize(num, den, dts[0]), t.size)
+    A, B, C, D = companion(num, den)
+    Y = np.empty((A.shape[0], t.size))
+    if A.shape[-1] == 0:
+        Y[:] = D[:, None]
+        return Y
+    disc = [zoh(A, B, dt) for dt in dts]
+    X = np.empty((t.size, A.shape[0], A.shape[-1]))
+    x = np.zeros(X.shape[1:])
+    X[0] = x
+    for k, level in enumerate(which, start=1):
+        Phi, Gam = disc[level]
+        x = np.einsum("mij,mj->mi", Phi, x) + Gam
+        X[k] = x
+    Y[:] = np.einsum("kmi,mi->mk", X, C) + D[:, None]
+    return Y
+
+
+class Discrete(NamedTuple):
+    Phi: np.ndarray  # (M, n, n)
+    Gam: np.ndarray  # (M, n)
+    C: np.ndarray    # (M, n)
+    D: np.ndarray    # (M,)
+    Gam1: np.ndarray  # (M, n): estado da realização z = x - Γ1 u (zero no ZOH)
+    dt: float
+
+
+@lru_cache(maxsize=256)
+def _discretize(num_bytes, den_bytes, shape, dt, hold):
+    num = np.frombuffer(num_bytes).reshape(shape)
+    den = np.frombuffer(den_bytes).reshape(shape)
+    A, B, C, D = companion(num, den)
+    M, n = A.shape[0], A.shape[-1]
+    if hold == "zoh":
+        Phi, Gam = zoh(A, B, dt)
+        G1 = np.zeros((M, n))
+    else:
+        # rampa entre amostras: exp([[A, B, 0], [0, 0, 1/Δt], [0, 0, 0]] Δt) dá
+        # Φ, Γ0 = ∫ e^{Aτ} B e Γ1 (peso da rampa); x[k+1] = Φ x + (Γ0 - Γ1) u[k]
+        # + Γ1 u[k+1], que vira a forma de ZOH com z = x - Γ1 u
+        aug = np.zeros((M, n + 2, n + 2))
+        aug[:, :n, :n] = A * dt
+        aug[:, :n, n] = B * dt
+        aug[:, n, n + 1] = 1.0
+        E = expm(aug)
+        Phi, G0, G1 = E[:, :n, :n], E[:, :n, n], E[:, :n, n + 1]
+        Gam = np.einsum("mij,mj->mi", Phi, G1) + G0 - G1
+        D = D + np.einsum("mj,mj->m", C, G1)
+    out = Discrete(Phi, Gam, C, D, G1, dt)
+    for a in out[:5]:
+        a.flags.writeable = False  # compartilhados pelo cache
+    return out
+
+
+def discretize(num, den, dt, hold="zoh"):
+    """(Φ, Γ, C, D) de um lote num/den para o passo ``dt``, com cache.
+
+    ``hold="zoh"`` segura a entrada entre amostras; ``hold="foh"`` a
+    interpola linearmente (como o ``ctrl.forced_response``), e então o
+    estado da realização devolvida é z = x - Γ1 u. A mesma chamada (mesmos
+    coeficientes e passo) devolve os arrays já calculados, somente leitura.
+    """
+    if hold not in ("zoh", "foh"):
+        raise ValueError(f"segurador desconhecido: {hold!r}")
+    num, den = np.atleast_2d(np.asarray(num, dtype=float)), np.atleast_2d(np.asarray(den, dtype=float))
+    width = max(num.shape[1], den.shape[1])
+    if num.shape[1] < width:
+        num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+    if den.shape[1] < width:
+        den = np.pad(den, ((0, 0), (width - den.shape[1], 0)))
+    num, den = (np.ascontiguousarray(a) for a in np.broadcast_arrays(num, den))
+    return _discretize(num.tobytes(), den.tobytes(), num.shape, float(dt), hold)
+
+
+def forced_responses(num, den, t, u, hold="foh", block=64):
+    """Respostas (M, len(t)) de um lote de sistemas a entradas arbitrárias.
+
+    ``t`` é uma grade uniforme e ``u`` tem uma amostra por instante: (T,)
+    compartilhada, ou (M, T) com uma entrada por linha; um único sistema
+    com várias entradas também é aceito (broadcast das linhas). Com ``u``
+    (M, R, T) (ou (1, R, T)), cada sistema responde a R entradas e o
+    resultado é (M, R, T). O estado parte de zero. A recorrência anda em
+    blocos de ``block`` amostras: dentro do bloco, y = C Φ^i x + Σ_j h_{i-j} u_j
+    é um produto matricial com a matriz de Toeplitz dos parâmetros de
+    Markov h_i = C Φ^{i-1} Γ.
+    """
+    t = np.asarray(t, dtype=float)
+    dt = uniform_step(t) if t.size > 1 else 1.0
+    u = np.asarray(u, dtype=float)
+    if u.shape[-1] != t.size:
+        raise ValueError("a entrada precisa de uma amostra por instante de t")
+    disc = discretize(num, den, dt, hold)
+    if u.ndim == 3:
+        return _recurrence(disc, u, block)
+    return _recurrence(disc, np.atleast_2d(u)[:, None, :], block)[:, 0]
+
+
+def _recurrence(disc, u, block=64):
+    # x[k+1] = Φ x[k] + Γ u[k], y[k] = C x[k] + D u[k], em blocos, para u
+    # (M, R, T); as R entradas de um sistema são as colunas de x (n, R)
+    Phi, Gam, C, D, G1, _ = disc
+    T = u.shape[-1]
+    Ms, n = C.shape
+    M = np.broadcast_shapes((Ms,), (u.shape[0],))[0]
+    R = u.shape[1]
+    Y = np.empty((M, R, T))
+    if n == 0:
+        Y[:] = D[:, None, None] * u
+        return Y
+
+    L = min(block, T)
+    # C Φ^i (Ms, L, n), Φ^{L-1-j} Γ (Ms, n, L) e Toeplitz (Ms, L, L)
+    O = np.empty((Ms, L, n))
+    G = np.empty((Ms, n, L))
+    O[:, 0], G[:, :, L - 1] = C, Gam
+    for i in range(1, L):
+        O[:, i] = np.einsum("mj,mjk->mk", O[:, i - 1], Phi)
+        G[:, :, L - 1 - i] = np.einsum("mjk,mk->mj", Phi, G[:, :, L - i])
+    h = np.einsum("mij,mj->mi", O, Gam)  # h[i] = C Φ^i Γ
+    idx = np.arange(L)
+    lag = idx[:, None] - idx[None, :] - 1
+    H = np.where(lag >= 0, h[:, np.clip(lag, 0, None)], 0.0)
+    H[:, idx, idx] = D[:, None]
+    PL = np.linalg.matrix_power(Phi, L)
+
+    uT = np.swapaxes(u, 1, 2)  # (M, T, R)
+    x = np.broadcast_to(-G1[:, :, None] * u[:, None, :, 0], (M, n, R))  # x[0] = 0
+    for k0 in range(0, T, L):
+        r = min(L, T - k0)
+        ub = uT[:, k0:k0 + r]
+        Y[:, :, k0:k0 + r] = np.swapaxes(O[:, :r] @ x + H[:, :r, :r] @ ub, 1, 2)
+        if r == L:
+            x = PL @ x + G @ ub
+    return Y
+
+
+class Chunk(NamedTuple):
+    t: np.ndarray        # instantes do bloco (C,)
+    y: np.ndarray        # respostas (M, C)
+    settled: np.ndarray  # (M,) acomodação comprovada na faixa de parada
+
+
+def _compose(P1, S1, P2, S2):
+    # (Φ^a, S_a) ∘ (Φ^b, S_b) = (Φ^{a+b}, Φ^b S_a + S_b)
+    return P2 @ P1, (P2 @ S1[..., None])[..., 0] + S2
+
+
+def _lift(Phi, Gam, k):
+    # (Φ^k, S_k) por potências binárias
+    n = Phi.shape[-1]
+    Pk, Sk = np.broadcast_to(np.eye(n), Phi.shape).copy(), np.zeros(Gam.shape)
+    P, S = Phi, Gam
+    while k:
+        if k & 1:
+            Pk, Sk = _compose(Pk, Sk, P, S)
+        P, S = _compose(P, S, P, S)
+        k >>= 1
+    return Pk, Sk
+
+
+def _window_maps(Phi, Gam, C, D, size):
+    # C Φ^i (size, M, n) e C S_i + D (size, M) para i = 0..size-1, de modo que
+    # y[k0+i] = C Φ^i x[k0] + C S_i + D; dobra o trecho conhecido:
+    # C Φ^{h+i} = (C Φ^i) Φ^h e C S_{h+i} = C S_i + (C Φ^i) S_h
+    M, n = C.shape
+    O = np.empty((size, M, n))
+    F = np.empty((size, M))
+    O[0], F[0] = C, D
+    P, S, h = Phi, Gam, 1  # Φ^h, S_h
+    while h < size:
+        m = min(h, size - h)
+        O[h:h + m] = (O[:m, :, None] @ P)[:, :, 0]
+        F[h:h + m] = F[:m] + (O[:m] * S).sum(axis=-1)
+        P, S = _compose(P, S, P, S)
+        h *= 2
+    return O, F
+
+
+def _step_uniform(disc, T, block=4096, max_elems=1 << 22):
+    # resposta ao degrau a partir do repouso em blocos de L amostras, com
+    # C Φ^i (L, M, n) dobrado como em _window_maps; no bloco, y[i] = C Φ^i x
+    # + D + Σ_{j<i} h_j (soma acumulada dos parâmetros de Markov h_j = C Φ^j Γ)
+    # e entre blocos x ← Φ^L x + S_L. L não depende do lote (cada linha sai
+    # igual sozinha ou acompanhada); lotes grandes vão em grupos de linhas
+    # para C Φ^i não passar de ``max_elems``
+    Phi, Gam, C, D = disc[:4]
+    M, n = C.shape
+    L = min(T, block)
+    rows = max(1, max_elems // (L * n))
+    if M > rows:
+        return np.vstack([_step_uniform((Phi[i:i + rows], Gam[i:i + rows], C[i:i + rows], D[i:i + rows]),
+                                        T, block, max_elems) for i in range(0, M, rows)])
+    O = np.empty((L, M, n))
+    O[0] = C
+    P, h = Phi, 1
+    while h < L:
+        m = min(h, L - h)
+        O[h:h + m] = (O[:m, :, None] @ P)[:, :, 0]
+        P = P @ P
+        h *= 2
+    F = np.empty((L, M))
+    F[0] = D
+    np.cumsum((O[:-1] * Gam).sum(axis=-1), axis=0, out=F[1:])
+    F[1:] += D
+    Y = np.empty((M, T))
+    Y[:, :L] = F.T
+    if T > L:
+        PL, SL = _lift(Phi, Gam, L)
+        x = SL
+        for k0 in range(L, T, L):
+            r = min(L, T - k0)
+            Y[:, k0:k0 + r] = np.einsum("imn,mn->mi", O[:r], x) + F[:r].T
+            x = np.einsum("mjk,mk->mj", PL, x) + SL
+    return Y
+
+
+class StepStream:
+    """Resposta ao degrau de um lote de sistemas avançada bloco a bloco.
+
+    O estado é carregado de um bloco para o outro. Dentro do bloco a
+    recorrência é aplicada de uma vez por levantamento: y[k0+i] = C Φ^i x[k0]
+    + C S_i + D, com C Φ^i e C S_i (S_i = Σ_{j<i} Φ^j Γ) pré-calculados uma
+    única vez, por duplicação, e o estado avança com x ← Φ^C x + S_C. A
+    memória não depende do horizonte.
+
+    ``settled(low, high)`` comprova que a saída fica na faixa para sempre
+    pelo decaimento modal do estado restante: com e = x - x_ss = V z e
+    |λ_i| < 1, toda saída futura satisfaz |y - y_ss| ≤ Σ |(C V)_i| |z_i|.
+    Sistemas sem regime (polo na origem) ou com Φ mal condicionada para
+    diagonalização nunca são dados como acomodados. ``keep`` descarta
+    sistemas que não precisam mais ser simulados.
+    """
+
+    __slots__ = ("dt", "chunk", "k", "_O", "_F", "_Q", "_S", "_x", "_x_ss", "_y_ss",
+                 "_CV", "_Vinv", "_provable")
+
+    def __init__(self, num, den, dt, chunk=4096):
+        A, B, C, D = companion(num, den)
+        M, n = A.shape[0], A.shape[-1]
+        if n == 0:
+            raise ValueError("sistema sem estados: a resposta é constante")
+        Phi, Gam = zoh(A, B, dt)
+
+        O, F = _window_maps(Phi, Gam, C, D, chunk)
+        P, S = _lift(Phi, Gam, chunk)
+
+        # regime x_ss = (I - Φ)^{-1} Γ e decomposição modal de Φ
+        den = np.atleast_2d(np.asarray(den, dtype=float))
+        has_ss = np.broadcast_to(den[:, -1] != 0, (M,))
+        x_ss = np.full((M, n), np.nan)
+        if has_ss.any():
+            x_ss[has_ss] = np.linalg.solve(np.eye(n) - Phi[has_ss], Gam[has_ss][..., None])[..., 0]
+        lam, V = np.linalg.eig(Phi)
+        well_posed = (np.abs(lam) < 1.0).all(axis=1) & (np.linalg.cond(V) < 1e8)
+        Vinv = np.linalg.inv(np.where(well_posed[:, None, None], V, np.eye(n)))
+
+        self.dt, self.chunk, self.k = dt, chunk, 0
+        self._O, self._F, self._Q, self._S = O, F, P, S
+        self._x = np.zeros((M, n))
+        self._x_ss = x_ss
+        self._y_ss = np.einsum("mj,mj->m", C, x_ss) + D
+        self._CV = np.abs(np.einsum("mj,mjk->mk", C, V))
+        self._Vinv = Vinv
+        self._provable = has_ss & well_posed
+
+    def __len__(self):
+        return self._x.shape[0]
+
+    def advance(self, size=None):
+        """Próximo bloco: (t (C,), y (M, C)); ``size`` < chunk encerra a série."""
+        size = self.chunk if size is None else size
+        if size > self.chunk:
+            raise ValueError("bloco maior que o pré-calculado")
+        y = np.einsum("imn,mn->mi", self._O[:size], self._x) + self._F[:size].T
+        t = (self.k + np.arange(size)) * self.dt
+        if size == self.chunk:
+            self._x = np.einsum("mjk,mk->mj", self._Q, self._x) + self._S
+        self.k += size
+        return t, y
+
+    def settled(self, low, high):
+        """(M,) saída comprovadamente em [low, high] daqui em diante."""
+        z = np.abs(np.einsum("mjk,mk->mj", self._Vinv, self._x - self._x_ss))
+        bound = np.einsum("mj,mj->m", self._CV, z)
+        with np.errstate(invalid="ignore"):
+            return self._provable & (self._y_ss - bound >= low) & (self._y_ss + bound <= high)
+
+    def keep(self, mask):
+        """Mantém só os sistemas de ``mask`` (bool ou índices)."""
+        self._O, self._F = self._O[:, mask], self._F[:, mask]
+        self._Q, self._S, self._x = self._Q[mask], self._S[mask], self._x[mask]
+        self._x_ss, self._y_ss = self._x_ss[mask], self._y_ss[mask]
+        self._CV, self._Vinv, self._provable = self._CV[mask], self._Vinv[mask], self._provable[mask]
+
+
+def step_chunks(num, den, dt, chunk=4096, n_samples=None, stop_band=None):
+    """Resposta ao degrau em blocos de ``chunk`` amostras (gerador de ``Chunk``).
+
+    ``n_samples=None`` é ilimitado. Com ``stop_band=(low, high)``
+    (escalares ou um valor por sistema) o gerador para depois do bloco em que
+    todos os sistemas estão comprovadamente dentro da faixa para sempre (ver
+    ``StepStream``).
+    """
+    stream = StepStream(num, den, dt, chunk)
+    M = len(stream)
+    while n_samples is None or stream.k < n_samples:
+        size = chunk if n_samples is None else min(chunk, n_samples - stream.k)
+        t, y = stream.advance(size)
+        settled = np.zeros(M, dtype=bool)
+        if stop_band is not None:
+            settled = stream.settled(*stop_band)
+        yield Chunk(t, y, settled)
+        if stop_band is not None and settled.all():
+            return
+
+
+class PIDLoop:
+    """PID + planta fixa com realimentação unitária.
+
+    T(s) = (Kd s² + Kp s + Ki) N(s) / (s D(s) + (Kd s² + Kp s + Ki) N(s)):
+    numerador e denominador de malha fechada são combinações lineares de
+    polinômios que dependem só da planta, montados uma única vez.
+    """
+
+    __slots__ = ("_base", "_parts", "_u_parts")
+
+    def __init__(self, num, den):
+        num = np.trim_zeros(np.atleast_1d(np.asarray(num, dtype=float)), "f")
+        den = np.trim_zeros(np.atleast_1d(np.asarray(den, dtype=float)), "f")
+        # s D(s) e os termos multiplicados por Kp, Ki e Kd (multiplicar por s^k
+        # é acrescentar k zeros à direita)
+        rows = pad_coefs([np.append(den, 0.0), np.append(num, 0.0), num, np.append(num, [0.0, 0.0])])
+        self._base = rows[0]
+        self._parts = rows[1:]
+        # numerador de U/R = C/(1 + CG): (Kd s² + Kp s + Ki) D(s)
+        self._u_parts = pad_coefs([np.append(den, 0.0), den, np.append(den, [0.0, 0.0])])
+
+    def closed_loop(self, gains):
+        """Coeficientes (num, den) de malha fechada para ganhos (M, 3)."""
+        K = np.atleast_2d(np.asarray(gains, dtype=float))
+        num = K @ self._parts
+        return num, self._base + num
+
+    def step(self, gains, t):
+        """Respostas ao degrau (M, len(t)) para ganhos (Kp, Ki, Kd) (M, 3)."""
+        num, den = self.closed_loop(gains)
+        return step_responses(num, den, t)
+
+    def control(self, gains):
+        """(num, den, c) de U/R = C/(1 + CG) sem o impulso c·δ(t) do derivativo.
+
+        Com Kd > 0 e planta estritamente própria, U/R tem grau relativo -1:
+        U/R = c s + num/den, e a resposta ao degrau do sinal de controle é
+        c·δ(t) mais a resposta de num/den.
+        """
+        K = np.atleast_2d(np.asarray(gains, dtype=float))
+        _, den = self.closed_loop(K)
+        num = K @ self._u_parts
+        width = max(num.shape[1], den.shape[1] + 1)
+        num = np.pad(num, ((0, 0), (width - num.shape[1], 0)))
+        den_s = np.pad(den, ((0, 0), (width - 1 - den.shape[1], 1)))  # s·den
+        c = num[:, 0] / den_s[:, 0]
+        return (num - c[:, None] * den_s)[:, 1:], den, c
+
+    def step_with_control(self, gains, t):
+        """Saída e sinal de controle (sem impulso) ao degrau, ambos (M, len(t))."""
+        num, den = self.closed_loop(gains)
+        u_num, _, _ = self.control(gains)
+        Y = step_responses(pad_coefs([*num, *u_num]), np.vstack([den, den]), t)
+        return Y[:len(den)], Y[len(den):]
@@ -0,0 +1,153 @@
+"""Estágios de cálculo dos scripts com entradas endereçadas por conteúdo.
+
+Cada estágio (montagem do modelo, lugar das raízes, simulação, métricas)
+é uma chamada ``pipeline.run(nome, função, *args)``. A chave do estágio é
+o hash do nome, do código-fonte da função, do código do pacote ``ltc`` e
+do conteúdo dos argumentos; saídas de estágios anteriores passadas como
+argumento entram pelo próprio conteúdo, de modo que a dependência entre
+estágios fica registrada sem declarar o grafo. Saídas são guardadas em
+memória e, opcionalmente, em disco (pickle, um arquivo por estágio): numa
+nova execução só rodam os estágios cujas entradas mudaram, e os seguintes
+só se a saída deles mudar.
+
+As figuras ficam fora dos estágios: ``ltc.report`` já só rasteriza as
+figuras cujo conteúdo mudou.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+PACKAGE = Path(__file__).resolve().parent
+
+_package_digest = None
+
+
+def package_digest():
+    """Hash dos fontes do pacote ``ltc`` e da versão do NumPy (uma vez por processo)."""
+    global _package_digest
+    if _package_digest is None:
+        h = hashlib.sha1(np.__version__.encode())
+        for path in sorted(PACKAGE.glob("*.py")):
+            h.update(path.name.encode())
+            h.update(path.read_bytes())
+        _package_digest = h.hexdigest()
+    return _package_digest
+
+
+def function_digest(func):
+    """Hash do código-fonte de ``func`` (bytecode ou nome, se o fonte não existir)."""
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = getattr(func, "__code__", None)
+        if code is None:  # funções embutidas/de extensão
+            source = f"{getattr(func, '__module__', '')}.{func.__qualname__}".encode()
+        else:
+            source = code.co_code + repr(code.co_consts).encode()
+    return hashlib.sha1(source).hexdigest()
+
+
+def _update(h, value):
+    # hash estrutural de argumentos: arrays pelo conteúdo, contêineres
+    # elemento a elemento, funções pelo código e o resto pelo pickle
+    if isinstance(value, np.ndarray) and value.dtype.hasobject:
+        h.update(f"ndarray-object{value.shape}".encode())
+        _update(h, value.ravel().tolist())
+    elif isinstance(value, np.ndarray):
+        a = np.ascontiguousarray(value)
+        h.update(f"ndarray{a.dtype.str}{a.shape}".encode())
+        h.update(a.tobytes())
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+    elif isinstance(value, (tuple, list)):
+        h.update(f"{type(value).__qualname__}[{len(value)}]".encode())
+        for item in value:
+            _update(h, item)
+    elif isinstance(value, dict):
+        h.update(f"dict[{len(value)}]".encode())
+        for k in sorted(value, key=repr):
+            _update(h, k)
+            _update(h, value[k])
+    elif inspect.isroutine(value):
+        h.update(f"func:{getattr(value, '__qualname__', '')}:{function_digest(value)}".encode())
+    else:
+        h.update(type(value).__qualname__.encode())
+        h.update(pickle.dumps(value))
+
+
+class Pipeline:
+    """Executa estágios nomeados e reaproveita as saídas de entradas iguais.
+
+    ``directory`` (opcional) guarda uma saída por estágio em
+    ``<estágio>-<chave>.pkl``; gravar uma nova chave apaga a anterior do
+    mesmo estágio. ``log`` registra (estágio, "run" | "memory" | "disk")
+    na ordem das chamadas.
+    """
+
+    __slots__ = ("directory", "log", "_memory")
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory is not None else None
+        self.log = []
+        self._memory = {}
+
+    def key(self, stage, func, args=(), kwargs=None):
+        """Chave de conteúdo de uma chamada de estágio."""
+        h = hashlib.sha1(f"{stage}:{package_digest()}".encode())
+        _update(h, func)
+        _update(h, tuple(args))
+        _update(h, kwargs or {})
+        return h.hexdigest()
+
+    def run(self, stage, func, *args, **kwargs):
+        """Saída de ``func(*args, **kwargs)``, recalculada só se a chave mudou."""
+        key = self.key(stage, func, args, kwargs)
+        if key in self._memory:
+            self.log.append((stage, "memory"))
+            return self._memory[key]
+        path = None if self.directory is None else self.directory / f"{stage}-{key}.pkl"
+        if path is not None and path.exists():
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            self.log.append((stage, "disk"))
+        else:
+            value = func(*args, **kwargs)
+            self.log.append((stage, "run"))
+            if path is not None:
+                self._store(stage, path, value)
+        self._memory[key] = value
+        return value
+
+    def _store(self, stage, path, value):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for old in self.directory.glob(f"{stage}-*.pkl"):
+            old.unlink(missing_ok=True)
+        # grava num temporário e renomeia: leitores nunca veem arquivo parcial
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def executed(self):
+        """Nomes dos estágios efetivamente executados (não reaproveitados)."""
+        return [stage for stage, status in self.log if status == "run"]
+
+
+def pipeline(script):
+    """``Pipeline`` de um script, com disco em ``<cache>/stages/<atividade>/<script>``.
+
+    O diretório do cache é o mesmo de ``cache.default_cache`` (``LTC_CACHE_DIR``,
+    padrão ``.ltc_cache`` na raiz); ``LTC_CACHE_DIR=""`` deixa só a memória.
+    """
+    script = Path(script).resolve()
+    root = PACKAGE.parent
+    base = os.environ.get("LTC_CACHE_DIR", str(root / ".ltc_cache"))
+    if not base:
+        return Pipeline()
+    rel = script.relative_to(root) if script.is_relative_to(root) else Path(script.name)
+    return Pipeline(Path(base) / "stages" / rel.with_suffix(""))
@@ -0,0 +1,63 @@
+"""Varredura de ganho em malhas de realimentação com ganho escalar K.
+
+Duas topologias, para uma planta G(s) = N(s)/D(s):
+
+- ``"forward"``: ganho no ramo direto, T(s) = K N / (D + K N)
+  (``feedback(K*G, 1)``);
+- ``"feedback"``: ganho na realimentação, T(s) = N / (D + K N)
+  (``feedback(G, K)``).
+
+Os polinômios de malha fechada de todos os ganhos são montados de uma vez e
+simulados em lote (ltc.simulation), sem criar objetos TransferFunction.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .simulation import pad_coefs, poles, step_responses
+
+TOPOLOGIES = ("forward", "feedback")
+
+
+class GainSweep(NamedTuple):
+    K: np.ndarray      # ganhos (M,)
+    t: np.ndarray      # grade de tempo (T,)
+    y: np.ndarray      # respostas ao degrau (M, T)
+    poles: np.ndarray  # polos de malha fechada (M, n)
+    num: np.ndarray    # numeradores de malha fechada (M, n+1)
+    den: np.ndarray    # denominadores de malha fechada (M, n+1)
+
+
+def closed_loop(num, den, gains, topology="forward"):
+    """Coeficientes (num, den) de malha fechada, um ganho por linha."""
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"topologia desconhecida: {topology!r}")
+    K = np.atleast_1d(np.asarray(gains, dtype=float))[:, None]
+    N, D = pad_coefs([num, den])
+    den_cl = D + K * N
+    num_cl = K * N if topology == "forward" else np.broadcast_to(N, den_cl.shape).copy()
+    return num_cl, den_cl
+
+
+def gain_sweep(num, den, gains, t, topology="forward", cache=None):
+    """Respostas ao degrau e polos de malha fechada para cada ganho K.
+
+    ``t`` deve ser uniforme. Com ``cache`` (ltc.cache.ResponseCache) só as
+    malhas fechadas ainda não vistas são simuladas. Retorna um ``GainSweep``
+    com as respostas empilhadas (uma linha por ganho) e os polos ordenados.
+    """
+    num_cl, den_cl = closed_loop(num, den, gains, topology)
+    t = np.asarray(t, dtype=float)
+    if cache is None:
+        y, p = step_responses(num_cl, den_cl, t), poles(den_cl)
+    else:
+        y, p = cache.responses(num_cl, den_cl, t)
+    return GainSweep(
+        K=np.atleast_1d(np.asarray(gains, dtype=float)),
+        t=t,
+        y=y,
+        poles=p,
+        num=num_cl,
+        den=den_cl,
+    )
@@ -0,0 +1,102 @@
+"""Escolha automática do horizonte e da resolução da grade de tempo.
+
+O horizonte vem do polo dominante (o estável mais lento): o envelope e^{σt}
+cai abaixo da tolerância em ln(1/tol)/|σ|, multiplicado por uma folga. O
+passo vem de cada modo: ``points_per_tau`` amostras por constante de tempo e
+``points_per_period`` amostras por período de oscilação.
+
+Na grade não uniforme cada modo só impõe seu passo enquanto ainda é
+relevante (até ele decair abaixo da tolerância); depois disso a grade
+passa a seguir os modos mais lentos. O resultado é uniforme por trechos,
+com poucos passos distintos, e pode ser simulado por
+ltc.simulation.step_responses.
+
+A tolerância limita também o erro do valor final lido na última amostra:
+deve ficar abaixo da resolução com que ele é reportado. Ts e pico dependem
+do passo local; ``refine`` reamostra só as vizinhanças das amostras que os
+definem, para uma segunda simulação com a resolução desejada.
+"""
+
+import numpy as np
+
+from .simulation import poles
+
+
+def stable_poles(den):
+    """Polos estáveis de um ou vários denominadores (achatados)."""
+    p = np.asarray(poles(den)).ravel()
+    scale = np.max(np.abs(p), initial=1.0)
+    p = p[p.real < -1e-12 * scale]
+    if p.size == 0:
+        raise ValueError("nenhum polo estável: informe a grade de tempo manualmente")
+    return p
+
+
+def _decay_time(p, tol, factor):
+    # instante em que e^{Re(p) t} cai abaixo de tol, com folga
+    return factor * np.log(1.0 / tol) / (-p.real)
+
+
+def _mode_steps(p, points_per_tau, points_per_period):
+    with np.errstate(divide="ignore"):
+        dt_tau = 1.0 / (points_per_tau * (-p.real))
+        dt_osc = 2.0 * np.pi / (points_per_period * np.abs(p.imag))
+    return np.minimum(dt_tau, dt_osc)
+
+
+def auto_horizon(den, tol=1e-5, factor=1.2):
+    """t_final a partir do polo estável mais lento."""
+    return float(np.max(_decay_time(stable_poles(den), tol, factor)))
+
+
+def auto_grid(den, tol=1e-5, factor=1.2, points_per_tau=50, points_per_period=30,
+              uniform=False):
+    """Grade de tempo para a resposta de ``den`` (um ou vários sistemas).
+
+    Com ``uniform=True`` usa o menor passo exigido em todo o horizonte;
+    caso contrário devolve uma grade uniforme por trechos, densa no
+    transitório e esparsa na cauda já acomodada.
+    """
+    p = stable_poles(den)
+    ends = _decay_time(p, tol, factor)
+    steps = _mode_steps(p, points_per_tau, points_per_period)
+    t_final = float(ends.max())
+    if uniform:
+        n = int(np.ceil(t_final / steps.min())) + 1
+        return np.linspace(0.0, t_final, n)
+
+    # trecho k vai até o fim do k-ésimo modo; o passo é o menor entre os modos
+    # ainda ativos (mínimo dos sufixos na ordem de término)
+    order = np.argsort(ends)
+    ends, steps = ends[order], steps[order]
+    seg_dt = np.minimum.accumulate(steps[::-1])[::-1]
+
+    pieces = [np.zeros(1)]
+    start = 0.0
+    for k, (end, dt) in enumerate(zip(ends, seg_dt)):
+        # trechos consecutivos com o mesmo passo são fundidos
+        if k + 1 < ends.size and seg_dt[k + 1] == dt:
+            continue
+        if end > start:
+            n = int(np.ceil((end - start) / dt))
+            pieces.append(np.linspace(start, end, n + 1)[1:])
+            start = end
+    return np.concatenate(pieces)
+
+
+def refine(t, spans, step):
+    """Grade ``t`` com os intervalos ``spans`` [(início, fim), ...] reamostrados em ``step``.
+
+    Os pontos novos são múltiplos de ``step`` (a mesma rede em qualquer
+    intervalo); os que coincidem com amostras de ``t`` são descartados. Para
+    o pico na amostra i use (t[i-1], t[i+1]); para a acomodação na amostra
+    i (última saída da faixa entre t[i-1] e t[i]), (t[i-1], t[i]).
+    """
+    t = np.asarray(t, dtype=float)
+    extra = [np.arange(np.floor(lo / step) + 1, np.ceil(hi / step)) * step for lo, hi in spans]
+    if not extra:
+        return t
+    extra = np.concatenate(extra)
+    i = np.clip(np.searchsorted(t, extra), 1, t.size - 1)
+    gap = np.minimum(extra - t[i - 1], t[i] - extra)
+    return np.union1d(t, extra[gap > 1e-6 * step])
@@ -0,0 +1,109 @@
+"""Seguimento de referências e erro em regime de lotes de malhas unitárias.
+
+Para M plantas G(s) em malha fechada com realimentação unitária e R sinais
+de referência (degrau, rampa, parábola ou sinais amostrados), ``tracking``
+simula todas as M × R combinações numa única recorrência
+(``forced_responses`` com as referências como colunas do estado) e devolve
+saídas e sinais de erro. As constantes de erro Kp, Kv e Ka saem dos limites
+de s^k G(s) em s → 0, lidos direto dos coeficientes de menor ordem.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .lti import LTIBatch
+from .polezero import batch_roots
+
+# referências padrão: degrau u(t), rampa t e parábola t²/2, a partir de t[0]
+REFERENCES = ("step", "ramp", "parabola")
+
+
+def reference_signals(t, signals=REFERENCES):
+    """Matriz (R, len(t)) de referências, por nome ou como arrays amostrados."""
+    t = np.asarray(t, dtype=float)
+    tau = t - t[0]
+    shapes = {"step": np.ones_like(tau), "ramp": tau, "parabola": 0.5 * tau**2}
+    rows = []
+    for sig in signals:
+        if isinstance(sig, str):
+            if sig not in shapes:
+                raise ValueError(f"referência desconhecida: {sig!r}")
+            rows.append(shapes[sig])
+        else:
+            sig = np.asarray(sig, dtype=float)
+            if sig.shape != t.shape:
+                raise ValueError("referência amostrada precisa de uma amostra por instante de t")
+            rows.append(sig)
+    return np.stack(rows)
+
+
+class ErrorConstants(NamedTuple):
+    type: np.ndarray    # tipo do sistema: polos de G na origem (M,)
+    Kp: np.ndarray      # lim G(s), s → 0 (M,)
+    Kv: np.ndarray      # lim s G(s)
+    Ka: np.ndarray      # lim s² G(s)
+    stable: np.ndarray  # malha fechada G/(1 + G) estável (M,)
+
+    @property
+    def ess(self):
+        """Erros em regime (M, 3) ao degrau, à rampa e à parábola unitários.
+
+        1/(1 + Kp), 1/Kv e 1/Ka; nan onde a malha fechada não é estável
+        (o erro não converge).
+        """
+        with np.errstate(divide="ignore"):
+            e = np.column_stack([1.0 / (1.0 + self.Kp), 1.0 / self.Kv, 1.0 / self.Ka])
+        e[~self.stable] = np.nan
+        return e
+
+
+def _trailing_zeros(P):
+    # coeficientes nulos à direita de cada linha (raízes em s = 0)
+    return np.argmax(P[:, ::-1] != 0, axis=1)
+
+
+def error_constants(num, den):
+    """Tipo, Kp, Kv e Ka de cada G = num/den em realimentação unitária.
+
+    Com G(s) = s^(-N) N0(s)/D0(s), lim s^k G(s) vale N0(0)/D0(0) para k = N,
+    ±inf para k < N e 0 para k > N.
+    """
+    G = LTIBatch(num, den)
+    nz, pz = _trailing_zeros(G.num), _trailing_zeros(G.den)
+    rows = np.arange(len(G))
+    gain = G.num[rows, -1 - nz] / G.den[rows, -1 - pz]
+    kind = pz - nz
+    K = [np.where(kind > k, np.copysign(np.inf, gain), np.where(kind == k, gain, 0.0))
+         for k in range(3)]
+    poles = batch_roots(G.feedback().den)
+    stable = np.all(np.isnan(poles) | (poles.real < 0), axis=1)
+    return ErrorConstants(kind, *K, stable)
+
+
+class Tracking(NamedTuple):
+    t: np.ndarray  # (T,)
+    r: np.ndarray  # referências (R, T)
+    y: np.ndarray  # saídas (M, R, T)
+    e: np.ndarray  # erros r - y (M, R, T)
+
+    @property
+    def final(self):
+        """Erro no fim do horizonte (M, R): a matriz de orçamento de erro."""
+        return self.e[..., -1]
+
+
+def tracking(num, den, t, signals=REFERENCES, feedback=True, hold="foh"):
+    """Saídas e erros de M sistemas sob R referências, numa só simulação.
+
+    ``feedback=True`` fecha cada G com realimentação unitária; com
+    ``False`` a referência entra direto em G. ``t`` é uma grade uniforme. Com
+    ``hold="foh"`` a entrada é interpolada linearmente entre amostras, o que
+    torna degrau e rampa exatos nos instantes da grade.
+    """
+    t = np.asarray(t, dtype=float)
+    G = LTIBatch(num, den)
+    loop = G.feedback() if feedback else G
+    r = reference_signals(t, signals)
+    y = loop.forced(t, r[None], hold)
+    return Tracking(t, r, y, r - y)
@@ -0,0 +1,529 @@
+"""Busca de ganhos PID (Ziegler–Nichols + grade de multiplicadores).
+
+A avaliação dos candidatos é distribuída num pool de processos; a seleção do
+melhor candidato é feita depois, em série e na ordem da grade, de modo que o
+resultado é idêntico ao de uma execução serial. Como alternativa à grade,
+``pid_optimize`` minimiza uma versão contínua do custo a partir do ponto de
+Ziegler–Nichols (Nelder–Mead ou gradiente por diferenças finitas), com
+orçamento de simulações.
+
+Scripts que usam o pool precisam proteger o código principal com
+``if __name__ == "__main__":`` (no Windows os processos filhos reimportam o
+script).
+"""
+
+import os
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import product
+from typing import NamedTuple
+
+import control as ctrl
+import numpy as np
+from scipy.optimize import minimize
+
+from .metrics import STEP_METRICS, settling_index, step_metrics
+from .simulation import PIDLoop, StepStream, pad_coefs, poles, uniform_step
+
+# faixa visual de acomodação: inferior 98,2% e teto 102%
+BAND = (0.982, 1.02)
+
+# registro por simulação de pid_optimize
+TRACE = np.dtype([
+    ("Kp", float),
+    ("Ki", float),
+    ("Kd", float),
+    ("Ts", float),      # tempo de acomodação amostrado (como em cost)
+    ("Mp", float),
+    ("J", float),       # custo contínuo minimizado
+    ("J_best", float),  # menor J até esta simulação
+])
+
+
+def zn_pid(Kcr, Pcr):
+    """Ganhos (Kp, Ki, Kd) do PID clássico de Ziegler–Nichols."""
+    Kp = 0.6 * Kcr
+    Ti = 0.5 * Pcr
+    Td = 0.125 * Pcr
+    return Kp, Kp / Ti, Kp * Td
+
+
+def _max_real(num, den, K):
+    N, D = pad_coefs([num, den])
+    return float(np.max(poles(D + K * N).real))
+
+
+def _jw_crossings(num, den):
+    # s = jω em D(s) + K N(s) = 0 -> K = -D(jω)/N(jω) precisa ser real:
+    # Im(D(jω) N(-jω)) = 0 é um polinômio em ω
+    P = np.polynomial.polynomial
+    d = np.asarray(den, dtype=float)[::-1] * 1j ** np.arange(len(den))
+    n = np.asarray(num, dtype=float)[::-1] * 1j ** np.arange(len(num))
+    im = P.polymul(d, np.conj(n)).imag
+    roots = P.polyroots(P.polytrim(im)) if np.any(im) else np.array([])
+    w = np.unique(roots[np.abs(roots.imag) < 1e-9].real)
+    w = w[w > 1e-12]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K = -(P.polyval(w, d) / P.polyval(w, n)).real
+    ok = np.isfinite(K) & (K > 0)
+    return K[ok], w[ok]
+
+
+def ultimate_gain(num, den, method="crossing", k_max=1e6, rtol=1e-10):
+    """Ganho crítico Kcr e período crítico Pcr (Ziegler–Nichols).
+
+    ``method="crossing"`` resolve analiticamente os cruzamentos do eixo jω
+    de D(s) + K N(s) e escolhe o menor K em que a malha perde a
+    estabilidade; ``method="bisection"`` bissecta K em (0, k_max) pelo maior
+    Re dos polos de malha fechada (supõe uma única troca de estabilidade).
+    ValueError se não houver ganho crítico.
+    """
+    if method == "crossing":
+        for K, w in sorted(zip(*_jw_crossings(num, den))):
+            if _max_real(num, den, K * (1 - 1e-6)) < 0 <= _max_real(num, den, K * (1 + 1e-6)):
+                return float(K), float(2.0 * np.pi / w)
+        raise ValueError("a malha não perde estabilidade por cruzamento do eixo jω")
+    if method != "bisection":
+        raise ValueError(f"método desconhecido: {method!r}")
+
+    lo, hi = 0.0, float(k_max)
+    if _max_real(num, den, hi) < 0:
+        raise ValueError(f"malha estável até K = {k_max:g}")
+    while hi - lo > rtol * hi:
+        mid = 0.5 * (lo + hi)
+        if _max_real(num, den, mid) < 0:
+            lo = mid
+        else:
+            hi = mid
+    N, D = pad_coefs([num, den])
+    p = poles(D + hi * N)[0]
+    w = np.abs(p[np.argmax(p.real)].imag)
+    return hi, (float(2.0 * np.pi / w) if w > 0 else np.inf)
+
+
+@lru_cache(maxsize=None)
+def _plant(num, den):
+    return ctrl.TransferFunction(list(num), list(den))
+
+
+@lru_cache(maxsize=None)
+def _pid_loop(num, den):
+    return PIDLoop(num, den)
+
+
+def evaluate_pid(num, den, t, gains, band=BAND):
+    """Retorna Ts, Mp, y_inf, y para o PID dado; None para candidatos inválidos.
+
+    ``num``/``den`` são os coeficientes da planta (malha com realimentação
+    unitária). O vetor de tempo não é copiado no resultado.
+    """
+    Kp, Ki, Kd = gains
+    # C(s) = (Kd s^2 + Kp s + Ki) / s
+    Cpid = ctrl.TransferFunction([Kd, Kp, Ki], [1, 0])
+    Gcl = ctrl.feedback(Cpid * _plant(tuple(num), tuple(den)), 1)
+    try:
+        _, yr = ctrl.step_response(Gcl, T=t)
+    except Exception:
+        return None
+    yr = np.asarray(yr)  # NamedSignal do control não sobrevive ao pickle
+    if np.any(~np.isfinite(yr)):
+        return None
+    m = step_metrics(yr, t, band=band, target=1.0, fallback=True)
+    Ts = float(m["Ts"]) if np.isfinite(m["Ts"]) else np.inf
+    return {
+        "Kp": Kp, "Ki": Ki, "Kd": Kd,
+        "y": yr, "y_inf": float(m["y_final"]),
+        "Mp": float(m["Mp"]), "Ts": Ts,
+    }
+
+
+def evaluate_batch(num, den, t, gains, band=BAND):
+    """Versão em lote de evaluate_pid pelo caminho rápido em espaço de estados.
+
+    Todos os ganhos compartilham a mesma discretização da grade ``t``
+    (uniforme). Diferença medida para ``ctrl.step_response``: até ~4e-11
+    em valor absoluto na grade de atividade_7, e ~1e-13 relativa à
+    amplitude da resposta em ganhos aleatórios (as respostas divergentes,
+    de amplitude ~1e4, chegam a ~1e-9 absoluto).
+
+    Desempenho medido (atividade_7, 2000 amostras, mediana de rodadas
+    intercaladas): um candidato isolado custa ~0.85 ms contra ~19 ms do
+    python-control (~22x); em lote, ~0.38 ms por candidato com 125 ganhos
+    por chamada (~50x).
+    """
+    if len(gains) == 0:
+        return []
+    Y = _pid_loop(tuple(num), tuple(den)).step(gains, t)
+    valid = np.isfinite(Y).all(axis=1)
+    m = step_metrics(Y, t, band=band, target=1.0, fallback=True)
+    results = []
+    for (Kp, Ki, Kd), yr, ok, row in zip(gains, Y, valid, m):
+        if not ok:
+            results.append(None)
+            continue
+        Ts = float(row["Ts"]) if np.isfinite(row["Ts"]) else np.inf
+        results.append({
+            "Kp": Kp, "Ki": Ki, "Kd": Kd,
+            "y": yr, "y_inf": float(row["y_final"]),
+            "Mp": float(row["Mp"]), "Ts": Ts,
+        })
+    return results
+
+
+def _early_step(n_cl, d_cl, t, band, ts_max, mp_max, chunk):
+    # núcleo de evaluate_early (também usado por ltc.robust): simula as
+    # malhas (n_cl, d_cl) em blocos e devolve Y, amostras simuladas,
+    # validade, rejeição, Ts (regra de reserva de evaluate_batch) e métricas
+    stream = StepStream(n_cl, d_cl, uniform_step(t), min(chunk, t.size))
+    low, high = band
+    peak_max = 1.0 + mp_max / 100.0
+
+    M, T = d_cl.shape[0], t.size
+    Y = np.empty((M, T))
+    stop = np.full(M, T)
+    rejected = np.zeros(M, dtype=bool)
+    valid = np.ones(M, dtype=bool)
+    reached = np.full(M, np.inf)  # primeiro instante com y >= low
+    active = np.arange(M)
+    while active.size and stream.k < T:
+        k0 = stream.k
+        _, y = stream.advance(min(stream.chunk, T - k0))
+        k1 = stream.k
+        Y[active, k0:k1] = y
+        finite = np.isfinite(y).all(axis=1)
+        above = y >= low
+        first = np.where(above.any(axis=1), t[k0 + np.argmax(above, axis=1)], np.inf)
+        reached[active] = np.minimum(reached[active], first)
+        outside = (y < low) | (y > high)
+        late = (outside & (t[k0:k1] >= ts_max)).any(axis=1) & (reached[active] >= ts_max)
+        reject = finite & ((y.max(axis=1) >= peak_max) | late)
+        done = ~finite | reject | (stream.settled(low, high) & ~outside[:, -1])
+        valid[active[~finite]] = False
+        rejected[active[reject]] = True
+        stop[active[done]] = k1
+        stream.keep(~done)
+        active = active[~done]
+
+    # métricas numa chamada por grupo (comprimento simulado, interrompido ou
+    # não); rejeitados no fim do horizonte têm a resposta toda e Ts exato
+    bounds = rejected & (stop < T)
+    Ts = np.empty(M)
+    metrics = np.empty(M, dtype=STEP_METRICS)
+    for n, lower in set(zip(stop[valid].tolist(), bounds[valid].tolist())):
+        rows = np.nonzero(valid & (stop == n) & (bounds == lower))[0]
+        m = step_metrics(Y[rows, :n], t[:n], band=band, target=1.0, fallback=not lower)
+        metrics[rows] = m
+        if lower:
+            # Ts (acomodação ou reserva) nunca é anterior à 1ª chegada a low
+            Ts[rows] = np.minimum(reached[rows], t[n])
+        else:
+            Ts[rows] = np.where(np.isfinite(m["Ts"]), m["Ts"], np.inf)
+    return Y, stop, valid, rejected, Ts, metrics
+
+
+def evaluate_early(num, den, t, gains, band=BAND, ts_max=np.inf, mp_max=np.inf, chunk=100):
+    """Como evaluate_batch, mas interrompe cada candidato assim que possível.
+
+    A simulação avança em blocos de ``chunk`` amostras (ltc.simulation.
+    StepStream) e cada candidato sai do lote quando:
+
+    - o pico já atinge o sobressinal ``mp_max``, ou a saída está fora da
+      faixa num instante ≥ ``ts_max`` sem ter chegado ao limite inferior antes
+      de ``ts_max`` (nem o Ts de reserva de ``fallback`` seria < ``ts_max``):
+      rejeitado (``"rejected": True``), com Mp e Ts como limites inferiores
+      dos de evaluate_batch;
+    - a saída está comprovadamente na faixa para sempre (Ts já é exato; Mp
+      só pode estar subestimado abaixo de ``band[1]``).
+
+    Um candidato é rejeitado só se evaluate_batch também o julgaria
+    inviável. ``y`` traz só as amostras simuladas. Candidatos divergentes
+    viram None.
+    """
+    if len(gains) == 0:
+        return []
+    t = np.asarray(t, dtype=float)
+    n_cl, d_cl = _pid_loop(tuple(num), tuple(den)).closed_loop(gains)
+    Y, stop, valid, rejected, Ts, metrics = _early_step(n_cl, d_cl, t, band, ts_max, mp_max, chunk)
+
+    results = []
+    for (Kp, Ki, Kd), yr, n, ok, rej, m, ts in zip(gains, Y, stop, valid, rejected, metrics, Ts):
+        if not ok:
+            results.append(None)
+            continue
+        results.append({
+            "Kp": Kp, "Ki": Ki, "Kd": Kd,
+            "y": yr[:n].copy(), "y_inf": float(m["y_final"]),
+            "Mp": float(m["Mp"]), "Ts": float(ts), "rejected": bool(rej),
+        })
+    return results
+
+
+def is_feasible(candidate, ts_max, mp_max):
+    return (candidate["Ts"] < ts_max) and (candidate["Mp"] < mp_max)
+
+
+def cost(candidate, ts_max, mp_max):
+    """Ts penalizado pelas violações relativas de Ts e Mp."""
+    pen_ts = max(0.0, candidate["Ts"] - ts_max) / ts_max
+    pen_mp = max(0.0, candidate["Mp"] - mp_max) / mp_max
+    return 10.0 * (pen_ts + pen_mp) + candidate["Ts"]
+
+
+def evaluate_candidates(num, den, t, gains, band=BAND, executor=None, chunksize=1,
+                        method="control", ts_max=np.inf, mp_max=np.inf):
+    """Avalia uma lista de (Kp, Ki, Kd); a ordem do resultado segue ``gains``.
+
+    ``method="control"`` simula cada candidato com o python-control;
+    ``method="ss"`` simula lotes de ``chunksize`` candidatos de uma vez
+    (evaluate_batch); ``method="early"`` faz o mesmo, mas interrompe os
+    candidatos já acomodados ou que já violam ``ts_max``/``mp_max``
+    (evaluate_early). Sem ``executor`` a avaliação é serial. Candidatos
+    inválidos viram None.
+    """
+    t = np.asarray(t, dtype=float)
+    mapper = map if executor is None else executor.map
+    if method in ("ss", "early"):
+        if method == "ss":
+            job = partial(evaluate_batch, tuple(num), tuple(den), t, band=band)
+        else:
+            job = partial(evaluate_early, tuple(num), tuple(den), t, band=band,
+                          ts_max=ts_max, mp_max=mp_max)
+        step = len(gains) if executor is None else max(1, chunksize)
+        batches = [gains[i:i + step] for i in range(0, len(gains), step)]
+        results = [c for part in mapper(job, batches) for c in part]
+    elif method == "control":
+        job = partial(evaluate_pid, tuple(num), tuple(den), t, band=band)
+        if executor is None:
+            results = list(map(job, gains))
+        else:
+            results = list(executor.map(job, gains, chunksize=chunksize))
+    else:
+        raise ValueError(f"método desconhecido: {method!r}")
+    for cand in results:
+        if cand is not None:
+            cand["t"] = t[:cand["y"].size]
+    return results
+
+
+def _complete(num, den, t, candidates, band):
+    # candidatos interrompidos (evaluate_early) simulados no horizonte todo
+    idx = [i for i, c in enumerate(candidates) if c is not None and c["y"].size < len(t)]
+    full = evaluate_batch(num, den, t, [(candidates[i]["Kp"], candidates[i]["Ki"],
+                                         candidates[i]["Kd"]) for i in idx], band)
+    out = list(candidates)
+    for i, cand in zip(idx, full):
+        if cand is not None:
+            cand["t"] = t
+        out[i] = cand
+    return out
+
+
+def _select_bounded(num, den, t, candidates, ts_max, mp_max, best_ok, best_alt, band, constraint):
+    # select sobre candidatos de evaluate_early: os rejeitados interrompidos
+    # são inviáveis, mas Ts/Mp (e o custo) são limites inferiores; só os que
+    # ainda podem bater o melhor inviável exato são simulados por inteiro
+    def bounded(c):
+        return c is not None and c["rejected"] and c["y"].size < len(t)
+
+    exact = [None if bounded(c) else c for c in candidates]
+    ok, alt, _ = select(exact, ts_max, mp_max, best_ok, best_alt, constraint)
+    limit = np.inf if alt is None else cost(alt, ts_max, mp_max)
+    pending = [i for i, c in enumerate(candidates)
+               if bounded(c) and cost(c, ts_max, mp_max) <= limit]
+    if not pending:
+        # os demais têm custo > limit: não mudam o ranking
+        return ok, alt, sum(c is not None for c in candidates)
+    full = _complete(num, den, t, [candidates[i] for i in pending], band)
+    merged = list(candidates)
+    for i, cand in zip(pending, full):
+        merged[i] = cand
+    return select(merged, ts_max, mp_max, best_ok, best_alt, constraint)
+
+
+def select(candidates, ts_max, mp_max, best_ok=None, best_alt=None, constraint=None):
+    """Atualiza (melhor viável por Ts, melhor inviável por custo) em ordem.
+
+    ``constraint(candidato) -> bool`` (ex.: ``robust.RobustConstraint``) é
+    uma condição extra de viabilidade, consultada só quando o candidato
+    nominalmente viável superaria o melhor atual; reprovado, ele concorre
+    com os inviáveis.
+    """
+    tested = 0
+    for cand in candidates:
+        if cand is None:
+            continue
+        tested += 1
+        feasible = is_feasible(cand, ts_max, mp_max)
+        if feasible and (best_ok is not None) and (cand["Ts"] >= best_ok["Ts"]):
+            continue
+        if feasible and (constraint is None or constraint(cand)):
+            best_ok = cand
+        elif (best_alt is None) or (cost(cand, ts_max, mp_max) < cost(best_alt, ts_max, mp_max)):
+            best_alt = cand
+    return best_ok, best_alt, tested
+
+
+def scaled_grid(base, mP, mI=None, mD=None):
+    """Produto cartesiano de multiplicadores aplicado a (Kp, Ki, Kd)."""
+    mI = mP if mI is None else mI
+    mD = mP if mD is None else mD
+    Kp, Ki, Kd = base
+    return [(Kp * a, Ki * b, Kd * c) for a, b, c in product(mP, mI, mD)]
+
+
+def pid_grid_search(num, den, t, base, ts_max, mp_max,
+                    mults=(0.5, 0.75, 1.0, 1.25, 1.5),
+                    scales=(0.8, 0.9, 1.0, 1.1, 1.2),
+                    band=BAND, processes=None, method="control", constraint=None):
+    """Grade grossa ao redor de ``base`` seguida de refino local.
+
+    Retorna (melhor viável ou None, melhor inviável ou None, avaliados).
+    ``processes=1`` avalia em série; None usa todos os núcleos. Com
+    ``method="ss"`` cada processo simula seu lote pelo caminho rápido; com
+    ``method="early"`` os candidatos param assim que acomodam ou violam os
+    critérios; os rejeitados interrompidos só são simulados por inteiro se o
+    custo (com Ts e Mp como limites inferiores) ainda puder bater o melhor
+    inviável, de modo que o resultado é o mesmo de ``method="ss"`` (exceto
+    com ``mp_max`` abaixo de ``band[1]``, em que o Mp dos acomodados pode
+    estar subestimado). Os candidatos devolvidos sempre trazem a resposta
+    completa.
+    ``constraint`` é repassada a ``select`` (viabilidade robusta, por exemplo).
+    """
+    workers = processes or os.cpu_count() or 1
+    t = np.asarray(t, dtype=float)
+    early = method == "early"
+
+    def chunks(n):
+        # "ss"/"early": um lote por processo; "control": ~4 tarefas por processo
+        per = 4 * workers if method == "control" else workers
+        return max(1, -(-n // per))
+
+    def evaluate(gains, executor):
+        return evaluate_candidates(num, den, t, gains, band, executor, chunks(len(gains)),
+                                   method, ts_max, mp_max)
+
+    def choose(candidates, best_ok=None, best_alt=None):
+        if early:
+            return _select_bounded(num, den, t, candidates, ts_max, mp_max, best_ok, best_alt,
+                                   band, constraint)
+        return select(candidates, ts_max, mp_max, best_ok, best_alt, constraint)
+
+    with _pool(processes) as executor:
+        coarse = evaluate(scaled_grid(base, mults), executor)
+        best_feasible, best_near, tested = choose(coarse)
+
+        # refino local ao redor do melhor candidato
+        center = best_near if best_feasible is None else best_feasible
+        if center is None:
+            return None, None, tested
+        fine = evaluate(scaled_grid((center["Kp"], center["Ki"], center["Kd"]), scales), executor)
+
+    best_ok = best_feasible  # o centro, quando viável
+    ref_ok, ref_alt, n = choose(fine, best_ok, center)
+    tested += n
+    if best_feasible is None:
+        ok, alt = ref_ok, ref_alt
+    else:
+        ok, alt = ref_ok or best_feasible, ref_alt or best_near
+    if early:
+        ok, alt = _complete(num, den, t, [ok, alt], band)
+    return ok, alt, tested
+
+
+class PIDOptimum(NamedTuple):
+    best: dict         # melhor viável (menor Ts) ou None
+    near: dict         # melhor inviável (menor custo) ou None
+    evaluations: int   # simulações de malha fechada
+    trace: np.ndarray  # um registro TRACE por simulação, em ordem
+
+
+class _Budget(Exception):
+    pass
+
+
+def _soft_ts(y, t, low, high):
+    # Ts com a última saída da faixa interpolada entre amostras: contínuo nos
+    # ganhos enquanto o mesmo pico define a acomodação
+    k = settling_index(y, low, high)
+    if k < 0:
+        return float(t[-1])
+    if k == 0:
+        return float(t[0])
+    edge = high if y[k - 1] > high else low
+    frac = (y[k - 1] - edge) / (y[k - 1] - y[k])
+    return float(t[k - 1] + frac * (t[k] - t[k - 1]))
+
+
+def smooth_cost(candidate, ts_max, mp_max, band=BAND, weight=100.0):
+    """Versão contínua de ``cost``: Ts interpolado e penalidades com peso ``weight``.
+
+    O peso maior que o de ``cost`` mantém o mínimo do lado viável das
+    restrições, em vez de trocar um pouco de Mp por Ts.
+    """
+    ts = _soft_ts(candidate["y"], candidate["t"], band[0], band[1])
+    pen_ts = max(0.0, ts - ts_max) / ts_max
+    pen_mp = max(0.0, candidate["Mp"] - mp_max) / mp_max
+    return weight * (pen_ts + pen_mp) + ts
+
+
+def pid_optimize(num, den, t, base, ts_max, mp_max, band=BAND, method="nelder-mead",
+                 budget=48, step=0.3, eps=1e-2, weight=100.0, constraint=None):
+    """Otimização local de (Kp, Ki, Kd) a partir de ``base`` (ponto ZN).
+
+    As variáveis são os logaritmos dos multiplicadores de ``base`` (ganhos
+    sempre positivos, passos relativos). ``method="nelder-mead"`` parte de
+    um simplex com arestas ``step``; ``method="gradient"`` usa L-BFGS-B com
+    gradiente por diferenças finitas de passo ``eps``. O custo minimizado é
+    ``smooth_cost``, mas a seleção final usa as mesmas regras da grade
+    (``select``) sobre todas as simulações feitas, no máximo ``budget``.
+    Cada simulação para assim que a acomodação é comprovada
+    (``evaluate_early``); os candidatos devolvidos trazem a resposta
+    completa. ``constraint`` só entra na seleção final (``select``), não no
+    custo minimizado. Retorna um ``PIDOptimum``.
+    """
+    t = np.asarray(t, dtype=float)
+    base = np.asarray(base, dtype=float)
+    candidates, trace = [], []
+
+    def objective(x):
+        if len(trace) >= budget:
+            raise _Budget
+        gains = tuple(base * np.exp(x))
+        # sem limites de Ts/Mp, a simulação só para quando a acomodação está
+        # comprovada: Ts e Mp são exatos
+        cand = evaluate_early(num, den, t, [gains], band)[0]
+        if cand is None:
+            J, ts, mp = np.inf, np.inf, np.inf
+        else:
+            cand["t"] = t[:cand["y"].size]
+            J, ts, mp = smooth_cost(cand, ts_max, mp_max, band, weight), cand["Ts"], cand["Mp"]
+        best = min(J, trace[-1][-1]) if trace else J
+        candidates.append(cand)
+        trace.append((*gains, ts, mp, J, best))
+        # L-BFGS-B não aceita inf; um valor grande e finito afasta o passo
+        return J if np.isfinite(J) else 1e12
+
+    x0 = np.zeros(3)
+    try:
+        if method == "nelder-mead":
+            simplex = np.vstack([x0, x0 + step * np.eye(3)])
+            minimize(objective, x0, method="Nelder-Mead",
+                     options={"initial_simplex": simplex, "maxfev": budget})
+        elif method == "gradient":
+            minimize(objective, x0, method="L-BFGS-B", options={"eps": eps, "maxfun": budget})
+        else:
+            raise ValueError(f"método desconhecido: {method!r}")
+    except _Budget:
+        pass
+
+    best, near, n = select(candidates, ts_max, mp_max, constraint=constraint)
+    best, near = _complete(num, den, t, [best, near], band)
+    return PIDOptimum(best, near, n, np.array(trace, dtype=TRACE))
+
+
+def _pool(processes):
+    # processes=1: avaliação no próprio processo, sem pool
+    if processes == 1:
+        return nullcontext()
+    return ProcessPoolExecutor(max_workers=processes)
@@ -0,0 +1,9 @@
+"""Configuração comum dos testes: raiz do repositório no ``sys.path`` e
+matplotlib sem janelas."""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raiz do repositório
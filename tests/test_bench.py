@@ -0,0 +1,21 @@
+"""Registro de benchmarks e referências do python-control."""
+
+from ltc import bench
+
+
+def test_references_are_registered():
+    for name, ref in bench._REFERENCES.items():
+        assert name in bench._REGISTRY and ref in bench._REGISTRY
+
+
+def test_select_pulls_in_references():
+    names = bench.select(["root_loci*"])
+    assert names == ["ctrl.root_locus_map[atividade_6]", "root_loci[atividade_6]"]
+
+
+def test_record_reports_speedup():
+    record = bench.run(bench.select(["bode+margins*"]), repeat=1)
+    res = record["results"]["bode+margins[atividade_9]"]
+    ref = record["results"][res["reference"]]
+    assert res["speedup"] == ref["best"] / res["best"]
+    assert not bench.regressions(record, record)
@@ -0,0 +1,54 @@
+"""ResponseCache: acertos em memória e em disco devolvem o mesmo que a simulação."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.cache import ResponseCache, content_key
+from ltc.sweep import closed_loop, gain_sweep
+
+NUM, DEN = [1.0], [1.0, 1.2, 9.0]  # atividade_5/parte_2
+KS = [1.0, 10.0]
+T = np.linspace(0, 10, 1000)
+
+
+def test_memory_hits_and_misses():
+    cache = ResponseCache()
+    first = gain_sweep(NUM, DEN, KS, T, cache=cache)
+    again = gain_sweep(NUM, DEN, KS + [20.0], T, cache=cache)
+    assert cache.stats() == {"hits": 2, "disk_hits": 0, "misses": 3, "size": 3}
+    np.testing.assert_array_equal(first.y, gain_sweep(NUM, DEN, KS, T).y)
+    np.testing.assert_array_equal(again.y[:2], first.y)
+    np.testing.assert_array_equal(again.poles[:2], first.poles)
+
+
+def test_disk_layer_and_lru(tmp_path):
+    num, den = closed_loop(NUM, DEN, KS)
+    ResponseCache(directory=tmp_path).responses(num, den, T)
+    cache = ResponseCache(maxsize=1, directory=tmp_path)
+    y, p = cache.responses(num, den, T)
+    assert cache.disk_hits == 2 and cache.misses == 0 and len(cache) == 1
+    np.testing.assert_array_equal(y, gain_sweep(NUM, DEN, KS, T).y)
+
+
+def test_key_depends_on_content():
+    num, den = closed_loop(NUM, DEN, KS)
+    assert content_key(num[0], den[0], T) == content_key(list(num[0]), den[0] * 1.0, T.copy())
+    assert content_key(num[0], den[0], T) != content_key(num[1], den[1], T)
+    assert content_key(num[0], den[0], T) != content_key(num[0], den[0], T[:-1])
+    assert content_key([-0.0], T) == content_key([0.0], T)
+
+
+@pytest.mark.parametrize("num, den", [([1.0], [1.0, 6.0, 5.0, 0.0]),  # atividade_7
+                                      ([1.0], [1.0, 2.0, 3.0]),
+                                      ([1.0, 1.0], [1.0, 2.0, 3.0])])
+def test_numerator_shorter_than_denominator(num, den):
+    t = np.linspace(0, 5, 500)
+    cache = ResponseCache()
+    y, p = cache.responses(num, den, t)
+    _, ref = ctrl.step_response(ctrl.tf(num, den), T=t)
+    np.testing.assert_allclose(y[0], ref, rtol=0, atol=1e-9 * max(1.0, np.abs(ref).max()))
+    np.testing.assert_allclose(np.sort_complex(p[0]), np.sort_complex(np.roots(den)), atol=1e-9)
+    # o mesmo sistema já completado é o mesmo acerto
+    cache.responses(np.pad(num, (len(den) - len(num), 0)), den, t)
+    assert cache.hits == 1
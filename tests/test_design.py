@@ -0,0 +1,91 @@
+"""Intervalos de ganho da região de projeto contra uma varredura densa em K."""
+
+import numpy as np
+import pytest
+
+from ltc.design import DesignRegion, design_gains, structure, zeta_from_mp
+
+ZETA = float(zeta_from_mp(10.0))
+SIGMA = -0.4  # TS_MAX = 10 s, como em atividade_8
+
+
+def _brute(num, den, K, dominance, cancel):
+    # pertinência por np.roots em cada K, com a mesma regra de dominância
+    zeros = np.roots(num) if len(num) > 1 else np.zeros(0)
+    out = []
+    for k in K:
+        p = np.roots(np.polyadd(den, k * np.asarray(num, dtype=float)))
+        if cancel and zeros.size:
+            far = np.all(np.abs(p[:, None] - zeros) > cancel * np.abs(zeros), axis=1)
+            p = p[far] if far.any() else p
+        if dominance is not None:
+            slow = p.real.max()
+            p = p[p.real >= (dominance * slow if slow < 0 else slow)]
+        out.append(np.all((p.real <= SIGMA) & (-p.real >= ZETA * np.abs(p) - 1e-9)))
+    return np.array(out)
+
+
+def _member(region, K):
+    lo, hi = region.intervals.T
+    return ((K[:, None] >= lo) & (K[:, None] <= hi)).any(axis=1)
+
+
+def _systems():
+    # P, I e PI (zero em -1) de atividade_8 e P sobre uma planta com modo
+    # rápido pouco amortecido (-10 ± 99,5j, ζ = 0,1)
+    plant = ([1.0], [1.0, 5.0, 6.0])
+    out = [(np.polymul(cn, plant[0]), np.polymul(cd, plant[1]))
+           for cn, cd in (structure(kind) for kind in ("P", "I", "PI"))]
+    out.append(([1.0], np.polymul([1.0, 3.0, 2.0], [1.0, 20.0, 10000.0])))
+    return out
+
+
+@pytest.mark.parametrize("options", [{"dominance": None, "cancel": 0.0}, {}])
+def test_intervals_match_dense_scan(options):
+    dominance = options.get("dominance", 5.0)
+    cancel = options.get("cancel", 0.05)
+    K = np.geomspace(1e-3, 1e4, 4000)
+    for (num, den), region in zip(_systems(), design_gains(_systems(), ZETA, SIGMA, **options)):
+        expected = _brute(num, den, K, dominance, cancel)
+        got = _member(region, K)
+        # só discordâncias a menos de 1e-6 relativo de uma fronteira
+        near = np.min(np.abs(K[:, None] / region.boundaries - 1.0), axis=1, initial=np.inf) < 1e-6
+        assert np.all((got == expected) | near)
+
+
+def test_fast_poles_do_not_block_dominant_design():
+    fast = _systems()[-1:]
+    strict = design_gains(fast, ZETA, SIGMA, dominance=None, cancel=0.0)[0]
+    dominant = design_gains(fast, ZETA, SIGMA)[0]
+    assert strict.intervals.size == 0
+    assert dominant.intervals.size > 0
+
+
+def test_atividade_8_unchanged_by_dominance():
+    strict = design_gains(_systems()[:3], ZETA, SIGMA, dominance=None, cancel=0.0)
+    for a, b in zip(strict, design_gains(_systems()[:3], ZETA, SIGMA)):
+        assert np.allclose(a.intervals, b.intervals)
+
+
+def test_gain_is_strictly_inside_the_region():
+    systems = _systems()[:3]
+    for (num, den), region in zip(systems, design_gains(systems, ZETA, SIGMA)):
+        K = region.gain()
+        lo, hi = region.intervals[-1]
+        assert lo < K < hi
+        # polos dominantes com folga em ζ e σ (não sobre a fronteira)
+        assert _brute(num, den, [K], 5.0, 0.05)[0]
+        p = np.roots(np.polyadd(den, K * np.asarray(num, dtype=float)))
+        slow = p[p.real >= 5.0 * p.real.max()]
+        assert np.all(-slow.real > ZETA * np.abs(slow) + 1e-3) or np.all(slow.imag == 0)
+
+
+def test_gain_edge_cases():
+    empty = DesignRegion(np.empty((0, 2)), np.empty(0))
+    assert empty.gain() is None
+    assert DesignRegion(np.array([[0.0, 4.0]]), np.empty(0)).gain() == 2.0
+    assert DesignRegion(np.array([[1.0, 2.0], [4.0, 16.0]]), np.empty(0)).gain() == 8.0
+    # K_max infinito é limitado a k_limit
+    unbounded = DesignRegion(np.array([[4.0, np.inf]]), np.empty(0))
+    assert unbounded.gain(k_limit=100.0) == 20.0 and np.isfinite(unbounded.gain())
+    assert unbounded.gain(k_limit=2.0) is None
@@ -0,0 +1,58 @@
+"""evaluate_early e method="early" contra o caminho completo (method="ss")."""
+
+import numpy as np
+import pytest
+
+from ltc.tuning import (cost, evaluate_batch, evaluate_early, is_feasible, pid_grid_search,
+                        ultimate_gain, zn_pid)
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+TS_MAX, MP_MAX = 7.0, 20.0
+
+
+@pytest.fixture(scope="module")
+def problem():
+    t = np.linspace(0.0, 20.0, 2000)
+    return t, zn_pid(*ultimate_gain(NUM, DEN))
+
+
+def test_same_classification_on_random_gains(problem):
+    t, base = problem
+    rng = np.random.default_rng(0)
+    mult = np.exp(rng.uniform(np.log(0.3), np.log(3.0), (2000, 3)))
+    gains = [tuple(base * m) for m in mult]
+    full = evaluate_batch(NUM, DEN, t, gains)
+    early = evaluate_early(NUM, DEN, t, gains, ts_max=TS_MAX, mp_max=MP_MAX)
+    assert any(c["rejected"] for c in early if c is not None)
+    for a, b in zip(full, early):
+        assert (a is None) == (b is None)
+        if a is None:
+            continue
+        assert is_feasible(a, TS_MAX, MP_MAX) == is_feasible(b, TS_MAX, MP_MAX)
+        if b["rejected"]:
+            # limites inferiores: o custo nunca é superestimado
+            assert b["Ts"] <= a["Ts"] and b["Mp"] <= a["Mp"] + 1e-9
+            assert cost(b, TS_MAX, MP_MAX) <= cost(a, TS_MAX, MP_MAX) + 1e-9
+        else:
+            assert b["Ts"] == pytest.approx(a["Ts"], abs=1e-12)
+
+
+def test_fallback_candidate_is_not_rejected(problem):
+    # nunca acomoda em 20 s, mas cruza 98,2% em ~2,09 s (Ts de reserva)
+    t, _ = problem
+    gains = [(4.316, 4.667, 19.97)]
+    a = evaluate_batch(NUM, DEN, t, gains)[0]
+    b = evaluate_early(NUM, DEN, t, gains, ts_max=TS_MAX, mp_max=MP_MAX)[0]
+    assert is_feasible(a, TS_MAX, MP_MAX)
+    assert not b["rejected"] and b["Ts"] == a["Ts"]
+
+
+def test_grid_search_matches_ss(problem):
+    t, base = problem
+    ss = pid_grid_search(NUM, DEN, t, base, TS_MAX, MP_MAX, processes=1, method="ss")
+    early = pid_grid_search(NUM, DEN, t, base, TS_MAX, MP_MAX, processes=1, method="early")
+    assert ss[2] == early[2]
+    for a, b in zip(ss[:2], early[:2]):
+        assert (a["Kp"], a["Ki"], a["Kd"]) == (b["Kp"], b["Ki"], b["Kd"])
+        assert b["Ts"] == a["Ts"] and b["Mp"] == pytest.approx(a["Mp"])
+        assert b["y"].size == t.size
@@ -0,0 +1,45 @@
+"""forced_responses (FOH e ZOH) contra o python-control."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.simulation import discretize, forced_responses
+
+# atividade_5 (parte 2) com K = 1 e K = 10, RLC de atividade_1 normalizado e G4 de atividade_9
+SYSTEMS = [([1.0], [1.0, 2.2, 9.0]), ([1.0], [1.0, 11.2, 9.0]), ([1.0], [1.0, 0.5, 1.0]),
+           ([1.0, -6.0], [1.0, 15.0, 86.0, 150.0])]
+T = np.linspace(0.0, 20.0, 2001)
+INPUTS = [np.sin(1.3 * T), T, np.where(T > 5.0, 1.0, 0.0) * np.cos(0.4 * T)]
+
+
+@pytest.mark.parametrize("num, den", SYSTEMS)
+def test_foh_matches_forced_response(num, den):
+    Y = forced_responses(num, den, T, np.stack(INPUTS)[None])[0]
+    for y, u in zip(Y, INPUTS):
+        _, ref = ctrl.forced_response(ctrl.tf(num, den), T, u)
+        np.testing.assert_allclose(y, ref, rtol=0, atol=1e-9 * max(1.0, np.abs(ref).max()))
+
+
+@pytest.mark.parametrize("num, den", SYSTEMS)
+def test_zoh_matches_sampled_system(num, den):
+    dt = T[1] - T[0]
+    y = forced_responses(num, den, T, INPUTS[0], hold="zoh")[0]
+    Gd = ctrl.sample_system(ctrl.tf(num, den), dt, method="zoh")
+    _, ref = ctrl.forced_response(Gd, np.arange(T.size) * dt, INPUTS[0])
+    np.testing.assert_allclose(y, ref, rtol=0, atol=1e-9)
+
+
+def test_batch_blocks_and_cache():
+    num = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+    den = np.array([d for _, d in SYSTEMS[:3]])
+    U = np.stack(INPUTS)
+    Y = forced_responses(num, den, T, U)
+    for i in range(3):
+        np.testing.assert_allclose(Y[i], forced_responses(num[i], den[i], T, U[i])[0], atol=1e-12)
+    np.testing.assert_allclose(forced_responses(num, den, T, U, block=7), Y, atol=1e-12)
+    dt = T[1] - T[0]
+    first, again = discretize(num, den, dt), discretize(num.tolist(), den, dt)
+    assert again is first and not first.Phi.flags.writeable
+    with pytest.raises(ValueError):
+        forced_responses(num, den, T, U[:, :-1])
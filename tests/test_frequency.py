@@ -0,0 +1,67 @@
+"""bode e stability_margins contra o python-control (atividades 6, 7 e 9)."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.frequency import bode, freq_response, margins_of, stability_margins
+
+SYSTEMS = [
+    # atividade_9
+    ([1000], [1, 110, 1000]), ([1, 100], [1, 27, 50]), ([100], [1, 2, 50]),
+    ([1, -6], [1, 15, 86, 150]),
+    # atividade_7 com K = 10 e K = Kcr
+    ([10], [1, 6, 5, 0]), ([30], [1, 6, 5, 0]),
+    # atividade_6
+    ([1, 10], [1, 7, 10, 0]), ([1], [1, 5, 9, 5, 0]), ([1, 3], [1, 5, 20, 16, 0]),
+    ([1, 2, 4], [1, 11.4, 39, 43.6, 24, 0]),
+]
+
+
+def same(a, b, rel, abs_):
+    if np.isinf(b) or np.isnan(b):
+        return (np.isinf(a) and np.isinf(b)) or (np.isnan(a) and np.isnan(b))
+    return a == pytest.approx(b, rel=rel, abs=abs_)
+
+
+@pytest.fixture(scope="module")
+def margins():
+    return margins_of(SYSTEMS)
+
+
+@pytest.mark.parametrize("i", range(len(SYSTEMS)))
+def test_margins_match_control(margins, i):
+    gm, pm, _, wpc, wgc, _ = ctrl.stability_margins(ctrl.tf(*SYSTEMS[i]))
+    assert same(margins.gm[i], gm, 1e-9, 0)
+    assert same(margins.pm[i], pm, 1e-9, 1e-9)
+    assert same(margins.wcg[i], wpc, 1e-9, 0)
+    assert same(margins.wcp[i], wgc, 1e-9, 0)
+
+
+def test_single_system_returns_scalars(margins):
+    m = stability_margins(*SYSTEMS[4])
+    assert np.ndim(m.gm) == 0
+    assert tuple(m) == tuple(np.asarray(x)[4] for x in margins)
+
+
+@pytest.mark.parametrize("i", range(len(SYSTEMS)))
+def test_bode_matches_frequency_response(i):
+    num, den = SYSTEMS[i]
+    w = np.geomspace(0.1, 1000.0, 1000)
+    b = bode(num, den, w)
+    ref = ctrl.frequency_response(ctrl.tf(num, den), w)
+    np.testing.assert_allclose(b.mag[0], ref.magnitude, rtol=1e-10)
+    np.testing.assert_allclose(b.mag_db[0], 20 * np.log10(ref.magnitude), rtol=0, atol=1e-9)
+    # fase contínua, começando em (-270°, 90°], igual à do control a menos de 360°
+    wrapped = np.angle(np.exp(1j * np.radians(b.phase[0] - np.degrees(np.angle(ref.complex)))))
+    np.testing.assert_allclose(wrapped, 0.0, atol=1e-9)
+    assert -270.0 < b.phase[0, 0] <= 90.0
+    assert np.abs(np.diff(b.phase[0])).max() < 180.0
+    np.testing.assert_allclose(freq_response(num, den, w)[0], ref.complex, rtol=1e-10)
+
+
+def test_float32_bode():
+    num, den = SYSTEMS[6]
+    b64, b32 = bode(num, den), bode(num, den, dtype=np.float32)
+    np.testing.assert_allclose(b32.mag_db, b64.mag_db, atol=1e-3)
+    np.testing.assert_allclose(b32.phase, b64.phase, atol=1e-3)
@@ -0,0 +1,40 @@
+"""pid_grid_search: pool de processos e caminho rápido contra a busca serial com o python-control."""
+
+import numpy as np
+import pytest
+
+from ltc.tuning import pid_grid_search, ultimate_gain, zn_pid
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+TS_MAX, MP_MAX = 7.0, 20.0
+MULTS, SCALES = (0.75, 1.0, 1.25), (0.9, 1.0, 1.1)
+
+
+def summary(result):
+    ok, alt, tested = result
+    gains = [None if c is None else (c["Kp"], c["Ki"], c["Kd"]) for c in (ok, alt)]
+    return gains, tested
+
+
+@pytest.fixture(scope="module")
+def problem():
+    return np.linspace(0.0, 20.0, 2000), zn_pid(*ultimate_gain(NUM, DEN))
+
+
+@pytest.fixture(scope="module")
+def serial(problem):
+    t, base = problem
+    return pid_grid_search(NUM, DEN, t, base, TS_MAX, MP_MAX, MULTS, SCALES, processes=1)
+
+
+@pytest.mark.parametrize("processes, method", [(2, "control"), (1, "ss"), (2, "ss"), (2, "early")])
+def test_same_result_as_serial(problem, serial, processes, method):
+    t, base = problem
+    res = pid_grid_search(NUM, DEN, t, base, TS_MAX, MP_MAX, MULTS, SCALES,
+                          processes=processes, method=method)
+    assert summary(res) == summary(serial)
+    for a, b in zip(res[:2], serial[:2]):
+        if a is not None:
+            assert a["Ts"] == b["Ts"]
+            assert a["Mp"] == pytest.approx(b["Mp"], abs=1e-8)
+            np.testing.assert_allclose(a["y"], b["y"], rtol=0, atol=1e-9)
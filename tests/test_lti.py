@@ -0,0 +1,63 @@
+"""LTIBatch contra o python-control nos sistemas de atividade_6 e atividade_9."""
+
+import warnings
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.lti import LTIBatch
+
+PAIRS = [([1, 10], [1, 7, 10, 0]), ([1, 3], [1, 7, 10, 0]), ([1], [1, 5, 9, 5, 0]),
+         ([1, 3], [1, 5, 20, 16, 0]), ([1, 2, 4], [1, 11.4, 39, 43.6, 24, 0]),
+         ([1000], [1, 110, 1000]), ([1, 100], [1, 27, 50]), ([100], [1, 2, 50]),
+         ([1, -6], [1, 15, 86, 150])]
+
+
+def same_roots(mine, theirs):
+    mine = np.sort_complex(mine[~np.isnan(mine)])
+    np.testing.assert_allclose(mine, np.sort_complex(theirs), rtol=1e-9, atol=1e-9)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    return LTIBatch.from_pairs(PAIRS)
+
+
+def test_round_trip(batch):
+    again = LTIBatch.from_ctrl(batch.to_ctrl())
+    np.testing.assert_array_equal(again.num, batch.num)
+    np.testing.assert_array_equal(again.den, batch.den)
+    assert batch.orders.tolist() == [len(d) - 1 for _, d in PAIRS]
+    for (num, den), G in zip(PAIRS, batch.to_ctrl()):
+        np.testing.assert_array_equal(G.num[0][0], num)
+        np.testing.assert_array_equal(G.den[0][0], den)
+
+
+def test_poles_zeros_dc_gain(batch):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # dcgain de integradores
+        for i, G in enumerate(batch.to_ctrl()):
+            same_roots(batch.poles()[i], ctrl.poles(G))
+            same_roots(batch.zeros()[i], ctrl.zeros(G))
+            assert batch.dc_gain()[i] == pytest.approx(ctrl.dcgain(G))
+
+
+def test_series_feedback_and_step(batch):
+    t = np.linspace(0.0, 10.0, 1000)
+    H = ([1.0], [0.1, 1.0])  # sensor de 1ª ordem
+    closed = batch.series(([2.0], [1.0])).feedback(H)
+    Y = closed.step(t)
+    for i, G in enumerate(batch.to_ctrl()):
+        ref = ctrl.feedback(2.0 * G, ctrl.tf(*H))
+        same_roots(closed.poles()[i], ctrl.poles(ref))
+        _, y = ctrl.step_response(ref, T=t)
+        np.testing.assert_allclose(Y[i], y, rtol=0, atol=1e-9 * max(1.0, np.abs(y).max()))
+    unit = batch.feedback()
+    for i, G in enumerate(batch.to_ctrl()):
+        same_roots(unit.poles()[i], ctrl.poles(ctrl.feedback(G, 1)))
+
+
+def test_rejects_improper():
+    with pytest.raises(ValueError):
+        LTIBatch([1, 0, 0], [1, 1])
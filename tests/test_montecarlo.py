@@ -0,0 +1,49 @@
+"""monte_carlo por trechos e janelas contra a simulação completa + step_metrics."""
+
+import numpy as np
+import pytest
+
+from ltc.metrics import step_metrics
+from ltc.montecarlo import monte_carlo, rlc_coefs, sample_parameters
+from ltc.second_order import rlc_params, second_order_step
+
+R, L, C = 50.0, 10e-3, 10e-6  # atividade_1/exercicio2.py
+T = np.linspace(0.0, 0.02, 1500)
+
+
+@pytest.fixture(scope="module")
+def samples():
+    p = sample_parameters([R, L, C], (0.05, 0.10, 0.10), 300, seed=4)
+    wn, zeta = rlc_params(*p.T)
+    return p, wn, zeta, second_order_step(wn, zeta, T)
+
+
+def test_matches_full_simulation(samples):
+    p, wn, zeta, Y = samples
+    mc = monte_carlo(*rlc_coefs(*p.T), T, processes=1, memory=2**12, spans=3)
+    np.testing.assert_allclose(mc.envelope, np.percentile(Y, mc.levels, axis=0), atol=1e-9)
+    np.testing.assert_allclose(mc.wn, wn, rtol=1e-12)
+    np.testing.assert_allclose(mc.zeta, zeta, rtol=1e-12)
+    ref = step_metrics(Y, T, band=(0.982, 1.02), target=1.0)
+    for name in ("Mp", "y_final", "e_ss"):
+        np.testing.assert_allclose(mc.metrics[name], ref[name], atol=1e-9)
+    for name in ("Ts", "Tr", "t_peak"):
+        np.testing.assert_array_equal(mc.metrics[name], ref[name])
+
+
+def test_independent_of_split(samples):
+    p = samples[0]
+    num, den = rlc_coefs(*p.T)
+    a = monte_carlo(num, den, T, processes=1, spans=1)
+    b = monte_carlo(num, den, T, processes=2, spans=5, memory=2**11)
+    np.testing.assert_allclose(b.envelope, a.envelope, atol=1e-10)
+    for name in ("Ts", "Tr", "t_peak"):
+        np.testing.assert_array_equal(b.metrics[name], a.metrics[name])
+    np.testing.assert_allclose(b.metrics["Mp"], a.metrics["Mp"], atol=1e-9)
+
+
+def test_sample_parameters():
+    u = sample_parameters([1.0, 2.0], 0.1, 10000, seed=1)
+    assert (np.abs(u / [1.0, 2.0] - 1) <= 0.1).all()
+    n = sample_parameters([1.0, 2.0], 0.3, 10000, dist="normal", seed=1)
+    np.testing.assert_allclose(n.std(axis=0) / [1.0, 2.0], 0.1, rtol=0.05)
@@ -0,0 +1,54 @@
+"""pid_optimize na planta de atividade_7: orçamento, traço e métricas conferidas."""
+
+import numpy as np
+import pytest
+
+from ltc.tuning import (evaluate_batch, evaluate_pid, is_feasible, pid_optimize, smooth_cost,
+                        ultimate_gain, zn_pid)
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]
+TS_MAX, MP_MAX = 7.0, 20.0
+
+
+@pytest.fixture(scope="module")
+def problem():
+    return np.linspace(0.0, 20.0, 2000), zn_pid(*ultimate_gain(NUM, DEN))
+
+
+@pytest.mark.parametrize("method", ["nelder-mead", "gradient"])
+def test_result_is_feasible_and_checked(problem, method):
+    t, base = problem
+    res = pid_optimize(NUM, DEN, t, base, TS_MAX, MP_MAX, method=method, budget=40)
+    assert res.evaluations == len(res.trace) <= 40
+    assert res.best is not None and is_feasible(res.best, TS_MAX, MP_MAX)
+    # o melhor é uma das simulações registradas, com a resposta completa
+    gains = (res.best["Kp"], res.best["Ki"], res.best["Kd"])
+    row = res.trace[np.argmin(np.abs(res.trace["Kp"] - gains[0]))]
+    assert (row["Kp"], row["Ki"], row["Kd"]) == gains and row["Ts"] == res.best["Ts"]
+    assert res.best["y"].size == t.size
+    # e as métricas são as do caminho do python-control
+    ref = evaluate_pid(NUM, DEN, t, gains)
+    assert res.best["Ts"] == ref["Ts"]
+    assert res.best["Mp"] == pytest.approx(ref["Mp"], abs=1e-8)
+    # J_best é o mínimo acumulado de J
+    np.testing.assert_array_equal(res.trace["J_best"], np.minimum.accumulate(res.trace["J"]))
+
+
+def test_smooth_cost_tracks_cost(problem):
+    t, base = problem
+    dt = t[1] - t[0]
+    for m in (0.6, 0.8, 1.0, 1.2):
+        cand = evaluate_batch(NUM, DEN, t, [tuple(np.asarray(base) * m)])[0]
+        cand["t"] = t
+        J = smooth_cost(cand, TS_MAX, MP_MAX)
+        if is_feasible(cand, TS_MAX, MP_MAX):
+            # viável: o custo é o Ts interpolado, a menos de uma amostra do Ts
+            assert cand["Ts"] - dt <= J <= cand["Ts"] + 1e-12
+        else:
+            assert J > TS_MAX
+
+
+def test_unknown_method(problem):
+    t, base = problem
+    with pytest.raises(ValueError):
+        pid_optimize(NUM, DEN, t, base, TS_MAX, MP_MAX, method="newton")
@@ -0,0 +1,36 @@
+"""Ganho e período críticos (atividade_7) e detector de picos vetorizado."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.metrics import local_peaks, oscillation
+from ltc.tuning import ultimate_gain
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # s³ + 6 s² + 5 s: Kcr = 30, ωcr = √5
+
+
+def test_crossing_and_bisection_agree():
+    Kcr, Pcr = ultimate_gain(NUM, DEN)
+    assert Kcr == pytest.approx(30.0, rel=1e-12)
+    assert Pcr == pytest.approx(2 * np.pi / np.sqrt(5.0), rel=1e-12)
+    Kb, Pb = ultimate_gain(NUM, DEN, method="bisection")
+    assert Kb == pytest.approx(Kcr, rel=1e-9)
+    assert Pb == pytest.approx(Pcr, rel=1e-6)
+    with pytest.raises(ValueError):
+        ultimate_gain([1.0], [1.0, 1.0])
+
+
+def test_peaks_match_sample_loop():
+    # laço de atividade_7/exercicio2.py sobre a resposta com K = Kcr
+    t = np.linspace(0, 60.0, 5000)
+    _, y = ctrl.step_response(ctrl.feedback(30.0 * ctrl.tf(NUM, DEN), 1), T=t)
+    loop = [i for i in range(1, len(y) - 1) if y[i - 1] < y[i] > y[i + 1]]
+    idx, t_pk, y_pk = local_peaks(y, t)
+    assert idx.tolist() == loop
+    # o vértice interpolado fica a menos de meia amostra do pico amostrado
+    assert np.all(np.abs(t_pk - t[idx]) <= 0.5 * (t[1] - t[0]) + 1e-12)
+    assert np.all(y_pk >= y[idx])
+    osc = oscillation(y, t)
+    assert osc.period == pytest.approx(2 * np.pi / np.sqrt(5.0), rel=1e-3)
+    assert osc.decay_ratio == pytest.approx(1.0, abs=1e-3)
@@ -0,0 +1,63 @@
+"""Arquivo de Pareto incremental contra a filtragem de todos os candidatos."""
+
+import numpy as np
+import pytest
+
+from ltc.pareto import (ParetoArchive, evaluate_objectives, explore, non_dominated,
+                        sample_gains)
+from ltc.tuning import evaluate_batch, select, ultimate_gain, zn_pid
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+
+
+def rows(A):
+    # linhas sem a ordem de chegada
+    return sorted(map(tuple, A))
+
+
+@pytest.fixture(scope="module")
+def problem():
+    t = np.linspace(0.0, 20.0, 2000)
+    base = zn_pid(*ultimate_gain(NUM, DEN))
+    gains = sample_gains(base, 256, seed=1)
+    return t, base, gains, evaluate_objectives(NUM, DEN, t, gains)
+
+
+def test_objectives_match_evaluate_batch(problem):
+    t, _, gains, F = problem
+    for row, cand in zip(F[:64], evaluate_batch(NUM, DEN, t, [tuple(g) for g in gains[:64]])):
+        if cand is None:
+            assert np.isnan(row).all()
+        else:
+            assert row[0] == cand["Ts"] and row[1] == pytest.approx(cand["Mp"], abs=1e-12)
+            assert row[2] > 0
+
+
+def test_incremental_archive_is_the_front(problem):
+    t, base, gains, F = problem
+    archive = explore(NUM, DEN, t, base, n=256, batch=48, seed=1, processes=1)
+    ok = ~np.isnan(F).any(axis=1)
+    front = non_dominated(F[ok])
+    assert archive.evaluated == ok.sum()
+    assert rows(archive.objectives) == rows(F[ok][front])
+    assert rows(archive.gains) == rows(gains[ok][front])
+    # o melhor viável do arquivo é o mesmo de select sobre todos os candidatos
+    designs = [dict(Kp=g[0], Ki=g[1], Kd=g[2], Ts=f[0], Mp=f[1]) for g, f in zip(gains[ok], F[ok])]
+    for ts_max, mp_max in ((7.0, 20.0), (5.0, 10.0), (3.0, 5.0)):
+        best, _ = archive.pick(ts_max, mp_max)
+        ref, _, _ = select(designs, ts_max, mp_max)
+        assert (best is None) == (ref is None)
+        if best is not None:
+            assert best["Ts"] == ref["Ts"]
+
+
+def test_save_load_and_processes(problem, tmp_path):
+    t, base, _, _ = problem
+    archive = explore(NUM, DEN, t, base, n=128, batch=32, seed=2, processes=1)
+    archive.save(tmp_path / "pareto.npz")
+    again = ParetoArchive.load(tmp_path / "pareto.npz")
+    np.testing.assert_array_equal(again.gains, archive.gains)
+    np.testing.assert_array_equal(again.objectives, archive.objectives)
+    assert again.evaluated == archive.evaluated
+    pooled = explore(NUM, DEN, t, base, n=128, batch=32, seed=2, processes=2)
+    np.testing.assert_array_equal(pooled.objectives, archive.objectives)
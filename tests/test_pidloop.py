@@ -0,0 +1,51 @@
+"""PIDLoop/evaluate_batch contra o caminho do python-control (evaluate_pid)."""
+
+import numpy as np
+import pytest
+
+from ltc.simulation import PIDLoop
+from ltc.tuning import evaluate_batch, evaluate_pid, ultimate_gain, zn_pid
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+
+
+@pytest.fixture(scope="module")
+def gains():
+    base = np.array(zn_pid(*ultimate_gain(NUM, DEN)))
+    rng = np.random.default_rng(1)
+    mult = np.exp(rng.uniform(np.log(0.3), np.log(3.0), (40, 3)))
+    grid = [tuple(base * m) for m in (0.5, 1.0, 1.5)]
+    return grid + [tuple(base * m) for m in mult]
+
+
+def test_step_matches_control(gains):
+    t = np.linspace(0.0, 20.0, 2000)
+    Y = PIDLoop(NUM, DEN).step(gains, t)
+    for g, y in zip(gains, Y):
+        ref = evaluate_pid(NUM, DEN, t, g)
+        if ref is None:
+            continue
+        scale = max(1.0, np.abs(ref["y"]).max())
+        np.testing.assert_allclose(y, ref["y"], rtol=0, atol=1e-12 * scale + 1e-10)
+
+
+def test_batch_metrics_match_control(gains):
+    t = np.linspace(0.0, 20.0, 2000)
+    for a, g in zip(evaluate_batch(NUM, DEN, t, gains), gains):
+        b = evaluate_pid(NUM, DEN, t, g)
+        assert (a is None) == (b is None)
+        if a is None:
+            continue
+        assert a["Ts"] == b["Ts"]
+        assert a["Mp"] == pytest.approx(b["Mp"], abs=1e-8)
+
+
+def test_rows_do_not_depend_on_the_batch(gains):
+    # grade longa: vários blocos de _step_uniform e o lote em grupos de linhas
+    t = np.linspace(0.0, 60.0, 9000)
+    loop = PIDLoop(NUM, DEN)
+    Y = loop.step(gains * 8, t)
+    for i in range(0, len(gains), 7):
+        np.testing.assert_array_equal(loop.step(gains[i], t)[0], Y[i])
+    ref = evaluate_pid(NUM, DEN, t, gains[1])
+    np.testing.assert_allclose(Y[1], ref["y"], rtol=0, atol=1e-10)
@@ -0,0 +1,51 @@
+"""batch_roots e classificação contra np.roots e a classificação dos scripts."""
+
+import numpy as np
+import pytest
+from scipy.optimize import linear_sum_assignment
+
+from ltc.polezero import (CRITICAL, MARGINAL, OVER, UNDER, UNSTABLE, analyze, batch_roots,
+                          family)
+from ltc.robust import pid_family
+from ltc.simulation import sort_poles
+
+
+def assert_same_roots(mine, coefs, rtol=1e-8):
+    ref = np.roots(coefs)
+    mine = mine[~np.isnan(mine)]
+    D = np.abs(mine[:, None] - ref[None, :])
+    r, c = linear_sum_assignment(D)
+    assert mine.size == ref.size
+    assert (D[r, c] <= rtol * np.maximum(1.0, np.abs(ref[c]))).all()
+
+
+@pytest.mark.parametrize("degree", [1, 2, 3, 4, 5, 6])
+def test_random_polynomials(degree):
+    rng = np.random.default_rng(degree)
+    P = rng.normal(size=(300, degree + 1))
+    R = batch_roots(P)
+    assert R.shape == (300, degree)
+    for r, p in zip(R, P):
+        assert_same_roots(r, p)
+        np.testing.assert_array_equal(r, sort_poles(r[None])[0])
+
+
+def test_pid_closed_loops_and_mixed_degrees():
+    # quárticas de malha fechada do PID de atividade_7 sobre plantas perturbadas
+    dens = np.array([[1.0, 6.0, 5.0, 0.0]]) * np.linspace(0.8, 1.2, 9)[:, None]
+    _, d_cl = pid_family([1.0], dens, (18.0, 12.8, 6.3))
+    P = np.vstack([d_cl, np.pad([[1.0, 2.0, 50.0]], ((0, 0), (2, 0)))])
+    R = batch_roots(P)
+    for r, p in zip(R, P):
+        assert_same_roots(r, np.trim_zeros(p, "f"))
+    assert np.isnan(R[-1, 2:]).all()
+
+
+def test_second_order_family_regimes():
+    # atividade_2/exercicio3.py: s² + a s + 1
+    a = np.array([-0.5, 0.0, 0.01, 0.5, 1.0, 2.0, 3.0])
+    pa = analyze(family(1.0, a, 1.0))
+    assert pa.regime.tolist() == [UNSTABLE, MARGINAL, UNDER, UNDER, UNDER, CRITICAL, OVER]
+    np.testing.assert_allclose(pa.wn[2:5], 1.0)
+    np.testing.assert_allclose(pa.zeta[2:5], np.repeat(a[2:5, None] / 2.0, 2, axis=1))
+    assert pa.labels[5] == "criticamente amortecido"
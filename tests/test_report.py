@@ -0,0 +1,83 @@
+"""ltc.report: figuras capturadas sem janela e renderizadas só quando mudam."""
+
+import shutil
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from ltc import report
+from ltc.report import build, capture, figure_key
+
+SCRIPT = """
+import matplotlib.pyplot as plt
+import numpy as np
+
+t = np.linspace(0, 10, 200)
+plt.figure()
+plt.plot(t, 1 - np.exp(-t / {tau}))
+plt.title("degrau")
+plt.show()
+plt.figure()
+plt.plot(t, t)
+"""
+
+
+def write(path, tau):
+    path.write_text(SCRIPT.format(tau=tau))
+    return path
+
+
+def test_figure_key_follows_content():
+    t = np.linspace(0, 1, 50)
+    keys = []
+    for y, title in ((t, "a"), (t, "a"), (2 * t, "a"), (t, "b")):
+        fig = plt.figure()
+        plt.plot(t, y)
+        plt.title(title)
+        keys.append(figure_key(fig))
+        plt.close(fig)
+    assert keys[0] == keys[1]
+    assert len(set(keys)) == 3
+    assert figure_key(plt.figure(), {"dpi": 100}) != figure_key(plt.figure(), {"dpi": 200})
+    plt.close("all")
+
+
+def test_build_renders_only_changes(tmp_path):
+    script = write(tmp_path / "exercicio.py", 1.0)
+    out = tmp_path / "imagens"
+    # figuras exibidas com show e as deixadas abertas pelo script
+    assert [p.name for p, *_ in capture(script, out)] == ["exercicio_1.png", "exercicio_2.png"]
+
+    manifest, errors = build([script], out, processes=1)
+    assert not errors and len(manifest) == 2
+    assert all(e["rendered"] for e in manifest.values())
+    assert (out / "exercicio_1.png").exists() and (out / "manifest.json").exists()
+
+    manifest, _ = build([script], out, processes=1)
+    assert not any(e["rendered"] for e in manifest.values())
+
+    write(script, 2.0)
+    manifest, _ = build([script], out, processes=1)
+    assert sorted(e["rendered"] for e in manifest.values()) == [False, True]
+
+
+def test_errors_are_reported_per_script(tmp_path):
+    bad = tmp_path / "quebrado.py"
+    bad.write_text("raise RuntimeError('falhou')\n")
+    manifest, errors = build([bad, write(tmp_path / "ok.py", 1.0)], tmp_path / "out", processes=1)
+    assert list(errors) == [str(bad)] and "falhou" in errors[str(bad)]
+    assert len(manifest) == 2
+
+
+def test_default_run_on_repo_scripts(tmp_path, monkeypatch):
+    # cópia dos scripts das atividades (sobras do editor incluídas), para que
+    # os savefig relativos à raiz não escrevam no repositório
+    for script in report.ROOT.glob("atividade_*/**/*.py"):
+        target = tmp_path / script.relative_to(report.ROOT)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(script, target)
+    monkeypatch.setattr(report, "ROOT", tmp_path)
+    monkeypatch.setenv("LTC_CACHE_DIR", "")
+    scripts = report.default_scripts()
+    assert scripts and all(p.name.startswith("exercicio") for p in scripts)
+    assert report.main(["--out", str(tmp_path / "imagens"), "--processes", "1"]) == 0
@@ -0,0 +1,42 @@
+"""robustness na planta nominal contra evaluate_batch, cost e is_feasible."""
+
+import numpy as np
+import pytest
+
+from ltc.robust import perturb_grid, robustness
+from ltc.tuning import cost, evaluate_batch, is_feasible, ultimate_gain, zn_pid
+
+NUM, DEN = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+TS_MAX, MP_MAX = 7.0, 20.0
+
+
+@pytest.fixture(scope="module")
+def problem():
+    t = np.linspace(0.0, 20.0, 2000)
+    base = np.array(zn_pid(*ultimate_gain(NUM, DEN)))
+    rng = np.random.default_rng(2)
+    mult = np.exp(rng.uniform(np.log(0.3), np.log(3.0), (60, 3)))
+    return t, [tuple(base * m) for m in mult]
+
+
+@pytest.mark.parametrize("reject", [False, True])
+def test_nominal_plant_matches_tuner(problem, reject):
+    t, gains = problem
+    fallback = 0  # respostas que nunca acomodam, mas chegam ao limite inferior
+    for g, a in zip(gains, evaluate_batch(NUM, DEN, t, gains)):
+        r = robustness(NUM, [DEN], g, t, TS_MAX, MP_MAX, reject=reject)
+        if a is None or not np.isfinite(r.Mp[0]):
+            continue
+        assert bool(r.meets[0]) == is_feasible(a, TS_MAX, MP_MAX)
+        if r.exact[0]:
+            assert r.Ts[0] == a["Ts"]
+            assert r.Mp[0] == pytest.approx(a["Mp"], abs=1e-9)
+            assert r.cost[0] == pytest.approx(cost(a, TS_MAX, MP_MAX))
+        fallback += np.isfinite(a["Ts"]) and abs(a["y"][-1] - 1.0) > 0.02
+    assert fallback > 0
+
+
+def test_grid_nominal_row_is_central():
+    plants = perturb_grid(DEN, 0.1, points=3)
+    assert plants.shape == (27, 4)
+    np.testing.assert_allclose(plants[13], DEN)
@@ -0,0 +1,45 @@
+"""root_loci contra ctrl.root_locus_map nos sistemas de atividade_6."""
+
+import control as ctrl
+import numpy as np
+import pytest
+from scipy.optimize import linear_sum_assignment
+
+from ltc.rootlocus import root_locus, root_loci
+
+SYSTEMS = [([1, 10], [1, 7, 10, 0]), ([1, 3], [1, 7, 10, 0]), ([1], [1, 5, 9, 5, 0]),
+           ([1, 3], [1, 5, 20, 16, 0]), ([1, 2, 4], [1, 11.4, 39, 43.6, 24, 0])]
+
+
+@pytest.fixture(scope="module")
+def loci():
+    return root_loci(SYSTEMS)
+
+
+@pytest.mark.parametrize("i", range(len(SYSTEMS)))
+def test_same_roots_as_control(loci, i):
+    num, den = SYSTEMS[i]
+    L = loci[i]
+    ref = ctrl.root_locus_map(ctrl.tf(num, den), gains=L.K).loci
+    for mine, theirs in zip(L.roots, ref):
+        # mesmas raízes a menos da ordem dos ramos
+        D = np.abs(mine[:, None] - theirs[None, :])
+        r, c = linear_sum_assignment(D)
+        assert (D[r, c] <= 1e-9 * np.maximum(1.0, np.abs(theirs[c]))).all()
+    np.testing.assert_allclose(np.sort_complex(L.poles), np.sort_complex(np.roots(den)), atol=1e-12)
+
+
+@pytest.mark.parametrize("i", range(len(SYSTEMS)))
+def test_branches_are_continuous(loci, i):
+    L = loci[i]
+    assert L.K[0] == 0 and (np.diff(L.K) > 0).all()
+    scale = max(1.0, np.abs(np.concatenate([L.poles, L.zeros])).max())
+    size = np.maximum(scale, np.abs(L.roots[1:]).max(axis=1))
+    step = np.abs(np.diff(L.roots, axis=0)).max(axis=1)
+    assert (step <= 0.02 * size * (1 + 1e-9)).all()
+
+
+def test_single_system_wrapper(loci):
+    L = root_locus(*SYSTEMS[0])
+    np.testing.assert_array_equal(L.K, loci[0].K)
+    np.testing.assert_array_equal(L.roots, loci[0].roots)
@@ -0,0 +1,43 @@
+"""second_order_step contra ctrl.step_response nos sistemas de atividade_1 e atividade_2."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.second_order import rlc_params, second_order_step
+
+
+def check(wn, zeta, t, Y, atol):
+    for w, z, y in zip(np.broadcast_to(wn, Y.shape[:1]), np.broadcast_to(zeta, Y.shape[:1]), Y):
+        _, ref = ctrl.step_response(ctrl.tf([w * w], [1.0, 2.0 * z * w, w * w]), T=t)
+        np.testing.assert_allclose(y, ref, rtol=0, atol=atol)
+
+
+def test_rlc_regimes():
+    # atividade_1/exercicio5.py: sub, crítico e sobreamortecido
+    L, C = 10e-3, 10e-6
+    Rs = np.array([50.0, 2.0 * np.sqrt(L / C), 120.0])
+    wn, zeta = rlc_params(Rs, L, C)
+    np.testing.assert_allclose(zeta[1], 1.0)
+    t = np.linspace(0.0, max(5 * 2 * np.pi / wn, 0.02), 2000)
+    check(wn, zeta, t, second_order_step(wn, zeta, t), 1e-9)
+
+
+def test_family_and_float32():
+    # atividade_2/exercicio3.py: 1/(s² + a s + 1), ζ = a/2
+    a_list = [0.01, 0.02, 0.05, 0.1, 0.5, 1.0, 2.0]
+    zeta = np.r_[0.0, np.array(a_list) / 2.0, 1.0 + 1e-9, 2.5]
+    t = np.linspace(0.0, 50.0, 3000)
+    Y = second_order_step(1.0, zeta, t)
+    check(1.0, zeta, t, Y, 1e-9)
+    Y32 = second_order_step(1.0, zeta, t, dtype=np.float32)
+    assert Y32.dtype == np.float32
+    np.testing.assert_allclose(Y32, Y, rtol=0, atol=1e-5)
+
+
+def test_per_system_time_grid():
+    wn, zeta = np.array([1.0, 4.0]), np.array([0.3, 1.5])
+    T = np.linspace(0.0, 10.0, 500) / wn[:, None]
+    Y = second_order_step(wn, zeta, T)
+    for i in range(2):
+        assert Y[i] == pytest.approx(second_order_step(wn[i], zeta[i], T[i])[0])
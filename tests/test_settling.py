@@ -0,0 +1,51 @@
+"""settling_index/first_persistent_time contra a busca O(n²) dos scripts originais."""
+
+import numpy as np
+import pytest
+
+from ltc.metrics import first_persistent_time, settling_index
+from ltc.tuning import evaluate_batch, ultimate_gain, zn_pid
+
+
+def quadratic(signal, time, low, high):
+    # first_persistent_time de atividade_3/exercicio1.py (antes de ltc.metrics)
+    idxs = np.where((signal >= low) & (signal <= high))[0]
+    if idxs.size == 0:
+        return None
+    for idx in idxs:
+        if np.all((signal[idx:] >= low) & (signal[idx:] <= high)):
+            return time[idx]
+    return None
+
+
+def responses():
+    # RLC de atividade_3 (vc) e PID de atividade_7 em torno de Ziegler-Nichols
+    t = np.linspace(0.0, 40.0, 4001)
+    tau, V0 = 560e3 * 10e-6, 5.0
+    yield t, V0 * (1 - np.exp(-t / tau)), 0.982 * V0, 1.02 * V0
+    yield t, V0 * (1 - np.exp(-t / tau)), 0.95 * V0, 1.05 * V0
+    t = np.linspace(0.0, 20.0, 2000)
+    num, den = [1.0], [1.0, 6.0, 5.0, 0.0]
+    base = np.array(zn_pid(*ultimate_gain(num, den)))
+    for m in (0.3, 0.6, 1.0, 1.5, 2.5):
+        r = evaluate_batch(num, den, t, [tuple(base * m)])[0]
+        yield t, r["y"], 0.982, 1.02
+
+
+@pytest.mark.parametrize("t, y, low, high", list(responses()))
+def test_matches_quadratic_search(t, y, low, high):
+    assert first_persistent_time(y, t, low, high) == quadratic(y, t, low, high)
+
+
+def test_matrix_and_edge_cases():
+    t = np.arange(6.0)
+    Y = np.array([
+        [0.0, 1.0, 1.0, 1.0, 1.0, 1.0],   # entra em 1
+        [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],   # sempre dentro
+        [1.0, 0.0, 1.0, 0.0, 1.0, 0.0],   # termina fora
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],   # nunca entra
+    ])
+    np.testing.assert_array_equal(settling_index(Y, 0.9, 1.1), [1, 0, -1, -1])
+    for y, ts in zip(Y, first_persistent_time(Y, t, 0.9, 1.1)):
+        ref = quadratic(y, t, 0.9, 1.1)
+        assert (np.isnan(ts) and ref is None) or ts == ref
@@ -0,0 +1,95 @@
+"""Invalidação dos estágios de ltc.stages."""
+
+import io
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from ltc.stages import Pipeline, pipeline
+
+ROOT = Path(__file__).resolve().parents[1]
+calls = []
+
+
+def square(x):
+    calls.append("square")
+    return np.asarray(x) ** 2
+
+
+def total(y):
+    calls.append("total")
+    return float(np.sum(y))
+
+
+def parity(x):
+    calls.append("parity")
+    return np.asarray(x) % 2
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    calls.clear()
+
+
+def test_same_content_reuses_and_changed_content_reruns(tmp_path):
+    pipe = Pipeline(tmp_path)
+    pipe.run("square", square, [1, 2, 3])
+    pipe.run("square", square, np.array([1, 2, 3]).tolist())  # outro objeto, mesmo conteúdo
+    pipe.run("square", square, [1, 2, 4])
+    assert calls == ["square", "square"]
+    assert [status for _, status in pipe.log] == ["run", "memory", "run"]
+    # só a última chave de cada estágio fica em disco
+    assert len(list(tmp_path.glob("square-*.pkl"))) == 1
+
+
+def test_disk_reuse_and_early_cutoff(tmp_path):
+    first = Pipeline(tmp_path)
+    first.run("total", total, first.run("parity", parity, [1, 2, 3]))
+    again = Pipeline(tmp_path)
+    again.run("total", total, again.run("parity", parity, [1, 2, 3]))
+    assert again.executed() == []
+    # entrada nova com a mesma saída: o estágio seguinte é reaproveitado
+    third = Pipeline(tmp_path)
+    third.run("total", total, third.run("parity", parity, [3, 4, 5]))
+    assert third.executed() == ["parity"]
+
+
+def test_keys_follow_content_not_identity():
+    pipe = Pipeline()
+    y = pipe.run("square", square, [1, 2])
+    assert pipe.run("total", total, y) == 5.0
+    y[0] = 10  # saída alterada no lugar: a chave do consumidor muda
+    assert pipe.run("total", total, y) == 14.0
+    # objeto recém-criado (possivelmente com o id de um já coletado)
+    for _ in range(50):
+        assert pipe.run("total", total, np.array([2, 2])) == 4.0
+    assert calls == ["square", "total", "total", "total"]
+
+
+def test_pipeline_without_disk(monkeypatch):
+    monkeypatch.setenv("LTC_CACHE_DIR", "")
+    assert pipeline(ROOT / "atividade_8" / "exercicios.py").directory is None
+    monkeypatch.setenv("LTC_CACHE_DIR", "/tmp/cache")
+    assert pipeline(ROOT / "atividade_8" / "exercicios.py").directory == \
+        Path("/tmp/cache/stages/atividade_8/exercicios")
+
+
+def _run_atividade_8(ts_max):
+    path = ROOT / "atividade_8" / "exercicios.py"
+    source = path.read_text().replace("TS_MAX = 10.0", f"TS_MAX = {ts_max}")
+    scope = {"__file__": str(path), "__name__": "__main__"}
+    with redirect_stdout(io.StringIO()):
+        exec(compile(source, str(path), "exec"), scope)
+    plt.close("all")
+    return scope["stages"].log
+
+
+def test_atividade_8_ts_max_reruns_only_design(tmp_path, monkeypatch):
+    monkeypatch.setenv("LTC_CACHE_DIR", str(tmp_path))
+    assert all(status == "run" for _, status in _run_atividade_8(10.0))
+    assert all(status == "disk" for _, status in _run_atividade_8(10.0))
+    log = dict(_run_atividade_8(8.0))
+    assert log["lugares"] == "disk" and log["projeto"] == "run"
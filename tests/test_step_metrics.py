@@ -0,0 +1,64 @@
+"""step_metrics em lote contra as contas por resposta dos scripts originais."""
+
+import numpy as np
+import pytest
+
+from ltc.metrics import step_metrics
+from ltc.tuning import evaluate_batch, ultimate_gain, zn_pid
+
+
+def script_metrics(y, t, low, high):
+    # evaluate_pid de atividade_7/exercicio5.py (antes de ltc.tuning)
+    Mp = (np.max(y) - 1.0) * 100.0
+    inside = (y >= low) & (y <= high)
+    Ts = None
+    for idx in np.where(inside)[0]:
+        if inside[idx:].all():
+            Ts = t[idx]
+            break
+    if Ts is None:
+        idx = np.where(y >= low)[0]
+        Ts = float(t[idx[0]]) if idx.size else np.inf
+    return Mp, Ts, float(y[-1])
+
+
+@pytest.fixture(scope="module")
+def pid_responses():
+    t = np.linspace(0.0, 20.0, 2000)
+    num, den = [1.0], [1.0, 6.0, 5.0, 0.0]  # atividade_7
+    base = np.array(zn_pid(*ultimate_gain(num, den)))
+    mult = np.exp(np.random.default_rng(3).uniform(np.log(0.3), np.log(3.0), (50, 3)))
+    res = [r for r in evaluate_batch(num, den, t, [tuple(base * m) for m in mult]) if r]
+    return t, np.array([r["y"] for r in res])
+
+
+def test_batch_matches_per_response(pid_responses):
+    t, Y = pid_responses
+    m = step_metrics(Y, t, band=(0.982, 1.02), target=1.0, fallback=True)
+    for y, row in zip(Y, m):
+        Mp, Ts, y_inf = script_metrics(y, t, 0.982, 1.02)
+        assert row["Mp"] == pytest.approx(Mp, abs=1e-9)
+        assert np.nan_to_num(row["Ts"], nan=np.inf) == Ts
+        assert row["y_final"] == y_inf
+        assert row["t_peak"] == t[np.argmax(y)]
+    # a mesma métrica resposta por resposta (entrada 1-D)
+    for y, row in zip(Y[:5], m[:5]):
+        single = step_metrics(y, t, target=1.0, fallback=True)
+        assert single.tolist() == pytest.approx(row.tolist(), nan_ok=True)
+
+
+def test_first_order_relative_to_final_value():
+    # sistemas de atividade_3/exercicio2.py: K (1 - e^{-t/tau})
+    t = np.linspace(0.0, 15.0, 20001)
+    K, tau = np.array([1.0, 2.0, 5.0]), np.array([0.5, 2.0, 0.1])
+    Y = K[:, None] * (1 - np.exp(-t / tau[:, None]))
+    m = step_metrics(Y, t, band=(0.98, 1.02))
+    y_final = K * (1 - np.exp(-15.0 / tau))
+    np.testing.assert_allclose(m["y_final"], y_final)
+    # Ts e Tr analíticos (faixa relativa ao valor final), na resolução da grade
+    dt = t[1] - t[0]
+    Ts = -tau * np.log(1 - 0.98 * y_final / K)
+    Tr = tau * (np.log(1 - 0.1 * y_final / K) - np.log(1 - 0.9 * y_final / K))
+    np.testing.assert_allclose(m["Ts"], Ts, rtol=0, atol=dt)
+    np.testing.assert_allclose(m["Tr"], Tr, rtol=0, atol=dt)
+    assert (m["Mp"] <= 0).all()
@@ -0,0 +1,58 @@
+"""Simulação em blocos (step_chunks/StepStream) e RunningMetrics."""
+
+import numpy as np
+import pytest
+
+from ltc.metrics import RunningMetrics, step_metrics
+from ltc.simulation import StepStream, step_chunks, step_responses
+
+# planta de atividade_5 em malha aberta, malha fechada de atividade_7 e o
+# degrau espelhado da primeira (alvo negativo)
+SYSTEMS = [([1.0], [1.0, 1.2, 9.0]), ([1.0], [1.0, 6.0, 5.0, 1.0]), ([-9.0], [1.0, 1.2, 9.0])]
+
+
+@pytest.mark.parametrize("num, den", SYSTEMS)
+def test_running_metrics_match_step_metrics(num, den):
+    dt, n = 0.01, 6000
+    target = num[-1] / den[-1]
+    running = RunningMetrics(target=target)
+    parts = []
+    for chunk in step_chunks(num, den, dt, chunk=257, n_samples=n):
+        running.update(chunk.t, chunk.y)
+        parts.append(chunk.y)
+    t = np.arange(n) * dt
+    y = np.concatenate(parts, axis=1)
+    assert np.allclose(y, step_responses(num, den, t), atol=1e-12)
+
+    got = running.result()[0]
+    ref = step_metrics(y[0], t, target=target)
+    for field in ("y_final", "y_peak", "t_peak", "Mp", "Ts", "Tr", "e_ss"):
+        assert got[field] == pytest.approx(ref[field], abs=1e-12), field
+
+
+def test_running_metrics_mixed_sign_targets():
+    # alvos de sinais opostos no mesmo lote: o pico segue o sentido de cada alvo
+    num, den = [[9.0], [-9.0]], [1.0, 1.2, 9.0]
+    t = np.arange(3000) * 0.01
+    Y = step_responses(num, den, t)
+    target = np.array([1.0, -1.0])
+    running = RunningMetrics(target=target)
+    for k in range(0, t.size, 100):
+        running.update(t[k:k + 100], Y[:, k:k + 100])
+    got, ref = running.result(), step_metrics(Y, t, target=target)
+    for field in ("y_peak", "t_peak", "Mp", "Ts", "Tr"):
+        np.testing.assert_allclose(got[field], ref[field], atol=1e-12, err_msg=field)
+    assert got["Mp"][0] == pytest.approx(got["Mp"][1]) and got["Mp"][1] > 50.0
+
+
+def test_running_metrics_requires_target():
+    with pytest.raises(ValueError):
+        RunningMetrics(target=None)
+
+
+def test_stream_blocks_match_full_simulation():
+    num, den = SYSTEMS[0]
+    t = np.arange(3000) * 0.01
+    stream = StepStream(np.array([num]), np.array([den], dtype=float), 0.01, 100)
+    y = np.concatenate([stream.advance()[1] for _ in range(30)], axis=1)
+    assert np.allclose(y, step_responses(num, den, t), atol=1e-12)
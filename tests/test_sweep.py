@@ -0,0 +1,29 @@
+"""gain_sweep contra feedback(K*G, 1) e feedback(G, K) do python-control."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.sweep import closed_loop, gain_sweep
+
+# plantas de atividade_5 (partes 1 e 2)
+PLANTS = [([1.0], [3.0, 0.0], np.linspace(0, 30, 1000)),
+          ([1.0], [1.0, 1.2, 9.0], np.linspace(0, 10, 1000))]
+KS = [0.5, 1.0, 10.0, 40.0]
+
+
+@pytest.mark.parametrize("num, den, t", PLANTS)
+@pytest.mark.parametrize("topology", ["forward", "feedback"])
+def test_matches_control(num, den, t, topology):
+    sweep = gain_sweep(num, den, KS, t, topology=topology)
+    G = ctrl.tf(num, den)
+    for K, y, p in zip(KS, sweep.y, sweep.poles):
+        T = ctrl.feedback(K * G, 1) if topology == "forward" else ctrl.feedback(G, K)
+        _, ref = ctrl.step_response(T, T=t)
+        np.testing.assert_allclose(y, ref, rtol=0, atol=1e-10 * max(1.0, np.abs(ref).max()))
+        np.testing.assert_allclose(np.sort_complex(p), np.sort_complex(ctrl.poles(T)), atol=1e-10)
+
+
+def test_unknown_topology():
+    with pytest.raises(ValueError):
+        closed_loop([1.0], [1.0, 1.0], [1.0], topology="series")
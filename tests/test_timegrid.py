@@ -0,0 +1,52 @@
+"""Grade automática (ltc.timegrid) contra uma grade uniforme fina."""
+
+import numpy as np
+import pytest
+
+from ltc.metrics import settling_index, step_metrics
+from ltc.simulation import step_responses
+from ltc.timegrid import auto_grid, auto_horizon, refine
+
+BAND = (0.982, 1.02)
+# malhas fechadas de atividade_7/exercicio3.py: sem controlador e PI de ZN
+LOOPS = [
+    ([1.0], [1.0, 6.0, 5.0, 1.0]),
+    ([13.5, 5.765277], [1.0, 6.0, 5.0, 13.5, 5.765277]),
+]
+
+
+@pytest.mark.parametrize("num, den", LOOPS)
+def test_final_value_within_tolerance(num, den):
+    tol = 5e-7
+    t = auto_grid(den, tol=tol)
+    y = step_responses(num, den, t)[0]
+    assert t[-1] == pytest.approx(auto_horizon(den, tol=tol))
+    assert abs(y[-1] - 1.0) < tol
+
+
+@pytest.mark.parametrize("num, den", LOOPS)
+def test_refined_metrics_match_fine_grid(num, den):
+    step = 1e-3
+    t = auto_grid(den, tol=5e-7)
+    y = step_responses(num, den, t)[0]
+    i_peak = int(np.argmax(y))
+    i_ts = int(settling_index(y, *BAND))
+    peak = (t[max(i_peak - 1, 0)], t[min(i_peak + 1, t.size - 1)])
+    t = refine(t, [peak, (t[i_ts - 1], t[i_ts])], step)
+    m = step_metrics(step_responses(num, den, t)[0], t, band=BAND, target=1.0)
+
+    # referência: a mesma rede de passo 1 ms em todo o horizonte
+    t_ref = np.arange(int(np.ceil(t[-1] / step)) + 1) * step
+    ref = step_metrics(step_responses(num, den, t_ref)[0], t_ref, band=BAND, target=1.0)
+    assert m["Ts"] == pytest.approx(ref["Ts"], abs=1e-9)
+    assert m["Mp"] == pytest.approx(ref["Mp"], abs=1e-4)
+    assert t.size < t_ref.size / 10
+
+
+def test_refine_uses_a_shared_lattice():
+    t = np.linspace(0.0, 1.0, 11)
+    out = refine(t, [(0.2, 0.3), (0.25, 0.4)], 0.01)
+    assert np.all(np.diff(out) > 0)
+    new = np.setdiff1d(out, t)
+    assert np.allclose(new / 0.01, np.round(new / 0.01))
+    assert new.min() > 0.2 and new.max() < 0.4
@@ -0,0 +1,54 @@
+"""Constantes de erro analíticas e seguimento simulado (atividade_5)."""
+
+import control as ctrl
+import numpy as np
+import pytest
+
+from ltc.tracking import REFERENCES, error_constants, reference_signals, tracking
+
+# tipos 0, 1 (G(s) = 1/(3 s) de atividade_5) e 2; a última malha é instável
+NUM = [[0, 0, 10], [0, 0, 1], [0, 20, 20], [0, 0, 1]]
+DEN = [[0, 1, 6, 5], [0, 0, 3, 0], [1, 10, 0, 0], [1, -1, 0, 0]]
+
+
+def test_error_constants():
+    ec = error_constants(NUM, DEN)
+    assert ec.type.tolist() == [0, 1, 2, 2]
+    np.testing.assert_allclose(ec.Kp[:1], [2.0])
+    assert np.isinf(ec.Kp[1:]).all() and ec.Kv[1] == pytest.approx(1 / 3)
+    assert ec.Ka[2] == pytest.approx(2.0) and ec.Ka[0] == ec.Ka[1] == 0.0
+    assert ec.stable.tolist() == [True, True, True, False]
+    ess = ec.ess
+    np.testing.assert_allclose(ess[:3], [[1 / 3, np.inf, np.inf], [0, 3, np.inf], [0, 0, 0.5]])
+    assert np.isnan(ess[3]).all()
+
+
+def test_tracking_matches_control_and_constants():
+    t = np.linspace(0.0, 60.0, 6001)
+    trk = tracking(NUM[:3], DEN[:3], t, REFERENCES)
+    for i in range(3):
+        T = ctrl.feedback(ctrl.tf(NUM[i], DEN[i]), 1)
+        for j, r in enumerate(trk.r):
+            _, y = ctrl.forced_response(T, t, r)
+            np.testing.assert_allclose(trk.y[i, j], y, rtol=0, atol=1e-9 * max(1.0, np.abs(y).max()))
+    # erro no fim do horizonte ≈ e_ss onde é finito
+    ess = error_constants(NUM[:3], DEN[:3]).ess
+    finite = np.isfinite(ess)
+    np.testing.assert_allclose(trk.final[finite], ess[finite], atol=1e-3)
+
+
+def test_open_loop_step_of_integrator():
+    # atividade_5/parte_1/exercicio_a.py: y(t) = t/3, exato com FOH
+    t = np.linspace(0, 30, 1000)
+    y = tracking([1], [3, 0], t, ["step"], feedback=False).y[0, 0]
+    np.testing.assert_allclose(y, t / 3.0, rtol=0, atol=1e-12)
+
+
+def test_sampled_reference():
+    t = np.linspace(0, 1, 11)
+    r = reference_signals(t, ["ramp", np.sin(t)])
+    np.testing.assert_allclose(r, [t, np.sin(t)])
+    with pytest.raises(ValueError):
+        reference_signals(t, ["degrau"])
+    with pytest.raises(ValueError):
+        reference_signals(t, [t[:-1]])